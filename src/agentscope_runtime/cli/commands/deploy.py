@@ -1006,7 +1006,7 @@ def pai(
                 else:
                     source_dir = os.path.abspath(source_dir)
             # Update with resolved path
-            deploy_config.spec.code.source_dir = source_dir
+            deploy_config = deploy_config.merge_cli(source=source_dir)
 
         # Step 6: Find entrypoint if not specified
         if (
@@ -1016,7 +1016,7 @@ def pai(
             entry_script = _find_entrypoint(
                 deploy_config.spec.code.source_dir,
             )
-            deploy_config.spec.code.entrypoint = entry_script
+            deploy_config = deploy_config.merge_cli(entrypoint=entry_script)
 
         # Step 7: Validate configuration
         try:
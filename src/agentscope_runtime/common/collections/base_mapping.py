@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
+from typing import Any, Dict, List
 
 
 class Mapping(ABC):
@@ -11,6 +12,15 @@ class Mapping(ABC):
     def get(self, key: str) -> dict:
         pass
 
+    def mget(self, keys: List[str]) -> List[Any]:
+        """Get several keys at once; missing keys map to ``None``."""
+        return [self.get(key) for key in keys]
+
+    def mset(self, items: Dict[str, Any]):
+        """Set several keys at once."""
+        for key, value in items.items():
+            self.set(key, value)
+
     @abstractmethod
     def delete(self, key: str):
         pass
@@ -1,22 +1,31 @@
 # -*- coding: utf-8 -*-
 import json
 
-from typing import Any
+from typing import Any, Dict, List
 
 from .base_mapping import Mapping
 
 
 class RedisMapping(Mapping):
-    def __init__(self, redis_client, prefix: str = ""):
+    def __init__(
+        self,
+        redis_client,
+        prefix: str = "",
+        scan_count: int = 1024,
+    ):
         self.client = redis_client
         self.prefix = prefix.rstrip(":") + ":" if prefix else ""
+        self._prefix_len = len(self.prefix)
+        # COUNT hint per SCAN call; Redis defaults to 10, which turns a
+        # large keyspace into thousands of round-trips.
+        self.scan_count = scan_count
 
     def _get_full_key(self, key: str) -> str:
         return f"{self.prefix}{key}"
 
     def _strip_prefix(self, full_key: str) -> str:
         if self.prefix and full_key.startswith(self.prefix):
-            return full_key[len(self.prefix) :]
+            return full_key[self._prefix_len :]
         return full_key
 
     def set(self, key: str, value: Any):
@@ -26,23 +35,40 @@ class RedisMapping(Mapping):
         value = self.client.get(self._get_full_key(key))
         return json.loads(value) if value else None
 
+    def mget(self, keys: List[str]) -> List[Any]:
+        if not keys:
+            return []
+        # One round-trip for the whole batch; a non-transactional pipeline
+        # also works across cluster slots, unlike MGET.
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(self._get_full_key(key))
+        return [
+            json.loads(value) if value else None for value in pipe.execute()
+        ]
+
+    def mset(self, items: Dict[str, Any]):
+        if not items:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._get_full_key(key), json.dumps(value))
+        pipe.execute()
+
     def delete(self, key: str):
         self.client.delete(self._get_full_key(key))
 
     def scan(self, prefix: str = ""):
         search_pattern = f"{self._get_full_key(prefix)}*"
-        cursor = 0
-        while True:
-            cursor, keys = self.client.scan(
-                cursor=cursor,
-                match=search_pattern,
-            )
-            for key in keys:
-                if isinstance(key, bytes):
-                    decoded_key = key.decode("utf-8")
-                else:
-                    decoded_key = str(key)
-                yield self._strip_prefix(decoded_key)
-
-            if cursor == 0:
-                break
+        # Every key matched by the pattern carries self.prefix, so strip it
+        # by length instead of re-checking startswith() per key.
+        prefix_len = self._prefix_len
+        for key in self.client.scan_iter(
+            match=search_pattern,
+            count=self.scan_count,
+        ):
+            if isinstance(key, bytes):
+                decoded_key = key.decode("utf-8")
+            else:
+                decoded_key = str(key)
+            yield decoded_key[prefix_len:]
@@ -452,7 +452,7 @@ class AgentRunDeployManager(DeployManager):
         )
 
         logger.info("Building wheel package from: %s", wrapper_project_dir)
-        wheel_path = build_wheel(wrapper_project_dir)
+        wheel_path = build_wheel(wrapper_project_dir, isolated=False)
         logger.info("Wheel package created: %s", wheel_path)
 
         return wheel_path, name
@@ -2,12 +2,16 @@
 # flake8: noqa: E501
 # pylint: disable=line-too-long, too-many-branches, too-many-statements
 # pylint: disable=protected-access, too-many-nested-blocks
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import shutil
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional, Union, Dict, Tuple, Any, List
 
@@ -34,9 +38,14 @@ from agentscope_runtime.engine.deployers.utils.wheel_packager import (
     default_deploy_name,
     build_wheel,
 )
+from agentscope_runtime.version import __version__
 
 logger = logging.getLogger(__name__)
 
+# Zip packages larger than one part are uploaded as multipart in parallel
+OSS_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+OSS_UPLOAD_PARALLEL_NUM = 8
+
 
 @dataclass
 class LogConfig:
@@ -86,97 +95,16 @@ class FCConfig(BaseModel):
     def from_env(cls) -> "FCConfig":
         """Create FCConfig from environment variables.
 
+        Parsing is memoized on the values of the relevant environment
+        variables, so repeated calls with an unchanged environment only
+        pay for a copy of the cached config.
+
         Returns:
             FCConfig: Configuration loaded from environment variables.
         """
-        # Read region_id
-        region_id = os.environ.get("FC_REGION_ID", "cn-hangzhou")
-
-        # Read log-related environment variables
-        log_store = os.environ.get("FC_LOG_STORE")
-        log_project = os.environ.get("FC_LOG_PROJECT")
-        log_config = None
-        if log_store and log_project:
-            log_config = LogConfig(
-                logstore=log_store,
-                project=log_project,
-            )
-
-        # Read network-related environment variables
-        vpc_id = os.environ.get("FC_VPC_ID")
-        security_group_id = os.environ.get("FC_SECURITY_GROUP_ID")
-        vswitch_ids_str = os.environ.get("FC_VSWITCH_IDS")
-
-        vpc_config = None
-        if vpc_id and security_group_id and vswitch_ids_str:
-            vswitch_ids = json.loads(vswitch_ids_str)
-            if not isinstance(vswitch_ids, list):
-                raise ValueError("vswitch_ids must be a list")
-
-            vpc_config = VPCConfig(
-                vpc_id=vpc_id,
-                security_group_id=security_group_id,
-                vswitch_ids=vswitch_ids,
-            )
-
-        # Read CPU and Memory with type conversion
-        cpu_str = os.environ.get("FC_CPU", "2.0")
-        memory_str = os.environ.get("FC_MEMORY", "2048")
-        disk_str = os.environ.get("FC_DISK", "512")
-
-        session_concurrency_limit_str = os.environ.get(
-            "FC_SESSION_CONCURRENCY_LIMIT",
-            "200",
-        )
-        session_idle_timeout_seconds_str = os.environ.get(
-            "FC_SESSION_IDLE_TIMEOUT_SECONDS",
-            "3600",
-        )
-
-        try:
-            cpu = float(cpu_str)
-        except (ValueError, TypeError):
-            cpu = 2.0
-
-        try:
-            memory = int(memory_str)
-        except (ValueError, TypeError):
-            memory = 2048
-
-        try:
-            disk = int(disk_str)
-        except (ValueError, TypeError):
-            disk = 512
-
-        execution_role_arn = os.environ.get("FC_EXECUTION_ROLE_ARN")
-
-        try:
-            session_concurrency_limit = int(session_concurrency_limit_str)
-        except (ValueError, TypeError):
-            session_concurrency_limit = 200
-
-        try:
-            session_idle_timeout_seconds = int(
-                session_idle_timeout_seconds_str,
-            )
-        except (ValueError, TypeError):
-            session_idle_timeout_seconds = 3600
-
-        return cls(
-            access_key_id=os.environ.get("ALIBABA_CLOUD_ACCESS_KEY_ID"),
-            access_key_secret=os.environ.get(
-                "ALIBABA_CLOUD_ACCESS_KEY_SECRET",
-            ),
-            account_id=os.environ.get("FC_ACCOUNT_ID"),
-            region_id=region_id,
-            log_config=log_config,
-            vpc_config=vpc_config,
-            cpu=cpu,
-            memory=memory,
-            disk=disk,
-            execution_role_arn=execution_role_arn,
-            session_concurrency_limit=session_concurrency_limit,
-            session_idle_timeout_seconds=session_idle_timeout_seconds,
+        env_values = tuple(os.environ.get(key) for key in _FC_ENV_KEYS)
+        return _fc_config_from_env_values(cls, env_values).model_copy(
+            deep=True,
         )
 
     def ensure_valid(self) -> None:
@@ -198,6 +126,147 @@ class FCConfig(BaseModel):
             )
 
 
+_FC_ENV_KEYS = (
+    "ALIBABA_CLOUD_ACCESS_KEY_ID",
+    "ALIBABA_CLOUD_ACCESS_KEY_SECRET",
+    "FC_ACCOUNT_ID",
+    "FC_REGION_ID",
+    "FC_LOG_STORE",
+    "FC_LOG_PROJECT",
+    "FC_VPC_ID",
+    "FC_SECURITY_GROUP_ID",
+    "FC_VSWITCH_IDS",
+    "FC_CPU",
+    "FC_MEMORY",
+    "FC_DISK",
+    "FC_EXECUTION_ROLE_ARN",
+    "FC_SESSION_CONCURRENCY_LIMIT",
+    "FC_SESSION_IDLE_TIMEOUT_SECONDS",
+)
+
+_OSS_ENV_KEYS = (
+    "OSS_REGION",
+    "OSS_ACCESS_KEY_ID",
+    "OSS_ACCESS_KEY_SECRET",
+    "OSS_BUCKET_NAME",
+    "ALIBABA_CLOUD_ACCESS_KEY_ID",
+    "ALIBABA_CLOUD_ACCESS_KEY_SECRET",
+)
+
+
+@lru_cache(maxsize=8)
+def _fc_config_from_env_values(
+    cls: type,
+    env_values: Tuple[Optional[str], ...],
+) -> "FCConfig":
+    """Build an FCConfig from a snapshot of ``_FC_ENV_KEYS`` values."""
+    env = {k: v for k, v in zip(_FC_ENV_KEYS, env_values) if v is not None}
+
+    # Read region_id
+    region_id = env.get("FC_REGION_ID", "cn-hangzhou")
+
+    # Read log-related environment variables
+    log_store = env.get("FC_LOG_STORE")
+    log_project = env.get("FC_LOG_PROJECT")
+    log_config = None
+    if log_store and log_project:
+        log_config = LogConfig(
+            logstore=log_store,
+            project=log_project,
+        )
+
+    # Read network-related environment variables
+    vpc_id = env.get("FC_VPC_ID")
+    security_group_id = env.get("FC_SECURITY_GROUP_ID")
+    vswitch_ids_str = env.get("FC_VSWITCH_IDS")
+
+    vpc_config = None
+    if vpc_id and security_group_id and vswitch_ids_str:
+        try:
+            vswitch_ids = json.loads(vswitch_ids_str)
+        except json.JSONDecodeError:
+            # Also accept the plain comma-separated form "vsw-1,vsw-2"
+            vswitch_ids = [
+                item.strip()
+                for item in vswitch_ids_str.split(",")
+                if item.strip()
+            ]
+        if not isinstance(vswitch_ids, list):
+            raise ValueError("vswitch_ids must be a list")
+
+        vpc_config = VPCConfig(
+            vpc_id=vpc_id,
+            security_group_id=security_group_id,
+            vswitch_ids=vswitch_ids,
+        )
+
+    # Read CPU and Memory with type conversion
+    try:
+        cpu = float(env.get("FC_CPU", "2.0"))
+    except (ValueError, TypeError):
+        cpu = 2.0
+
+    try:
+        memory = int(env.get("FC_MEMORY", "2048"))
+    except (ValueError, TypeError):
+        memory = 2048
+
+    try:
+        disk = int(env.get("FC_DISK", "512"))
+    except (ValueError, TypeError):
+        disk = 512
+
+    try:
+        session_concurrency_limit = int(
+            env.get("FC_SESSION_CONCURRENCY_LIMIT", "200"),
+        )
+    except (ValueError, TypeError):
+        session_concurrency_limit = 200
+
+    try:
+        session_idle_timeout_seconds = int(
+            env.get("FC_SESSION_IDLE_TIMEOUT_SECONDS", "3600"),
+        )
+    except (ValueError, TypeError):
+        session_idle_timeout_seconds = 3600
+
+    return cls(
+        access_key_id=env.get("ALIBABA_CLOUD_ACCESS_KEY_ID"),
+        access_key_secret=env.get("ALIBABA_CLOUD_ACCESS_KEY_SECRET"),
+        account_id=env.get("FC_ACCOUNT_ID"),
+        region_id=region_id,
+        log_config=log_config,
+        vpc_config=vpc_config,
+        cpu=cpu,
+        memory=memory,
+        disk=disk,
+        execution_role_arn=env.get("FC_EXECUTION_ROLE_ARN"),
+        session_concurrency_limit=session_concurrency_limit,
+        session_idle_timeout_seconds=session_idle_timeout_seconds,
+    )
+
+
+@lru_cache(maxsize=8)
+def _oss_config_from_env_values(
+    cls: type,
+    env_values: Tuple[Optional[str], ...],
+) -> "OSSConfig":
+    """Build an OSSConfig from a snapshot of ``_OSS_ENV_KEYS`` values."""
+    env = {k: v for k, v in zip(_OSS_ENV_KEYS, env_values) if v is not None}
+    return cls(
+        region=env.get("OSS_REGION", "cn-hangzhou"),
+        access_key_id=env.get(
+            "OSS_ACCESS_KEY_ID",
+            env.get("ALIBABA_CLOUD_ACCESS_KEY_ID"),
+        ),
+        access_key_secret=env.get(
+            "OSS_ACCESS_KEY_SECRET",
+            env.get("ALIBABA_CLOUD_ACCESS_KEY_SECRET"),
+        ),
+        bucket_name=env.get("OSS_BUCKET_NAME"),
+    )
+
+
 class OSSConfig(BaseModel):
     region: str = Field("cn-hangzhou", description="OSS region")
     access_key_id: Optional[str] = None
@@ -208,20 +277,15 @@ class OSSConfig(BaseModel):
     def from_env(cls) -> "OSSConfig":
         """Create OSSConfig from environment variables.
 
+        Parsing is memoized on the values of the relevant environment
+        variables, see :meth:`FCConfig.from_env`.
+
         Returns:
             OSSConfig: Configuration loaded from environment variables.
         """
-        return cls(
-            region=os.environ.get("OSS_REGION", "cn-hangzhou"),
-            access_key_id=os.environ.get(
-                "OSS_ACCESS_KEY_ID",
-                os.environ.get("ALIBABA_CLOUD_ACCESS_KEY_ID"),
-            ),
-            access_key_secret=os.environ.get(
-                "OSS_ACCESS_KEY_SECRET",
-                os.environ.get("ALIBABA_CLOUD_ACCESS_KEY_SECRET"),
-            ),
-            bucket_name=os.environ.get("OSS_BUCKET_NAME"),
+        env_values = tuple(os.environ.get(key) for key in _OSS_ENV_KEYS)
+        return _oss_config_from_env_values(cls, env_values).model_copy(
+            deep=True,
         )
 
     def ensure_valid(self) -> None:
@@ -243,6 +307,73 @@ class OSSConfig(BaseModel):
             )
 
 
+# Entries never shipped in the wrapper wheel, see generate_wrapper_project
+_DIGEST_IGNORED_NAMES = frozenset(
+    {
+        ".git",
+        ".venv",
+        ".venv_build",
+        ".agentdev_builds",
+        ".agentscope_runtime_builds",
+        "__pycache__",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".pytest_cache",
+    },
+)
+
+
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# Number of digests kept under ``build_root/.artifact_cache``
+_ARTIFACT_CACHE_MAX_ENTRIES = 8
+
+
+def _project_digest(project_dir: Path, cmd: str, deploy_name: str) -> str:
+    """Content digest of everything that determines the FC build output.
+
+    The deploy name is part of the digest, so the artifact cache only hits
+    when ``deploy_name`` is passed explicitly: ``default_deploy_name()``
+    embeds a fresh uuid on every call. Files are read in chunks; callers
+    on the event loop should run this in a worker thread.
+
+    Args:
+        project_dir: Resolved user project directory.
+        cmd: Command used to start the application.
+        deploy_name: Deployment name baked into the wrapper config.
+
+    Returns:
+        32-character hex digest.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in (
+        cmd,
+        deploy_name,
+        __version__,
+        os.getenv("USE_LOCAL_RUNTIME", "False"),
+    ):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = sorted(d for d in dirs if d not in _DIGEST_IGNORED_NAMES)
+        for filename in sorted(files):
+            if filename.endswith(".pyc"):
+                continue
+            file_path = Path(root) / filename
+            hasher.update(
+                file_path.relative_to(project_dir).as_posix().encode(),
+            )
+            hasher.update(b"\0")
+            with open(file_path, "rb") as f:
+                while chunk := f.read(_DIGEST_CHUNK_SIZE):
+                    hasher.update(chunk)
+            hasher.update(b"\0")
+
+    return hasher.hexdigest()
+
+
 class FCDeployManager(DeployManager):
     # Fixed trigger name for HTTP trigger
     HTTP_TRIGGER_NAME = "agentscope-runtime-trigger"
@@ -270,7 +401,11 @@ class FCDeployManager(DeployManager):
             if build_root
             else Path(os.getcwd()).parent / ".agentscope_runtime_builds"
         )
-        self.client = self._create_fc_client()
+
+    @cached_property
+    def client(self) -> FC20230330Client:
+        """Function Compute client, created on first use."""
+        return self._create_fc_client()
 
     def _create_fc_client(self):
         """Create and configure the Function Compute client.
@@ -286,6 +421,87 @@ class FCDeployManager(DeployManager):
         )
         return FC20230330Client(fc_config)
 
+    @property
+    def _artifact_cache_dir(self) -> Path:
+        return Path(self.build_root) / ".artifact_cache"
+
+    def _lookup_cached_artifacts(
+        self,
+        digest: str,
+    ) -> Optional[Tuple[Path, Path]]:
+        """Find the wheel and zip previously built for a project digest.
+
+        Args:
+            digest: Digest returned by ``_project_digest``.
+
+        Returns:
+            Tuple of (wheel_path, zip_file_path), or None on cache miss.
+        """
+        entry_dir = self._artifact_cache_dir / digest
+        if not entry_dir.is_dir():
+            return None
+
+        wheels = list(entry_dir.glob("*.whl"))
+        zips = list(entry_dir.glob("*.zip"))
+        if len(wheels) != 1 or len(zips) != 1:
+            return None
+        if zips[0].stat().st_size == 0:
+            return None
+
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        logger.info("Build artifact cache hit: %s", digest)
+        return wheels[0], zips[0]
+
+    def _store_cached_artifacts(
+        self,
+        digest: str,
+        wheel_path: Path,
+        zip_file_path: Path,
+    ) -> None:
+        """Store the wheel and zip built for a project digest.
+
+        Only the ``_ARTIFACT_CACHE_MAX_ENTRIES`` most recently used entries
+        are kept. Failures are logged and ignored, the cache is an
+        optimization only.
+        """
+        entry_dir = self._artifact_cache_dir / digest
+        tmp_dir = self._artifact_cache_dir / f"{digest}.tmp"
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True)
+            shutil.copy2(wheel_path, tmp_dir / wheel_path.name)
+            shutil.copy2(zip_file_path, tmp_dir / zip_file_path.name)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+            logger.info("Build artifacts cached: %s", digest)
+        except Exception as e:
+            logger.warning("Failed to cache build artifacts: %s", e)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self._evict_cached_artifacts()
+
+    def _evict_cached_artifacts(self) -> None:
+        """Remove the least recently used cache entries over the limit."""
+        try:
+            entries = [
+                entry
+                for entry in self._artifact_cache_dir.iterdir()
+                if entry.is_dir() and not entry.name.endswith(".tmp")
+            ]
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+        except OSError as e:
+            logger.warning("Failed to list build artifact cache: %s", e)
+            return
+
+        for entry in entries[:-_ARTIFACT_CACHE_MAX_ENTRIES]:
+            shutil.rmtree(entry, ignore_errors=True)
+            logger.info("Build artifacts evicted: %s", entry.name)
+
     async def _generate_wrapper_and_build_wheel(
         self,
         project_dir: Union[Optional[str], Path],
@@ -347,7 +563,7 @@ class FCDeployManager(DeployManager):
         )
 
         logger.info("Building wheel package from: %s", wrapper_project_dir)
-        wheel_path = build_wheel(wrapper_project_dir)
+        wheel_path = build_wheel(wrapper_project_dir, isolated=False)
         logger.info("Wheel package created: %s", wheel_path)
 
         return wheel_path, name
@@ -382,30 +598,29 @@ class FCDeployManager(DeployManager):
 
         env_file_path = project_path / env_filename
 
-        try:
-            with env_file_path.open("w", encoding="utf-8") as f:
-                f.write("# Environment variables used by AgentScope Runtime\n")
-
-                for key, value in environment.items():
-                    # Skip None values
-                    if value is None:
-                        continue
-
-                    # Quote values that contain spaces or special characters
-                    if " " in str(value) or any(
-                        char in str(value)
-                        for char in ["$", "`", '"', "'", "\\"]
-                    ):
-                        # Escape existing quotes and wrap in double quotes
-                        escaped_value = (
-                            str(value)
-                            .replace("\\", "\\\\")
-                            .replace('"', '\\"')
-                        )
-                        f.write(f'{key}="{escaped_value}"\n')
-                    else:
-                        f.write(f"{key}={value}\n")
+        lines = ["# Environment variables used by AgentScope Runtime\n"]
+        for key, value in environment.items():
+            # Skip None values
+            if value is None:
+                continue
+
+            # Quote values that contain spaces or special characters
+            value = str(value)
+            if " " in value or any(
+                char in value for char in ["$", "`", '"', "'", "\\"]
+            ):
+                # Escape existing quotes and wrap in double quotes
+                escaped_value = value.replace("\\", "\\\\").replace(
+                    '"',
+                    '\\"',
+                )
+                lines.append(f'{key}="{escaped_value}"\n')
+            else:
+                lines.append(f"{key}={value}\n")
 
+        try:
+            # Render the whole file up front and write it in one call
+            env_file_path.write_bytes("".join(lines).encode("utf-8"))
             logger.info("Environment file created: %s", env_file_path)
             return env_file_path
 
@@ -465,8 +680,31 @@ class FCDeployManager(DeployManager):
                 cmd = f"python {entry_script}"
                 deploy_name = deploy_name or default_deploy_name()
 
+            # Reuse previously built artifacts for unchanged projects
+            artifact_digest = None
+            cached_zip_path = None
+            if (
+                not external_whl_path
+                and deploy_name
+                and cmd
+                and project_dir
+                and Path(project_dir).is_dir()
+            ):
+                artifact_digest = await asyncio.to_thread(
+                    _project_digest,
+                    Path(project_dir).resolve(),
+                    cmd,
+                    deploy_name,
+                )
+                cached = self._lookup_cached_artifacts(artifact_digest)
+                if cached:
+                    wheel_path, cached_zip_path = cached
+                    name = deploy_name
+
             # Use external wheel if provided, skip project packaging
-            if external_whl_path:
+            if cached_zip_path is not None:
+                logger.info("Reusing cached build artifacts: %s", wheel_path)
+            elif external_whl_path:
                 wheel_path = Path(external_whl_path).resolve()
                 if not wheel_path.is_file():
                     raise FileNotFoundError(
@@ -495,17 +733,47 @@ class FCDeployManager(DeployManager):
 
             timestamp = time.strftime("%Y%m%d%H%M%S")
 
-            # Step 1: Build and package in Docker container
+            # Step 1: Build and package in Docker container. Unless the
+            # upload is skipped, prepare the OSS bucket concurrently since
+            # it does not depend on the build output.
             logger.info(
                 "Building dependencies and creating zip package in Docker",
             )
-            zip_file_path = await self._build_and_zip_in_docker(
-                wheel_path=wheel_path,
-                output_dir=wheel_path.parent,
-                zip_filename=f"{name or function_name}-{timestamp}.zip",
-            )
+            if cached_zip_path is not None:
+                build_coro = asyncio.sleep(0, result=cached_zip_path)
+            else:
+                build_coro = self._build_and_zip_in_docker(
+                    wheel_path=wheel_path,
+                    output_dir=wheel_path.parent,
+                    zip_filename=f"{name or function_name}-{timestamp}.zip",
+                )
+            oss_client = None
+            if skip_upload:
+                zip_file_path = await build_coro
+            else:
+                tasks = (
+                    asyncio.ensure_future(build_coro),
+                    asyncio.ensure_future(
+                        self._prepare_oss_bucket(self.oss_config.bucket_name),
+                    ),
+                )
+                try:
+                    zip_file_path, oss_client = await asyncio.gather(*tasks)
+                except BaseException:
+                    # Do not leave the other step running in the background
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
             logger.info("Zip package created: %s", zip_file_path)
 
+            if artifact_digest and cached_zip_path is None:
+                self._store_cached_artifacts(
+                    artifact_digest,
+                    wheel_path,
+                    zip_file_path,
+                )
+
             if skip_upload:
                 logger.info(
                     "Deployment completed (skipped upload to FC)",
@@ -520,6 +788,7 @@ class FCDeployManager(DeployManager):
             oss_result = await self._upload_to_fixed_oss_bucket(
                 zip_file_path=zip_file_path,
                 bucket_name=self.oss_config.bucket_name,
+                oss_client=oss_client,
             )
             logger.info("Zip package uploaded to OSS successfully")
 
@@ -1115,8 +1384,9 @@ class FCDeployManager(DeployManager):
 
             # Build script that runs in container:
             # 1. Install wheel and dependencies to /tmp/python
-            # 2. Use Python's zipfile module to create zip
-            # 3. Save zip to /output
+            # 2. Use Python's zipfile module to create zip on the container's
+            #    local disk, avoiding many small writes to the bind mount
+            # 3. Move the finished zip to /output in a single copy
             build_script = f"""
 set -e
 echo "=== Installing dependencies to /tmp/python ==="
@@ -1129,7 +1399,7 @@ import zipfile
 from pathlib import Path
 
 python_dir = Path("/tmp/python")
-zip_path = Path("/output/{zip_filename}")
+zip_path = Path("/tmp/{zip_filename}")
 
 print(f"Creating zip from {{python_dir}}")
 with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
@@ -1143,6 +1413,8 @@ zip_size_mb = zip_path.stat().st_size / (1024 * 1024)
 print(f"Created zip ({{zip_size_mb:.2f}} MB): {{zip_path}}")
 PYTHON_EOF
 
+mv /tmp/{zip_filename} /output/{zip_filename}
+
 echo "=== Build complete ==="
 ls -lh /output/{zip_filename}
 """
@@ -1167,7 +1439,10 @@ ls -lh /output/{zip_filename}
             logger.info("Executing Docker build command")
             logger.debug("Build script:\n%s", build_script)
 
-            result = subprocess.run(
+            # Run in a worker thread so that independent work (e.g. OSS
+            # bucket preparation) can proceed while the build is running
+            result = await asyncio.to_thread(
+                subprocess.run,
                 cmd,
                 capture_output=True,
                 text=True,
@@ -1212,38 +1487,17 @@ ls -lh /output/{zip_filename}
             logger.error("Error during Docker build: %s", str(e))
             raise
 
-    async def _upload_to_fixed_oss_bucket(
-        self,
-        zip_file_path: Path,
-        bucket_name: str,
-    ) -> Dict[str, str]:
-        """Upload zip file to a fixed OSS bucket.
-
-        Args:
-            zip_file_path: Path to the zip file to upload.
-            bucket_name: Target OSS bucket name (e.g., "tmp-agentscope-fc-code").
+    def _create_oss_client(self):
+        """Create the OSS client used for artifact uploads.
 
         Returns:
-            Dictionary containing:
-                - bucket_name: OSS bucket name
-                - object_key: Object key in OSS
-                - presigned_url: Presigned URL for downloading (valid for 3 hours)
+            alibabacloud_oss_v2.Client: Configured OSS client instance.
 
         Raises:
-            RuntimeError: If OSS SDK is not installed or upload fails.
+            RuntimeError: If OSS SDK is not installed.
         """
         try:
             from alibabacloud_oss_v2 import Client as OSSClient
-            from alibabacloud_oss_v2.models import (
-                PutObjectRequest,
-                GetObjectRequest,
-                PutBucketRequest,
-                CreateBucketConfiguration,
-                PutBucketTagsRequest,
-                Tagging,
-                TagSet,
-                Tag,
-            )
             from alibabacloud_oss_v2 import config as oss_config
             from alibabacloud_oss_v2.credentials import (
                 StaticCredentialsProvider,
@@ -1256,7 +1510,6 @@ ls -lh /output/{zip_filename}
                 "OSS SDK not installed. Run: pip install alibabacloud-oss-v2",
             ) from e
 
-        # Create OSS client
         logger.info("Initializing OSS client")
 
         credentials_provider = StaticCredentialsProvider(
@@ -1268,76 +1521,145 @@ ls -lh /output/{zip_filename}
             credentials_provider=credentials_provider,
             region=self.oss_config.region,
         )
-        oss_client = OSSClient(cfg)
+        return OSSClient(cfg)
+
+    def _ensure_oss_bucket(self, oss_client, bucket_name: str) -> None:
+        """Create the OSS bucket (tagged for FC access) if it is missing.
+
+        Args:
+            oss_client: OSS client created by :meth:`_create_oss_client`.
+            bucket_name: Target OSS bucket name.
+        """
+        from alibabacloud_oss_v2.models import (
+            PutBucketRequest,
+            CreateBucketConfiguration,
+            PutBucketTagsRequest,
+            Tagging,
+            TagSet,
+            Tag,
+        )
 
         logger.info("Using OSS bucket: %s", bucket_name)
 
-        # Create bucket if not exists
         try:
             bucket_exists = oss_client.is_bucket_exist(bucket=bucket_name)
         except Exception:
             bucket_exists = False
 
-        if not bucket_exists:
-            logger.info("OSS bucket does not exist, creating: %s", bucket_name)
-            try:
-                put_bucket_req = PutBucketRequest(
-                    bucket=bucket_name,
-                    acl="private",
-                    create_bucket_configuration=CreateBucketConfiguration(
-                        storage_class="IA",
-                    ),
-                )
-                put_bucket_result = oss_client.put_bucket(put_bucket_req)
-                logger.info(
-                    "OSS bucket created (Status: %s, Request ID: %s)",
-                    put_bucket_result.status_code,
-                    put_bucket_result.request_id,
-                )
+        if bucket_exists:
+            logger.debug("OSS bucket already exists: %s", bucket_name)
+            return
+
+        logger.info("OSS bucket does not exist, creating: %s", bucket_name)
+        try:
+            put_bucket_req = PutBucketRequest(
+                bucket=bucket_name,
+                acl="private",
+                create_bucket_configuration=CreateBucketConfiguration(
+                    storage_class="IA",
+                ),
+            )
+            put_bucket_result = oss_client.put_bucket(put_bucket_req)
+            logger.info(
+                "OSS bucket created (Status: %s, Request ID: %s)",
+                put_bucket_result.status_code,
+                put_bucket_result.request_id,
+            )
 
-                # Add tag for fc access permission
-                tag_result = oss_client.put_bucket_tags(
-                    PutBucketTagsRequest(
-                        bucket=bucket_name,
-                        tagging=Tagging(
-                            tag_set=TagSet(
-                                tags=[
-                                    Tag(
-                                        key="fc-deploy-access",
-                                        value="ReadAndAdd",
-                                    ),
-                                ],
-                            ),
+            # Add tag for fc access permission
+            tag_result = oss_client.put_bucket_tags(
+                PutBucketTagsRequest(
+                    bucket=bucket_name,
+                    tagging=Tagging(
+                        tag_set=TagSet(
+                            tags=[
+                                Tag(
+                                    key="fc-deploy-access",
+                                    value="ReadAndAdd",
+                                ),
+                            ],
                         ),
                     ),
-                )
-                logger.info(
-                    "OSS bucket tags configured (Status: %s)",
-                    tag_result.status_code,
-                )
-            except Exception as e:
-                logger.error("Failed to create OSS bucket: %s", str(e))
-                raise
-        else:
-            logger.debug("OSS bucket already exists: %s", bucket_name)
+                ),
+            )
+            logger.info(
+                "OSS bucket tags configured (Status: %s)",
+                tag_result.status_code,
+            )
+        except Exception as e:
+            logger.error("Failed to create OSS bucket: %s", str(e))
+            raise
+
+    async def _prepare_oss_bucket(self, bucket_name: str):
+        """Create the OSS client and make sure the target bucket exists.
+
+        The blocking SDK calls run in a worker thread so this can overlap
+        with the Docker build in :meth:`deploy`.
+
+        Args:
+            bucket_name: Target OSS bucket name.
+
+        Returns:
+            alibabacloud_oss_v2.Client: OSS client ready for uploads.
+        """
+
+        def _prepare():
+            oss_client = self._create_oss_client()
+            self._ensure_oss_bucket(oss_client, bucket_name)
+            return oss_client
+
+        return await asyncio.to_thread(_prepare)
+
+    async def _upload_to_fixed_oss_bucket(
+        self,
+        zip_file_path: Path,
+        bucket_name: str,
+        oss_client=None,
+    ) -> Dict[str, str]:
+        """Upload zip file to a fixed OSS bucket.
+
+        Args:
+            zip_file_path: Path to the zip file to upload.
+            bucket_name: Target OSS bucket name (e.g., "tmp-agentscope-fc-code").
+            oss_client: Client returned by :meth:`_prepare_oss_bucket`. If
+                None, the bucket is prepared before uploading.
+
+        Returns:
+            Dictionary containing:
+                - bucket_name: OSS bucket name
+                - object_key: Object key in OSS
+                - presigned_url: Presigned URL for downloading (valid for 3 hours)
+
+        Raises:
+            RuntimeError: If OSS SDK is not installed or upload fails.
+        """
+        if oss_client is None:
+            oss_client = await self._prepare_oss_bucket(bucket_name)
+
+        from alibabacloud_oss_v2.models import (
+            PutObjectRequest,
+            GetObjectRequest,
+        )
 
         # Upload zip file
         object_key = zip_file_path.name
         logger.info("Uploading to OSS: %s", object_key)
 
         try:
-            with open(zip_file_path, "rb") as f:
-                file_bytes = f.read()
-
-            put_obj_req = PutObjectRequest(
-                bucket=bucket_name,
-                key=object_key,
-                body=file_bytes,
+            # The uploader streams the file from disk and switches to a
+            # multipart upload with parallel parts for large packages
+            uploader = oss_client.uploader(
+                part_size=OSS_UPLOAD_PART_SIZE,
+                parallel_num=OSS_UPLOAD_PARALLEL_NUM,
+            )
+            upload_result = await asyncio.to_thread(
+                uploader.upload_file,
+                PutObjectRequest(bucket=bucket_name, key=object_key),
+                filepath=str(zip_file_path),
             )
-            put_obj_result = oss_client.put_object(put_obj_req)
             logger.info(
                 "File uploaded to OSS successfully (Status: %s)",
-                put_obj_result.status_code,
+                upload_result.status_code,
             )
         except Exception as e:
             logger.error("Failed to upload file to OSS: %s", str(e))
@@ -614,7 +614,7 @@ class ModelstudioDeployManager(DeployManager):
         user_bundle_app_dir = get_user_bundle_appdir(build_dir, project_dir)
         self._generate_env_file(user_bundle_app_dir, environment)
         logger.info("Building wheel under %s", wrapper_project_dir)
-        wheel_path = build_wheel(wrapper_project_dir)
+        wheel_path = build_wheel(wrapper_project_dir, isolated=False)
 
         return wheel_path, name
 
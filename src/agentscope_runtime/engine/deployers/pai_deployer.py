@@ -6,18 +6,36 @@
 # flake8: noqa: E501
 import asyncio
 import fnmatch
-import glob
+import hashlib
 import json
 import logging
 import os
 import posixpath
+import re
+import shutil
+import stat
 import time
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List, Union, Any, Literal, cast
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -57,6 +75,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _yaml_safe_loader() -> type:
+    """
+    Import PyYAML on first use and return its fastest safe loader.
+
+    PyYAML is only needed for config files, so it is kept out of module
+    import. The libyaml-backed loader is preferred when available.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class LangStudioClient:
     """
     A lightweight PAI LangStudio API client .
@@ -597,6 +628,25 @@ class LangStudioClient:
 class ConfigBaseModel(BaseModel):
     model_config = ConfigDict(extra="allow")
 
+    def _with_overrides(self, **overrides: Any) -> "ConfigBaseModel":
+        """
+        Return a validated copy with the given non-None fields replaced.
+
+        Unchanged nested models are shared with ``self`` rather than
+        re-dumped, and ``self`` is returned as-is when nothing changes.
+        """
+        overrides = {
+            key: value
+            for key, value in overrides.items()
+            if value is not None and value is not getattr(self, key, None)
+        }
+        if not overrides:
+            return self
+        data = {name: getattr(self, name) for name in type(self).model_fields}
+        return self.model_validate(
+            {**data, **(self.model_extra or {}), **overrides},
+        )
+
 
 class PAICodeConfig(ConfigBaseModel):
     """Code configuration for PAI deployment."""
@@ -737,8 +787,10 @@ class PAIDeployConfig(ConfigBaseModel):
     @classmethod
     def from_yaml(cls, path: Union[str, Path]) -> "PAIDeployConfig":
         """Load configuration from YAML file."""
+        import yaml  # pylint: disable=import-outside-toplevel
+
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_yaml_safe_loader()) or {}
         return cls.model_validate(data)
 
     @classmethod
@@ -776,79 +828,57 @@ class PAIDeployConfig(ConfigBaseModel):
         """
         Merge CLI parameters into config. CLI values override config values.
 
-        Returns a new PAIDeployConfig with merged values.
+        Returns a new PAIDeployConfig with merged values. Sections that are
+        not overridden are shared with ``self``, so change the result
+        through another ``merge_cli`` call rather than in place.
         """
-        data = self.model_dump()
-
-        # Context overrides
-        if workspace_id is not None:
-            data["context"]["workspace_id"] = workspace_id
-        if region is not None:
-            data["context"]["region"] = region
-
-        # Spec overrides
-        if name is not None:
-            data["spec"]["name"] = name
-        if source is not None:
-            data["spec"]["code"]["source_dir"] = source
-        if entrypoint is not None:
-            data["spec"]["code"]["entrypoint"] = entrypoint
-        if service_group is not None:
-            data["spec"]["service_group_name"] = service_group
-
-        # Resources overrides
-        if resource_type is not None:
-            data["spec"]["resources"]["type"] = resource_type
-        if instance_type is not None:
-            data["spec"]["resources"]["instance_type"] = instance_type
-        if instance_count is not None:
-            data["spec"]["resources"]["instance_count"] = instance_count
-        if resource_id is not None:
-            data["spec"]["resources"]["resource_id"] = resource_id
-        if quota_id is not None:
-            data["spec"]["resources"]["quota_id"] = quota_id
-        if cpu is not None:
-            data["spec"]["resources"]["cpu"] = cpu
-        if memory is not None:
-            data["spec"]["resources"]["memory"] = memory
-
-        # VPC overrides
-        if vpc_id is not None:
-            data["spec"]["vpc_config"]["vpc_id"] = vpc_id
-        if vswitch_id is not None:
-            data["spec"]["vpc_config"]["vswitch_id"] = vswitch_id
-        if security_group_id is not None:
-            data["spec"]["vpc_config"]["security_group_id"] = security_group_id
-
-        # IAM overrides
-        if ram_role_arn is not None:
-            data["spec"]["identity"]["ram_role_arn"] = ram_role_arn
-
-        # Observability overrides
-        if enable_trace is not None:
-            data["spec"]["observability"]["enable_trace"] = enable_trace
-
-        # Storage overrides
-        if oss_path is not None:
-            data["spec"]["storage"]["work_dir"] = oss_path
-
-        # Environment overrides (merge, CLI takes precedence)
-        if environment:
-            data["spec"]["env"].update(environment)
-
-        # Tags overrides (merge, CLI takes precedence)
-        if tags:
-            data["spec"]["tags"].update(tags)
-
-        # Deployment behavior overrides
-        if wait is not None:
-            data["wait"] = wait
-        if timeout is not None:
-            data["timeout"] = timeout
-        if auto_approve is not None:
-            data["auto_approve"] = auto_approve
+        spec = self.spec
+        resources = spec.resources._with_overrides(
+            type=resource_type,
+            instance_type=instance_type,
+            instance_count=instance_count,
+            resource_id=resource_id,
+            quota_id=quota_id,
+            cpu=cpu,
+            memory=memory,
+        )
+        spec = spec._with_overrides(
+            name=name,
+            service_group_name=service_group,
+            code=spec.code._with_overrides(
+                source_dir=source,
+                entrypoint=entrypoint,
+            ),
+            resources=resources,
+            vpc_config=spec.vpc_config._with_overrides(
+                vpc_id=vpc_id,
+                vswitch_id=vswitch_id,
+                security_group_id=security_group_id,
+            ),
+            identity=spec.identity._with_overrides(ram_role_arn=ram_role_arn),
+            observability=spec.observability._with_overrides(
+                enable_trace=enable_trace,
+            ),
+            storage=spec.storage._with_overrides(work_dir=oss_path),
+            # Environment and tags merge, CLI takes precedence
+            env={**spec.env, **environment} if environment else None,
+            tags={**spec.tags, **tags} if tags else None,
+        )
+        context = self.context._with_overrides(
+            workspace_id=workspace_id,
+            region=region,
+        )
 
-        return PAIDeployConfig.model_validate(data)
+        merged = self._with_overrides(
+            context=context,
+            spec=spec,
+            wait=wait,
+            timeout=timeout,
+            auto_approve=auto_approve,
+        )
+        if merged is self:
+            merged = self.model_copy()
+        return merged
 
     def resolve_resource_type(self) -> str:
         """
@@ -957,13 +987,20 @@ class PAIDeployConfig(ConfigBaseModel):
                 "(spec.code.source_dir or SOURCE argument)",
             )
 
-        # Validate source_dir exists
+        # Validate source_dir exists and is a directory with a single stat
         if self.spec.code.source_dir:
-            source_path = Path(self.spec.code.source_dir)
-            if not source_path.exists():
+            try:
+                source_stat = os.stat(self.spec.code.source_dir)
+            except OSError:
                 errors.append(
                     f"Source directory not found: {self.spec.code.source_dir}",
                 )
+            else:
+                if not stat.S_ISDIR(source_stat.st_mode):
+                    errors.append(
+                        "Source path is not a directory: "
+                        f"{self.spec.code.source_dir}",
+                    )
 
         # Resource type specific validation
         resource_type = self.resolve_resource_type()
@@ -981,6 +1018,28 @@ class PAIDeployConfig(ConfigBaseModel):
             )
 
 
+@lru_cache(maxsize=32)
+def _load_ignore_file(  # pylint: disable=unused-argument
+    ignore_file_path: str,
+    mtime_ns: int,
+    size: int,
+) -> Tuple[str, ...]:
+    """
+    Parse an ignore file, cached on its path, mtime and size.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so editing
+    the file invalidates the cached entry.
+    """
+    patterns = []
+    with open(ignore_file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            # Skip empty lines and comments
+            if line and not line.startswith("#"):
+                patterns.append(line)
+    return tuple(patterns)
+
+
 def _read_ignore_file(ignore_file_path: Path) -> List[str]:
     """
     Read patterns from .gitignore or .dockerignore file.
@@ -991,49 +1050,276 @@ def _read_ignore_file(ignore_file_path: Path) -> List[str]:
     Returns:
         List of ignore patterns
     """
-    patterns = []
-    if ignore_file_path.exists():
-        with open(ignore_file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-    return patterns
+    try:
+        ignore_stat = os.stat(ignore_file_path)
+    except FileNotFoundError:
+        return []
+    return list(
+        _load_ignore_file(
+            str(ignore_file_path),
+            ignore_stat.st_mtime_ns,
+            ignore_stat.st_size,
+        ),
+    )
+
+
+_DEFAULT_IGNORE_PATTERNS = (
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    "*.pyd",
+    ".git",
+    ".gitignore",
+    ".dockerignore",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".tox",
+    "venv",
+    "env",
+    ".venv",
+    "virtualenv",
+    "node_modules",
+    ".DS_Store",
+    "*.egg-info",
+    "build",
+    "dist",
+    ".cache",
+    "*.swp",
+    "*.swo",
+    "*~",
+    ".idea",
+    ".vscode",
+    "*.log",
+    "logs",
+    ".agentscope_runtime",
+    "*.tmp",
+    "*.temp",
+    ".coverage",
+    "htmlcov",
+    ".pytest_cache",
+)
+
+
+_GLOB_CHARS = ("*", "?", "[")
+
+
+@dataclass(frozen=True)
+class _IgnoreMatcher:
+    """Ignore patterns bucketed by the cheapest test that evaluates them."""
+
+    names: FrozenSet[str]
+    path_prefixes: Tuple[str, ...]
+    suffixes: Tuple[str, ...]
+    name_prefixes: Tuple[str, ...]
+    generic: Optional[re.Pattern]
+
+    def matches_name(self, name: str) -> bool:
+        """Check a single path component against the patterns."""
+        return (
+            name in self.names
+            or name.endswith(self.suffixes)
+            or name.startswith(self.name_prefixes)
+            or (self.generic is not None and bool(self.generic.match(name)))
+        )
+
+    def matches_path_prefix(self, path: str) -> bool:
+        """Check a relative POSIX path against the multi-part prefixes."""
+        for prefix in self.path_prefixes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return True
+        return False
 
+    def prunes(self, path: str, name: str) -> bool:
+        """
+        Check whether everything below a directory is ignored.
+
+        Only component and prefix tests are used: a full-path glob such
+        as ``a/?`` can match a directory without matching its contents.
+        The walk has already checked the parents, so only ``name`` is
+        tested against the component buckets.
+        """
+        return self.matches_name(name) or self.matches_path_prefix(path)
+
+    def matches(self, path: str) -> bool:
+        """Check a relative POSIX path against the patterns."""
+        # Split once and run each bucket over all parts, cheapest first
+        parts = path.split("/")
+        if not self.names.isdisjoint(parts):
+            return True
+        if self.matches_path_prefix(path):
+            return True
+        for part in parts:
+            if part.endswith(self.suffixes) or part.startswith(
+                self.name_prefixes,
+            ):
+                return True
+        generic = self.generic
+        if generic is None:
+            return False
+        if generic.match(path):
+            return True
+        for part in parts:
+            if generic.match(part):
+                return True
+        return False
 
-def _should_ignore(path: str, patterns: List[str]) -> bool:
+
+@lru_cache(maxsize=None)
+def _compile_ignore_regex(globs: Tuple[str, ...]) -> Optional[re.Pattern]:
     """
-    Check if path should be ignored based on patterns.
+    Compile glob patterns into a single alternation regex.
 
     Args:
-        path: Path to check (relative)
-        patterns: List of ignore patterns
+        globs: Glob patterns
 
     Returns:
-        True if path should be ignored
+        Compiled regex, or None if there are no globs
+    """
+    if not globs:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in globs),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_ignore_matcher(patterns: Tuple[str, ...]) -> _IgnoreMatcher:
     """
-    path_parts = Path(path).parts
+    Classify ignore patterns into name, prefix, suffix and glob buckets.
+
+    Only patterns containing ``*`` or ``?`` are treated as globs. A glob
+    that is a literal with a single leading (``*.pyc``) or trailing
+    (``temp_*``) star becomes a suffix or prefix test on path components.
 
+    Args:
+        patterns: Ignore patterns
+
+    Returns:
+        Matcher for the given patterns
+    """
+    names = set()
+    path_prefixes = []
+    suffixes = []
+    name_prefixes = []
+    globs = []
     for pattern in patterns:
         pattern = pattern.lstrip("/")
         pattern_normalized = pattern.rstrip("/")
-        if pattern_normalized in path_parts:
-            return True
-
         if "*" in pattern or "?" in pattern:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-            for part in path_parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-        if (
-            path.startswith(pattern_normalized + "/")
-            or path == pattern_normalized
-        ):
-            return True
+            if "/" in pattern:
+                globs.append(pattern)
+            elif pattern.startswith("*") and not any(
+                c in pattern[1:] for c in _GLOB_CHARS
+            ):
+                suffixes.append(pattern[1:])
+            elif pattern.endswith("*") and not any(
+                c in pattern[:-1] for c in _GLOB_CHARS
+            ):
+                name_prefixes.append(pattern[:-1])
+            else:
+                globs.append(pattern)
+        if not pattern_normalized:
+            continue
+        if "/" in pattern_normalized:
+            path_prefixes.append(pattern_normalized)
+        else:
+            names.add(pattern_normalized)
+    return _IgnoreMatcher(
+        names=frozenset(names),
+        path_prefixes=tuple(path_prefixes),
+        suffixes=tuple(suffixes),
+        name_prefixes=tuple(name_prefixes),
+        generic=_compile_ignore_regex(tuple(globs)),
+    )
+
+
+def _should_ignore(path: str, patterns: Sequence[str]) -> bool:
+    """
+    Check if path should be ignored based on patterns.
+
+    Args:
+        path: Path to check (relative)
+        patterns: Ignore patterns
+
+    Returns:
+        True if path should be ignored
+    """
+    return _build_ignore_matcher(tuple(patterns)).matches(path)
+
+
+# Last archive built per (service name, project path), with the digest of
+# the (name, size, mtime, mode) manifest it was built from
+_PROJECT_ARCHIVE_CACHE: Dict[Tuple[str, str], Tuple[str, Path]] = {}
 
-    return False
+# Members larger than this are streamed from disk instead of being read
+# into memory by the reader threads
+_ARCHIVE_STREAM_THRESHOLD = 4 * 1024 * 1024
+
+# Fixed DOS timestamp for archive members so unchanged sources produce
+# byte-identical archives
+_ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _read_archive_member(path: str, size: int) -> Optional[bytes]:
+    """Read one archive member, or return None if it should be streamed."""
+    if size > _ARCHIVE_STREAM_THRESHOLD:
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_archive_members(
+    archive: zipfile.ZipFile,
+    members: List[Tuple[str, str, os.stat_result]],
+) -> None:
+    """
+    Write files to an open archive, reading them on a thread pool.
+
+    Reads run ahead of the writer within a bounded window while the
+    calling thread compresses and writes members in their original order.
+    Entry metadata comes from the walk's stat results, so no file is
+    stat'ed again here.
+
+    Args:
+        archive: Archive opened for writing
+        members: (path, arcname, stat result) tuples to add
+    """
+    max_workers = os.cpu_count() or 1
+    window = max_workers * 2
+    pending: Deque[Tuple[str, zipfile.ZipInfo, Future]] = deque()
+
+    def _write_next() -> None:
+        path, zinfo, future = pending.popleft()
+        data = future.result()
+        if data is not None:
+            archive.writestr(zinfo, data, compresslevel=archive.compresslevel)
+            return
+        # ZipFile.open takes no compression level, so streamed members use
+        # the compressor's default level
+        with open(path, "rb") as src, archive.open(zinfo, "w") as dest:
+            shutil.copyfileobj(src, dest, 1024 * 1024)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for path, arcname, member_stat in members:
+            zinfo = zipfile.ZipInfo(arcname, date_time=_ARCHIVE_DATE_TIME)
+            zinfo.external_attr = (member_stat.st_mode & 0xFFFF) << 16
+            zinfo.file_size = member_stat.st_size
+            zinfo.compress_type = archive.compression
+            pending.append(
+                (
+                    path,
+                    zinfo,
+                    pool.submit(
+                        _read_archive_member,
+                        path,
+                        member_stat.st_size,
+                    ),
+                ),
+            )
+            if len(pending) >= window:
+                _write_next()
+        while pending:
+            _write_next()
 
 
 def _get_default_ignore_patterns() -> List[str]:
@@ -1043,41 +1329,7 @@ def _get_default_ignore_patterns() -> List[str]:
     Returns:
         List of default ignore patterns (similar to .dockerignore/.gitignore)
     """
-    return [
-        "__pycache__",
-        "*.pyc",
-        "*.pyo",
-        "*.pyd",
-        ".git",
-        ".gitignore",
-        ".dockerignore",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".tox",
-        "venv",
-        "env",
-        ".venv",
-        "virtualenv",
-        "node_modules",
-        ".DS_Store",
-        "*.egg-info",
-        "build",
-        "dist",
-        ".cache",
-        "*.swp",
-        "*.swo",
-        "*~",
-        ".idea",
-        ".vscode",
-        "*.log",
-        "logs",
-        ".agentscope_runtime",
-        "*.tmp",
-        "*.temp",
-        ".coverage",
-        "htmlcov",
-        ".pytest_cache",
-    ]
+    return list(_DEFAULT_IGNORE_PATTERNS)
 
 
 def _generate_deployment_tool_tags(
@@ -1290,7 +1542,9 @@ class PAIDeployManager(DeployManager):
                 "security_group_id"
             ] = security_group_id
 
-        return json.dumps(config)
+        # Compact, unescaped JSON keeps the request body small when
+        # environment values or tags contain non-ASCII text
+        return json.dumps(config, ensure_ascii=False, separators=(",", ":"))
 
     def _build_credential_config(
         self,
@@ -1742,9 +1996,6 @@ class PAIDeployManager(DeployManager):
             return None
 
     def _create_project_archive(self, service_name, project_dir: Path):
-        build_dir = generate_build_directory("pai")
-        build_dir.mkdir(parents=True, exist_ok=True)
-
         ignore_patterns = _get_default_ignore_patterns()
 
         project_path = Path(project_dir).resolve()
@@ -1756,6 +2007,70 @@ class PAIDeployManager(DeployManager):
         dockerignore_path = project_path / ".dockerignore"
         if dockerignore_path.exists():
             ignore_patterns.extend(_read_ignore_file(dockerignore_path))
+        matcher = _build_ignore_matcher(tuple(ignore_patterns))
+
+        # Iterative scandir walk; DirEntry caches the type of each entry
+        members = []
+        stack = [(str(project_path), "")]
+        while stack:
+            dir_path, relative_dir = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    # Hidden entries were never matched by the previous
+                    # glob("**") walk, so keep leaving them out
+                    if entry.name.startswith("."):
+                        continue
+
+                    file_relative_path = relative_dir + entry.name
+                    if entry.is_dir():
+                        # Prune ignored directories before descending
+                        if matcher.prunes(file_relative_path, entry.name):
+                            logger.debug(
+                                "Skipping ignored directory: %s",
+                                file_relative_path,
+                            )
+                            continue
+                        stack.append((entry.path, file_relative_path + "/"))
+                        continue
+
+                    # Skip anything that is not a regular file
+                    if not entry.is_file():
+                        continue
+
+                    if matcher.matches(file_relative_path):
+                        logger.debug(
+                            "Skipping ignored file: %s",
+                            file_relative_path,
+                        )
+                        continue
+                    members.append(
+                        (entry.path, file_relative_path, entry.stat()),
+                    )
+
+        # Sorted members give a stable manifest and a reproducible archive
+        members.sort(key=lambda member: member[1])
+
+        # Reuse the previous archive if no member changed since it was built
+        manifest = [
+            (arcname, st.st_size, st.st_mtime_ns, st.st_mode)
+            for _, arcname, st in members
+        ]
+        manifest_digest = hashlib.blake2b(
+            repr(manifest).encode("utf-8", "surrogateescape"),
+            digest_size=16,
+        ).hexdigest()
+        cache_key = (service_name, str(project_path))
+        cached = _PROJECT_ARCHIVE_CACHE.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == manifest_digest
+            and cached[1].is_file()
+        ):
+            logger.info("Project unchanged, reusing archive: %s", cached[1])
+            return cached[1]
+
+        build_dir = generate_build_directory("pai")
+        build_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_filename = f"{service_name}_{timestamp}.zip"
@@ -1764,36 +2079,13 @@ class PAIDeployManager(DeployManager):
         with zipfile.ZipFile(
             archive_path,
             "w",
-            zipfile.ZIP_DEFLATED,
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=1,
+            allowZip64=True,
         ) as archive:
-            source_files = glob.glob(
-                pathname=str(project_path / "**"),
-                recursive=True,
-            )
-
-            for file_path in source_files:
-                file_path_obj = Path(file_path)
-
-                # Skip if not a file (e.g., directories)
-                if not file_path_obj.is_file():
-                    continue
-
-                file_relative_path = file_path_obj.relative_to(
-                    project_path,
-                ).as_posix()
-
-                # Skip . and .. directory references
-                if file_relative_path in (".", ".."):
-                    continue
-
-                if _should_ignore(file_relative_path, ignore_patterns):
-                    logger.debug(
-                        "Skipping ignored file: %s",
-                        file_relative_path,
-                    )
-                    continue
-                archive.write(file_path, file_relative_path)
+            _write_archive_members(archive, members)
 
+        _PROJECT_ARCHIVE_CACHE[cache_key] = (manifest_digest, archive_path)
         logger.info("Project archived to: %s", archive_path)
 
         return archive_path
@@ -2224,10 +2516,13 @@ class PAIDeployManager(DeployManager):
         """
         Wait for deployment to reach approval stage (WaitingForApproval).
 
+        Polling starts at 0.1 seconds and backs off exponentially up to
+        ``poll_interval`` so that quick transitions are noticed early.
+
         Args:
             deployment_id: Deployment ID to monitor
             timeout: Maximum wait time in seconds
-            poll_interval: Polling interval in seconds
+            poll_interval: Maximum polling interval in seconds
 
         Returns:
             True if deployment reached approval stage, False otherwise
@@ -2242,36 +2537,37 @@ class PAIDeployManager(DeployManager):
         )
         client = self.get_langstudio_client()
 
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            response = await client.get_deployment_async(
-                deployment_id=deployment_id,
-                workspace_id=self.workspace_id,
-            )
-            status = response.get("DeploymentStatus", "")
-
-            if status == "WaitForConfirm":
-                logger.info("Deployment is ready for approval")
-                return True
-            if status in ("Failed", "Canceled"):
-                error_msg = response.get("ErrorMessage", "Unknown error")
-                raise RuntimeError(
-                    f"Deployment {deployment_id} failed: {error_msg}",
+        async def _poll() -> bool:
+            delay = min(0.1, poll_interval)
+            while True:
+                response = await client.get_deployment_async(
+                    deployment_id=deployment_id,
+                    workspace_id=self.workspace_id,
                 )
-            if status in ("Running", "Creating"):
-                await asyncio.sleep(poll_interval)
-                continue
-            if status == "Succeed":
-                # Already approved and succeeded
-                return True
+                status = response.get("DeploymentStatus", "")
 
-            await asyncio.sleep(poll_interval)
+                if status == "WaitForConfirm":
+                    logger.info("Deployment is ready for approval")
+                    return True
+                if status in ("Failed", "Canceled"):
+                    error_msg = response.get("ErrorMessage", "Unknown error")
+                    raise RuntimeError(
+                        f"Deployment {deployment_id} failed: {error_msg}",
+                    )
+                if status == "Succeed":
+                    # Already approved and succeeded
+                    return True
 
-        raise TimeoutError(
-            f"Deployment {deployment_id} did not reach approval stage "
-            f"within {timeout} seconds",
-        )
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.6, poll_interval)
+
+        try:
+            return await asyncio.wait_for(_poll(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Deployment {deployment_id} did not reach approval stage "
+                f"within {timeout} seconds",
+            ) from None
 
     async def approve_deployment(
         self,
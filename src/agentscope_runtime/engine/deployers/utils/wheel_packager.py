@@ -441,23 +441,61 @@ recursive-include deploy_starter/wheels *.whl
     return wrapper_dir, wrapper_dir / "dist"
 
 
-def build_wheel(project_dir: Path) -> Path:
+_BUILD_VENV_READY_MARKER = ".agentscope_build_ready"
+
+
+def _ensure_build_venv(venv_dir: Path) -> Path:
     """
-    Build a wheel inside an isolated virtual environment to avoid PEP 668
-    issues. Returns the path to the built wheel.
+    Create the build virtual environment and install the build
+    requirements once. Later builds reuse it as long as the ready marker
+    is present. Returns the path to the venv python.
     """
-    venv_dir = project_dir / ".venv_build"
-    if not venv_dir.exists():
+    vpy = _venv_python(venv_dir)
+    marker = venv_dir / _BUILD_VENV_READY_MARKER
+    if vpy.exists() and marker.is_file():
+        return vpy
+
+    if not vpy.exists():
         subprocess.run(
             [sys.executable, "-m", "venv", str(venv_dir)],
             check=True,
         )
-    vpy = _venv_python(venv_dir)
     subprocess.run(
-        [str(vpy), "-m", "pip", "install", "--upgrade", "pip", "build"],
+        [
+            str(vpy),
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "pip",
+            "build",
+            "setuptools",
+            "wheel",
+        ],
         check=True,
     )
-    subprocess.run([str(vpy), "-m", "build"], cwd=str(project_dir), check=True)
+    marker.touch()
+    return vpy
+
+
+def build_wheel(project_dir: Path, isolated: bool = True) -> Path:
+    """
+    Build a wheel inside a persistent virtual environment to avoid PEP 668
+    issues. Returns the path to the built wheel.
+
+    Args:
+        project_dir: Project to build.
+        isolated: Build in an isolated environment that provisions the
+            project's declared build backend. Pass ``False`` only for
+            projects built with setuptools, such as the wrapper from
+            ``generate_wrapper_project``: the build venv already has it
+            installed, so no build environment is set up per call.
+    """
+    vpy = _ensure_build_venv(project_dir / ".venv_build")
+    cmd = [str(vpy), "-m", "build", "--wheel"]
+    if not isolated:
+        cmd.append("--no-isolation")
+    subprocess.run(cmd, cwd=str(project_dir), check=True)
     dist_dir = project_dir / "dist"
     whls = sorted(
         dist_dir.glob("*.whl"),
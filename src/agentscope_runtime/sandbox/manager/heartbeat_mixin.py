@@ -3,7 +3,7 @@ import asyncio
 import inspect
 import time
 import secrets
-from typing import Optional, List
+from typing import Optional, List, Dict
 from functools import wraps
 
 import logging
@@ -105,6 +105,7 @@ class HeartbeatMixin:
           ``ContainerModel(**dict)``
         - ``self.config.redis_enabled`` (`bool`)
         - ``self.config.heartbeat_lock_ttl`` (`int`)
+        - ``self.config.heartbeat_timeout`` (`int`)
         - ``self.redis_client`` (redis client or ``None``)
         - ``self.restore_session(session_ctx_id)`` (optional, for restore)
 
@@ -115,6 +116,17 @@ class HeartbeatMixin:
 else
   return 0
 end
+"""
+
+    # Drop index members only if their score is still the one the scanner
+    # read; a concurrent ZADD from a fresh heartbeat must survive.
+    _REDIS_DROP_INDEX_LUA = """for i = 1, #ARGV, 2 do
+  local score = redis.call("ZSCORE", KEYS[1], ARGV[i])
+  if score and tonumber(score) == tonumber(ARGV[i + 1]) then
+    redis.call("ZREM", KEYS[1], ARGV[i])
+  end
+end
+return 0
 """
 
     def _list_container_names_by_session(
@@ -201,16 +213,114 @@ end
             raise ValueError("session_ctx_id is required")
 
         ts = float(ts if ts is not None else time.time())
+        self._touch_session_containers(session_ctx_id, ts)
+        return ts
+
+    def touch_and_clear(
+        self,
+        session_ctx_id: str,
+        identity: str,
+        ts: Optional[float] = None,
+    ) -> float:
+        """Clear a container's recycle marker and update session heartbeat.
+
+        Equivalent to ``clear_container_recycle_marker(identity,
+        set_state=ContainerState.RUNNING)`` followed by
+        `update_heartbeat`, but the container record of ``identity`` is
+        written once instead of loaded and saved by each call.
+
+        Args:
+            session_ctx_id (`str`):
+                The session context id.
+            identity (`str`):
+                The container identity bound to the session.
+            ts (`Optional[float]`, optional):
+                The timestamp to write. If ``None``, uses ``time.time()``.
+
+        Returns:
+            `float`:
+                The timestamp that was written.
+        """
+        if not session_ctx_id:
+            raise ValueError("session_ctx_id is required")
+
+        ts = float(ts if ts is not None else time.time())
+        cleared = self._touch_session_containers(
+            session_ctx_id,
+            ts,
+            clear=identity,
+        )
+        if not cleared:
+            # identity is not (directly) listed under the session
+            self.clear_container_recycle_marker(
+                identity,
+                set_state=ContainerState.RUNNING,
+            )
+        return ts
+
+    def _touch_session_containers(
+        self,
+        session_ctx_id: str,
+        ts: float,
+        clear: Optional[str] = None,
+    ) -> bool:
+        """Write heartbeat ``ts`` into the session's RUNNING containers.
+
+        When ``clear`` names a container of the session, its recycle marker
+        is reset and it is set RUNNING in the same write.
+
+        Returns:
+            `bool`:
+                ``True`` if the ``clear`` container was found and written.
+        """
         now = time.time()
 
+        touched = False
+        cleared = False
         container_names = self._list_container_names_by_session(session_ctx_id)
         for cname in list(container_names):
+            # Fast path: patch the stored record directly instead of a
+            # full ContainerModel validate/dump round-trip per touch.
+            raw = self.container_mapping.get(cname)
+            if (
+                isinstance(raw, dict)
+                and raw.get("state") != ContainerState.REPLACED
+            ):
+                patch = {}
+                if cname == clear:
+                    patch = {
+                        "state": ContainerState.RUNNING,
+                        "recycled_at": None,
+                        "recycle_reason": None,
+                    }
+                    cleared = True
+                elif raw.get("state") != ContainerState.RUNNING:
+                    continue
+                self.container_mapping.set(
+                    raw.get("container_name") or cname,
+                    dict(
+                        raw,
+                        last_active_at=ts,
+                        updated_at=now,
+                        session_ctx_id=session_ctx_id,
+                        **patch,
+                    ),
+                )
+                touched = True
+                continue
+
+            # Redirects and alternate keys go through get_info
             model = self._load_container_model(cname)
             if not model:
                 continue
 
+            if cname == clear:
+                model.state = ContainerState.RUNNING
+                model.recycled_at = None
+                model.recycle_reason = None
+                cleared = True
             # only update heartbeat for RUNNING containers
-            if model.state != ContainerState.RUNNING:
+            elif model.state != ContainerState.RUNNING:
                 continue
 
             model.last_active_at = ts
@@ -220,8 +330,245 @@ end
             model.session_ctx_id = session_ctx_id
 
             self._save_container_model(model)
+            touched = True
 
-        return ts
+        if touched:
+            self._set_live_heartbeat(session_ctx_id, ts, now)
+
+        return cleared
+
+    def _live_heartbeat_key(self, session_ctx_id: str) -> str:
+        """Build the Redis key that marks a session's heartbeat as fresh.
+
+        Args:
+            session_ctx_id (`str`):
+                The session context id.
+
+        Returns:
+            `str`:
+                The redis key.
+        """
+        return f"heartbeat_alive:{session_ctx_id}"
+
+    def _heartbeat_index_key(self) -> str:
+        """Build the Redis sorted-set key indexing sessions by heartbeat.
+
+        Returns:
+            `str`:
+                The redis key.
+        """
+        return "heartbeat_index"
+
+    def _set_live_heartbeat(
+        self,
+        session_ctx_id: str,
+        ts: float,
+        now: float,
+    ) -> None:
+        """Mirror a heartbeat into Redis for the scanner.
+
+        Two writes share one pipeline: a marker key holding ``ts`` that
+        lives for whatever remains of ``heartbeat_timeout`` after ``ts``,
+        and the session's score in the heartbeat sorted-set index.
+        Non-Redis mode is a no-op.
+
+        Args:
+            session_ctx_id (`str`):
+                The session context id.
+            ts (`float`):
+                The heartbeat timestamp just written.
+            now (`float`):
+                The current time.
+
+        Returns:
+            `None`:
+                No return value.
+        """
+        if not self.config.redis_enabled or self.redis_client is None:
+            return
+
+        key = self._live_heartbeat_key(session_ctx_id)
+        ttl_ms = int((self.config.heartbeat_timeout - (now - ts)) * 1000)
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            if ttl_ms > 0:
+                pipe.set(key, ts, px=ttl_ms)
+            else:
+                # a back-dated heartbeat must not leave a fresher marker
+                pipe.delete(key)
+            pipe.zadd(self._heartbeat_index_key(), {session_ctx_id: ts})
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"_set_live_heartbeat failed (ignored): {e}")
+
+    def _drop_live_heartbeat(self, session_ctx_id: str) -> None:
+        """Delete a session's heartbeat marker.
+
+        Called wherever a session's container records are rewritten
+        outside `update_heartbeat` (reap, release, `mark_session_recycled`),
+        so a stale marker cannot vouch for them. Non-Redis mode is a no-op.
+
+        Args:
+            session_ctx_id (`str`):
+                The session context id.
+
+        Returns:
+            `None`:
+                No return value.
+        """
+        if not self.config.redis_enabled or self.redis_client is None:
+            return
+
+        try:
+            self.redis_client.delete(self._live_heartbeat_key(session_ctx_id))
+        except Exception as e:
+            logger.debug(f"_drop_live_heartbeat failed (ignored): {e}")
+
+    def get_live_heartbeats(
+        self,
+        session_ctx_ids: List[str],
+    ) -> Dict[str, float]:
+        """Fetch unexpired heartbeat markers for several sessions at once.
+
+        Sessions missing from the result are either idle past
+        ``heartbeat_timeout`` or have no marker yet, and must be checked
+        against their container records. Marker timestamps are re-checked
+        against the current ``heartbeat_timeout``, so a marker set under a
+        longer timeout does not keep a session alive.
+
+        Args:
+            session_ctx_ids (`List[str]`):
+                The session context ids.
+
+        Returns:
+            `Dict[str, float]`:
+                Heartbeat timestamps keyed by session context id. Always
+                empty in non-Redis mode.
+        """
+        if (
+            not session_ctx_ids
+            or not self.config.redis_enabled
+            or self.redis_client is None
+        ):
+            return {}
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for session_ctx_id in session_ctx_ids:
+                pipe.get(self._live_heartbeat_key(session_ctx_id))
+            values = pipe.execute()
+        except Exception as e:
+            logger.debug(f"get_live_heartbeats failed (ignored): {e}")
+            return {}
+
+        cutoff = time.time() - self.config.heartbeat_timeout
+        live = {}
+        for session_ctx_id, value in zip(session_ctx_ids, values):
+            if value is not None and float(value) >= cutoff:
+                live[session_ctx_id] = float(value)
+        return live
+
+    def get_idle_heartbeat_candidates(self, cutoff: float) -> List[str]:
+        """List sessions whose indexed heartbeat is at or before ``cutoff``.
+
+        Args:
+            cutoff (`float`):
+                The latest heartbeat timestamp still considered idle.
+
+        Returns:
+            `List[str]`:
+                Candidate session context ids. Always empty in non-Redis
+                mode.
+        """
+        if not self.config.redis_enabled or self.redis_client is None:
+            return []
+
+        return list(
+            self.redis_client.zrangebyscore(
+                self._heartbeat_index_key(),
+                "-inf",
+                cutoff,
+            ),
+        )
+
+    def get_heartbeat_index_scores(
+        self,
+        session_ctx_ids: List[str],
+    ) -> Dict[str, float]:
+        """Fetch the heartbeat index scores of several sessions at once.
+
+        Args:
+            session_ctx_ids (`List[str]`):
+                The session context ids.
+
+        Returns:
+            `Dict[str, float]`:
+                Indexed heartbeat timestamps keyed by session context id;
+                sessions not in the index are omitted. Always empty in
+                non-Redis mode or on error.
+        """
+        if (
+            not session_ctx_ids
+            or not self.config.redis_enabled
+            or self.redis_client is None
+        ):
+            return {}
+
+        key = self._heartbeat_index_key()
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for session_ctx_id in session_ctx_ids:
+                pipe.zscore(key, session_ctx_id)
+            scores = pipe.execute()
+        except Exception as e:
+            logger.debug(f"get_heartbeat_index_scores failed (ignored): {e}")
+            return {}
+
+        return {
+            session_ctx_id: float(score)
+            for session_ctx_id, score in zip(session_ctx_ids, scores)
+            if score is not None
+        }
+
+    def drop_heartbeat_index(self, scores: Dict[str, float]) -> None:
+        """Remove sessions from the heartbeat index if still unchanged.
+
+        A session is only removed while its index score still equals the
+        one given, i.e. no heartbeat was indexed for it since ``scores``
+        was read (see `get_heartbeat_index_scores`). The check and removal
+        run atomically in one Lua script.
+
+        Args:
+            scores (`Dict[str, float]`):
+                The index scores read for the sessions to drop.
+
+        Returns:
+            `None`:
+                No return value.
+        """
+        if (
+            not scores
+            or not self.config.redis_enabled
+            or self.redis_client is None
+        ):
+            return
+
+        args = []
+        for session_ctx_id, score in scores.items():
+            args.extend((session_ctx_id, repr(float(score))))
+        try:
+            script = getattr(self, "_drop_index_script", None)
+            if script is None or script.registered_client is not (
+                self.redis_client
+            ):
+                script = self.redis_client.register_script(
+                    self._REDIS_DROP_INDEX_LUA,
+                )
+                self._drop_index_script = script
+            script(keys=[self._heartbeat_index_key()], args=args)
+        except Exception as e:
+            # Stale members are harmless: the next full scan re-checks them
+            logger.debug(f"drop_heartbeat_index failed (ignored): {e}")
 
     def get_heartbeat(self, session_ctx_id: str) -> Optional[float]:
         """Get session-level heartbeat as max(last_active_at) of RUNNING items.
@@ -281,6 +628,8 @@ end
         ts = float(ts if ts is not None else time.time())
         now = time.time()
 
+        # Metadata only, so the records can be written back in one batch
+        recycled = {}
         container_names = self._list_container_names_by_session(session_ctx_id)
         for cname in list(container_names):
             model = self._load_container_model(cname)
@@ -300,8 +649,10 @@ end
             model.updated_at = now
 
             model.session_ctx_id = session_ctx_id
-            self._save_container_model(model)
+            recycled[model.container_name] = model.model_dump()
 
+        self.container_mapping.mset(recycled)
+        self._drop_live_heartbeat(session_ctx_id)
         return ts
 
     def clear_container_recycle_marker(
@@ -448,7 +799,8 @@ end
         """Release a heartbeat lock if the token matches.
 
         It uses a Lua script to ensure only the owner token can release the
-        lock.
+        lock. The script is registered once and invoked by SHA
+        (``EVALSHA``), so its source is only sent on the first call.
         If Redis does not support ``EVAL``, it falls back to a GET+DEL check.
 
         Args:
@@ -467,12 +819,15 @@ end
 
         key = self._heartbeat_lock_key(session_ctx_id)
         try:
-            res = self.redis_client.eval(
-                self._REDIS_RELEASE_LOCK_LUA,
-                1,
-                key,
-                token,
-            )
+            script = getattr(self, "_release_lock_script", None)
+            if script is None or script.registered_client is not (
+                self.redis_client
+            ):
+                script = self.redis_client.register_script(
+                    self._REDIS_RELEASE_LOCK_LUA,
+                )
+                self._release_lock_script = script
+            res = script(keys=[key], args=[token])
             return bool(res)
         except ResponseError as e:
             msg = str(e).lower()
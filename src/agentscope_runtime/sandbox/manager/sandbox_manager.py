@@ -5,6 +5,7 @@
 # pylint: disable=too-many-public-methods, unused-argument
 import asyncio
 import inspect
+import itertools
 import json
 import time
 import threading
@@ -12,8 +13,9 @@ import logging
 import os
 import secrets
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
-from typing import Optional, Dict, Union, List
+from typing import Optional, Dict, Union, List, Tuple, Iterable, Iterator
 
 import requests
 import shortuuid
@@ -51,6 +53,10 @@ from ...common.container_clients import ContainerClientFactory
 
 logger = logging.getLogger(__name__)
 
+# Sessions whose container records are fetched per storage round-trip
+# during a heartbeat scan.
+HEARTBEAT_SCAN_BATCH_SIZE = 500
+
 
 def remote_wrapper(
     method: str = "POST",
@@ -221,10 +227,14 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
                     "Unable to connect to the Redis server.",
                 ) from e
 
-            self.container_mapping = RedisMapping(self.redis_client)
+            self.container_mapping = RedisMapping(
+                self.redis_client,
+                scan_count=self.config.redis_scan_count,
+            )
             self.session_mapping = RedisMapping(
                 self.redis_client,
                 prefix="session_mapping",
+                scan_count=self.config.redis_scan_count,
             )
 
             # Init multi sand box pool
@@ -264,6 +274,7 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
         self._watcher_stop_event = threading.Event()
         self._watcher_thread = None
         self._watcher_thread_lock = threading.Lock()
+        self._heartbeat_scan_count = 0
 
         logger.debug(str(config))
 
@@ -630,11 +641,10 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
 
                 self.session_mapping.set(session_ctx_id, env_ids)
 
-                self.clear_container_recycle_marker(
+                self.touch_and_clear(
+                    session_ctx_id,
                     container_model.container_name,
-                    set_state=ContainerState.RUNNING,
                 )
-                self.update_heartbeat(session_ctx_id)
 
         try:
             # 1) Try dequeue first
@@ -925,13 +935,11 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
                 self.session_mapping.set(session_ctx_id, env_ids)
 
                 # First heartbeat on creation (treat "allocate to session"
-                # as first activity)
-                self.update_heartbeat(session_ctx_id)
-
-                # Session is now alive again; clear restore-required marker
-                self.clear_container_recycle_marker(
+                # as first activity); the session is now alive again, so
+                # clear the restore-required marker in the same write.
+                self.touch_and_clear(
+                    session_ctx_id,
                     container_model.container_name,
-                    set_state=ContainerState.RUNNING,
                 )
 
             logger.debug(
@@ -1037,6 +1045,7 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
                     # last container of this session is gone;
                     # keep state consistent
                     self.session_mapping.delete(session_ctx_id)
+                self._drop_live_heartbeat(session_ctx_id)
 
             # Mark released (do NOT delete mapping) in model
             now = time.time()
@@ -1358,10 +1367,9 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
     @remote_wrapper()
     def list_session_keys(self) -> list:
         """Return all session_ctx_id keys currently in mapping"""
-        session_keys = []
-        for key in self.session_mapping.scan():
-            session_keys.append(key)
-        return session_keys
+        # Kept as a list: this is also served over HTTP as JSON. In-process
+        # callers that only iterate should use session_mapping.scan().
+        return list(self.session_mapping.scan())
 
     @remote_wrapper_async()
     async def list_session_keys_async(self, *args, **kwargs):
@@ -1430,6 +1438,9 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
                         info.meta = {}
                     info.meta["session_ctx_id"] = session_ctx_id
 
+                    # Written per container so each record is RECYCLED as
+                    # soon as its container is gone, even if a later one
+                    # fails or this process dies mid-reap.
                     self.container_mapping.set(
                         info.container_name,
                         info.model_dump(),
@@ -1441,6 +1452,7 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
                         f"session {session_ctx_id}: {e}",
                     )
 
+            self._drop_live_heartbeat(session_ctx_id)
             return True
         except Exception as e:
             logger.warning(f"Failed to reap session {session_ctx_id}: {e}")
@@ -1581,14 +1593,173 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
                     f"{old_name} as REPLACED: {e}",
                 )
 
+    def _load_session_activity(
+        self,
+        session_ctx_ids: List[str],
+    ) -> Dict[str, Tuple[bool, Optional[float]]]:
+        """
+        Batch-load ``(has_running, last_active)`` for several sessions.
+
+        Session mappings and container records are each fetched with one
+        ``mget`` and read as raw dicts; only records that need a redirect
+        or an alternate key fall back to ``get_info``. ``last_active``
+        matches ``get_heartbeat``. Storage errors propagate, so a failed
+        read is never mistaken for a session without containers.
+        """
+        env_lists = self.session_mapping.mget(session_ctx_ids)
+
+        cnames = list(
+            dict.fromkeys(
+                cname for env_ids in env_lists for cname in env_ids or []
+            ),
+        )
+        raw_models = self.container_mapping.mget(cnames)
+
+        # (state, last_active_at) per container; only two fields are
+        # needed, so skip building a ContainerModel for each record.
+        states: Dict[str, Tuple[Optional[str], Optional[float]]] = {}
+        for cname, raw in zip(cnames, raw_models):
+            if isinstance(raw, dict) and not (
+                raw.get("state") == ContainerState.REPLACED
+                and raw.get("redirect_to")
+                and raw.get("redirect_to") != cname
+            ):
+                states[cname] = (raw.get("state"), raw.get("last_active_at"))
+                continue
+            cm = self._load_container_model(cname)
+            states[cname] = (
+                (cm.state, cm.last_active_at) if cm else (None, None)
+            )
+
+        activity = {}
+        for session_ctx_id, env_ids in zip(session_ctx_ids, env_lists):
+            has_running = False
+            last_vals = []
+            for cname in env_ids or []:
+                state, last_active_at = states.get(cname, (None, None))
+                if state != ContainerState.RUNNING:
+                    continue
+                has_running = True
+                if last_active_at is not None:
+                    last_vals.append(float(last_active_at))
+            activity[session_ctx_id] = (
+                has_running,
+                max(last_vals) if last_vals else None,
+            )
+        return activity
+
+    def _iter_session_activity(
+        self,
+        session_ctx_ids: Iterable[str],
+    ) -> Iterator[
+        Tuple[str, Optional[bool], Optional[float], Optional[float]]
+    ]:
+        """
+        Yield ``(session_ctx_id, has_running, last_active, index_score)``
+        in batches.
+
+        ``index_score`` is the session's heartbeat index score read before
+        its records were loaded, for `drop_heartbeat_index`.
+        ``has_running`` is ``None`` when the records could not be loaded.
+        """
+        it = iter(session_ctx_ids)
+        while True:
+            batch = list(itertools.islice(it, HEARTBEAT_SCAN_BATCH_SIZE))
+            if not batch:
+                return
+            # Sessions with an unexpired heartbeat marker are known to be
+            # active; only the rest need their container records loaded.
+            live = self.get_live_heartbeats(batch)
+            pending = [sid for sid in dict.fromkeys(batch) if sid not in live]
+            scores = self.get_heartbeat_index_scores(pending)
+            try:
+                activity = self._load_session_activity(pending)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load activity of {len(pending)} sessions: "
+                    f"{e}",
+                )
+                activity = {}
+            for session_ctx_id in batch:
+                if session_ctx_id in live:
+                    yield session_ctx_id, True, live[session_ctx_id], None
+                else:
+                    has_running, last_active = activity.get(
+                        session_ctx_id,
+                        (None, None),
+                    )
+                    yield (
+                        session_ctx_id,
+                        has_running,
+                        last_active,
+                        scores.get(session_ctx_id),
+                    )
+
+    def _reap_if_still_idle(
+        self,
+        session_ctx_id: str,
+        timeout: int,
+    ) -> Optional[str]:
+        """
+        Lock, re-check and reap one expired session.
+
+        Returns the ``scan_heartbeat_once`` counter to bump, or ``None``
+        when ``reap_session`` reports failure.
+        """
+        token = self.acquire_heartbeat_lock(session_ctx_id)
+        if not token:
+            return "skipped_lock_busy"
+
+        try:
+            # double-check after lock (avoid racing with a fresh heartbeat)
+            last_active = self.get_heartbeat(session_ctx_id)
+            if last_active is None:
+                return "skipped_no_heartbeat"
+
+            if time.time() - last_active <= timeout:
+                return "skipped_not_idle_after_double_check"
+
+            ok = self.reap_session(
+                session_ctx_id,
+                reason="heartbeat_timeout",
+            )
+            return "reaped_sessions" if ok else None
+
+        except Exception:
+            logger.warning(
+                f"scan_heartbeat_once error on session {session_ctx_id}",
+            )
+            logger.debug(traceback.format_exc())
+            return "errors"
+        finally:
+            self.release_heartbeat_lock(session_ctx_id, token)
+
     def scan_heartbeat_once(self) -> dict:
         """
         Scan all session_ctx_id in session_mapping and reap those idle
         beyond timeout. Uses redis distributed lock to avoid multi-instance
         double reap.
+
+        In Redis mode only every ``heartbeat_full_scan_every``-th call walks
+        the whole session_mapping; the others check just the sessions the
+        heartbeat index reports as idle.
         """
         timeout = int(self.config.heartbeat_timeout)
 
+        full_scan = (
+            not self.config.redis_enabled
+            or self._heartbeat_scan_count
+            % int(self.config.heartbeat_full_scan_every)
+            == 0
+        )
+        self._heartbeat_scan_count += 1
+        if full_scan:
+            session_ctx_ids = self.session_mapping.scan()
+        else:
+            session_ctx_ids = self.get_idle_heartbeat_candidates(
+                time.time() - timeout,
+            )
+
         result = {
             "scanned_sessions": 0,
             "reaped_sessions": 0,
@@ -1599,69 +1770,67 @@ class SandboxManager(HeartbeatMixin, WorkspaceFSMixin):
             "errors": 0,
         }
 
-        for session_ctx_id in list(self.session_mapping.scan()):
-            result["scanned_sessions"] += 1
-
-            has_running = False
-            try:
-                env_ids = self.get_session_mapping(session_ctx_id) or []
-                for cname in list(env_ids):
-                    try:
-                        cm = ContainerModel(**self.get_info(cname))
-                    except Exception:
-                        continue
-                    if cm.state == ContainerState.RUNNING:
-                        has_running = True
-                        break
-            except Exception:
-                has_running = False
-
-            if not has_running:
-                result["skipped_no_running_containers"] += 1
-                continue
-
-            last_active = self.get_heartbeat(session_ctx_id)
-            if last_active is None:
-                result["skipped_no_heartbeat"] += 1
-                continue
-
-            # Use time.time() consistently to avoid subtle timing skew if
-            # the scan loop itself takes a while under load.
-            if time.time() - last_active <= timeout:
-                continue
+        # Expired sessions are locked and reaped on a small pool so their
+        # storage and container round-trips overlap; worker threads are
+        # only spawned once there is something to reap.
+        with ThreadPoolExecutor(
+            max_workers=int(self.config.heartbeat_parallelism),
+            thread_name_prefix="heartbeat-reap",
+        ) as executor:
+            futures = {}
+            # index scores of the sessions read below
+            index_scores = {}
+            # sessions with nothing left to reap; dropped from the index
+            settled = []
+
+            # Consume SCAN lazily so batches are fetched as keys arrive.
+            activity = self._iter_session_activity(session_ctx_ids)
+            for session_ctx_id, has_running, last_active, score in activity:
+                result["scanned_sessions"] += 1
+                if score is not None:
+                    index_scores[session_ctx_id] = score
+
+                if has_running is None:
+                    # records could not be read; retry on the next scan
+                    result["errors"] += 1
+                    continue
 
-            token = self.acquire_heartbeat_lock(session_ctx_id)
-            if not token:
-                result["skipped_lock_busy"] += 1
-                continue
+                if not has_running:
+                    result["skipped_no_running_containers"] += 1
+                    settled.append(session_ctx_id)
+                    continue
 
-            try:
-                # double-check after lock (avoid racing with a fresh heartbeat)
-                last_active2 = self.get_heartbeat(session_ctx_id)
-                if last_active2 is None:
+                if last_active is None:
                     result["skipped_no_heartbeat"] += 1
+                    settled.append(session_ctx_id)
                     continue
 
-                if time.time() - last_active2 <= timeout:
-                    result["skipped_not_idle_after_double_check"] += 1
+                # Use time.time() consistently to avoid subtle timing skew
+                # if the scan loop itself takes a while under load.
+                if time.time() - last_active <= timeout:
                     continue
 
-                ok = self.reap_session(
+                future = executor.submit(
+                    self._reap_if_still_idle,
                     session_ctx_id,
-                    reason="heartbeat_timeout",
-                )
-                if ok:
-                    result["reaped_sessions"] += 1
-
-            except Exception:
-                result["errors"] += 1
-                logger.warning(
-                    f"scan_heartbeat_once error on session {session_ctx_id}",
+                    timeout,
                 )
-                logger.debug(traceback.format_exc())
-            finally:
-                self.release_heartbeat_lock(session_ctx_id, token)
-
+                futures[future] = session_ctx_id
+
+            for future in as_completed(futures):
+                outcome = future.result()
+                if outcome:
+                    result[outcome] += 1
+                if outcome == "reaped_sessions":
+                    settled.append(futures[future])
+
+        self.drop_heartbeat_index(
+            {
+                session_ctx_id: index_scores[session_ctx_id]
+                for session_ctx_id in settled
+                if session_ctx_id in index_scores
+            },
+        )
         return result
 
     def scan_pool_once(self) -> dict:
@@ -78,6 +78,7 @@ def get_config() -> SandboxManagerEnvConfig:
             redis_password=settings.REDIS_PASSWORD,
             redis_port_key=settings.REDIS_PORT_KEY,
             redis_container_pool_key=settings.REDIS_CONTAINER_POOL_KEY,
+            redis_scan_count=settings.REDIS_SCAN_COUNT,
             k8s_namespace=settings.K8S_NAMESPACE,
             kubeconfig_path=settings.KUBECONFIG_PATH,
             agent_run_access_key_id=settings.AGENT_RUN_ACCESS_KEY_ID,
@@ -106,6 +107,8 @@ def get_config() -> SandboxManagerEnvConfig:
             fc_log_store=settings.FC_LOG_STORE,
             heartbeat_timeout=settings.HEARTBEAT_TIMEOUT,
             heartbeat_lock_ttl=settings.HEARTBEAT_LOCK_TTL,
+            heartbeat_parallelism=settings.HEARTBEAT_PARALLELISM,
+            heartbeat_full_scan_every=settings.HEARTBEAT_FULL_SCAN_EVERY,
             watcher_scan_interval=settings.WATCHER_SCAN_INTERVAL,
             released_key_ttl=settings.RELEASE_KET_TTL,
             max_sandbox_instances=settings.MAX_SANDBOX_INSTANCES,
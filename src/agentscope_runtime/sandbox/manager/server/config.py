@@ -51,6 +51,7 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_PORT_KEY: str = "_runtime_sandbox_container_occupied_ports"
     REDIS_CONTAINER_POOL_KEY: str = "_runtime_sandbox_container_container_pool"
+    REDIS_SCAN_COUNT: int = 1024
 
     # OSS settings
     FILE_SYSTEM: Literal["local", "oss"] = "local"
@@ -102,6 +103,8 @@ class Settings(BaseSettings):
     # Heartbeat related
     HEARTBEAT_TIMEOUT: int = 300
     HEARTBEAT_LOCK_TTL: int = 120
+    HEARTBEAT_PARALLELISM: int = 8
+    HEARTBEAT_FULL_SCAN_EVERY: int = 60
     WATCHER_SCAN_INTERVAL: int = 1  # 0 to disable watcher
     RELEASE_KET_TTL: int = 3600
 
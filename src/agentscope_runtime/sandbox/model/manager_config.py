@@ -123,6 +123,12 @@ class SandboxManagerEnvConfig(BaseModel):
         "_runtime_sandbox_container_container_pool",
         description="Prefix for Redis keys related to container pool.",
     )
+    redis_scan_count: int = Field(
+        1024,
+        description="COUNT hint passed to Redis SCAN when iterating "
+        "session and container mappings.",
+        gt=0,
+    )
 
     # Kubernetes settings
     k8s_namespace: Optional[str] = Field(
@@ -259,6 +265,19 @@ class SandboxManagerEnvConfig(BaseModel):
         description="Redis distributed lock TTL in seconds for reaping.",
         gt=0,
     )
+    heartbeat_parallelism: int = Field(
+        default=8,
+        description="Max worker threads that lock and reap expired "
+        "sessions during one heartbeat scan.",
+        ge=1,
+    )
+    heartbeat_full_scan_every: int = Field(
+        default=60,
+        description="In Redis mode, walk every session on one heartbeat "
+        "scan out of this many; the others only check sessions the "
+        "heartbeat index reports as idle.",
+        ge=1,
+    )
     watcher_scan_interval: int = Field(
         default=1,
         description=(
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 # pylint:disable=unused-variable, redefined-outer-name, protected-access
+import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
 
@@ -45,6 +46,18 @@ def _make_temp_project(tmp_path: Path) -> Path:
     return project_dir
 
 
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory) -> Path:
+    """Build the sample user project once per session."""
+    return _make_temp_project(tmp_path_factory.mktemp("agentrun_tmpl"))
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, _project_template: Path) -> Path:
+    """Provide a private copy of the sample user project."""
+    return Path(shutil.copytree(_project_template, tmp_path / "user_app"))
+
+
 @pytest.fixture
 def mock_agentrun_config():
     """Provide a valid AgentRunConfig for testing."""
@@ -71,13 +84,12 @@ def mock_oss_config():
 
 @pytest.mark.asyncio
 async def test_deploy_build_only_generates_wheel_without_upload(
+    project_dir: Path,
     tmp_path: Path,
     mock_agentrun_config: AgentRunConfig,
     mock_oss_config: OSSConfig,
 ):
     """Test deploy with skip_upload=True generates wheel without uploading."""
-    project_dir = _make_temp_project(tmp_path)
-
     # Stub wrapper generation and wheel build
     wrapper_dir = tmp_path / "wrapper"
     wrapper_dir.mkdir()
@@ -124,7 +136,10 @@ async def test_deploy_build_only_generates_wheel_without_upload(
     args, kwargs = gen_mock.call_args
     assert kwargs["deploy_name"] == "my-deploy"
     assert kwargs["start_cmd"] == "python app.py"
-    build_mock.assert_called_once_with(wrapper_dir)
+    build_mock.assert_called_once_with(
+        wrapper_dir,
+        isolated=False,
+    )
     docker_mock.assert_called_once()
     # When skip_upload=True, should NOT upload to OSS
     upload_mock.assert_not_called()
@@ -138,13 +153,12 @@ async def test_deploy_build_only_generates_wheel_without_upload(
 
 @pytest.mark.asyncio
 async def test_deploy_with_upload_calls_cloud_methods(
+    project_dir: Path,
     tmp_path: Path,
     mock_agentrun_config: AgentRunConfig,
     mock_oss_config: OSSConfig,
 ):
     """Test deploy without skip_upload calls cloud deployment methods."""
-    project_dir = _make_temp_project(tmp_path)
-
     wrapper_dir = tmp_path / "wrapper2"
     wrapper_dir.mkdir()
     fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
@@ -203,7 +217,10 @@ async def test_deploy_with_upload_calls_cloud_methods(
 
     # Build path asserted
     gen_mock.assert_called_once()
-    build_mock.assert_called_once_with(wrapper_dir)
+    build_mock.assert_called_once_with(
+        wrapper_dir,
+        isolated=False,
+    )
     docker_mock.assert_called_once()
 
     # Cloud interactions asserted
@@ -218,12 +235,12 @@ async def test_deploy_with_upload_calls_cloud_methods(
 
 @pytest.mark.asyncio
 async def test_deploy_with_external_wheel(
+    project_dir: Path,
     tmp_path: Path,
     mock_agentrun_config: AgentRunConfig,
     mock_oss_config: OSSConfig,
 ):
     """Test deploy with external_whl_path skips building wheel."""
-    project_dir = _make_temp_project(tmp_path)
     external_wheel = tmp_path / "external.whl"
     external_wheel.write_bytes(b"external-wheel")
 
@@ -702,13 +719,12 @@ def test_endpoint_config():
 
 @pytest.mark.asyncio
 async def test_deploy_with_environment_variables(
+    project_dir: Path,
     tmp_path: Path,
     mock_agentrun_config: AgentRunConfig,
     mock_oss_config: OSSConfig,
 ):
     """Test deploy with custom environment variables."""
-    project_dir = _make_temp_project(tmp_path)
-
     wrapper_dir = tmp_path / "wrapper"
     wrapper_dir.mkdir()
     fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 # pylint:disable=unused-variable, redefined-outer-name, protected-access
+import asyncio
+import json
+import os
+import shutil
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import patch, MagicMock, AsyncMock
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock, AsyncMock
 
 import pytest
 
 # Try to import the FC deployer, skip all tests if not available
 try:
+    from alibabacloud_fc20230330 import models as fc_models
+    from agentscope_runtime.engine.deployers import fc_deployer
     from agentscope_runtime.engine.deployers.fc_deployer import (
         FCDeployManager,
         FCConfig,
@@ -15,17 +24,21 @@ try:
         VPCConfig,
         CodeConfig,
     )
+    from agentscope_runtime.engine.deployers.state import Deployment
 
     FC_AVAILABLE = True
 except ImportError:
     FC_AVAILABLE = False
     # Create dummy classes for type hints
+    fc_models = None  # type: ignore
+    fc_deployer = None  # type: ignore
     FCDeployManager = None  # type: ignore
     FCConfig = None  # type: ignore
     OSSConfig = None  # type: ignore
     LogConfig = None  # type: ignore
     VPCConfig = None  # type: ignore
     CodeConfig = None  # type: ignore
+    Deployment = None  # type: ignore
 
 pytestmark = pytest.mark.skipif(
     not FC_AVAILABLE,
@@ -33,6 +46,24 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+_FC_RESPONSES_PATH = Path(__file__).parent / "assets" / "fc_responses.json"
+
+
+@lru_cache(maxsize=None)
+def _load_fc_responses() -> Dict[str, dict]:
+    with _FC_RESPONSES_PATH.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _fc_response(name: str, model_cls):
+    """Replay a recorded FC API response through the SDK response model."""
+    return model_cls().from_map(_load_fc_responses()[name])
+
+
+def _raise_api_error(*_args, **_kwargs):
+    raise Exception("API Error")  # pylint: disable=broad-exception-raised
+
+
 def _make_temp_project(tmp_path: Path) -> Path:
     """Create a minimal temporary project for testing."""
     project_dir = tmp_path / "user_app"
@@ -68,15 +99,132 @@ def mock_oss_config():
     )
 
 
-@pytest.mark.asyncio
-async def test_deploy_build_only_generates_wheel_without_upload(
+class InMemoryStateManager:
+    """Dict-backed stand-in for ``DeploymentStateManager``."""
+
+    def __init__(self):
+        self._deployments: Dict[str, Deployment] = {}
+
+    def save(self, deployment: Deployment) -> None:
+        self._deployments[deployment.id] = deployment
+
+    def get(self, deploy_id: str) -> Optional[Deployment]:
+        return self._deployments.get(deploy_id)
+
+    def list(self, status=None, platform=None) -> List[Deployment]:
+        return [
+            d
+            for d in self._deployments.values()
+            if (not status or d.status == status)
+            and (not platform or d.platform == platform)
+        ]
+
+    def update_status(self, deploy_id: str, status: str) -> None:
+        if deploy_id not in self._deployments:
+            raise KeyError(f"Deployment not found: {deploy_id}")
+        self._deployments[deploy_id].status = status
+
+    def remove(self, deploy_id: str) -> None:
+        if deploy_id not in self._deployments:
+            raise KeyError(f"Deployment not found: {deploy_id}")
+        del self._deployments[deploy_id]
+
+    def exists(self, deploy_id: str) -> bool:
+        return deploy_id in self._deployments
+
+
+@pytest.fixture
+def in_memory_state():
+    """Provide a state manager that never touches the file system."""
+    return InMemoryStateManager()
+
+
+@pytest.fixture(scope="session")
+def _fc_template_project(tmp_path_factory):
+    """Build the sample user project once per session."""
+    return _make_temp_project(tmp_path_factory.mktemp("fc_tmpl"))
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, _fc_template_project: Path) -> Path:
+    """Provide a private copy of the sample user project."""
+    return Path(shutil.copytree(_fc_template_project, tmp_path / "user_app"))
+
+
+@pytest.fixture
+def deployer(
     tmp_path: Path,
     mock_fc_config: FCConfig,
     mock_oss_config: OSSConfig,
+    in_memory_state: InMemoryStateManager,
 ):
-    """Test deploy with skip_upload=True generates wheel without uploading."""
-    project_dir = _make_temp_project(tmp_path)
+    """Provide an FCDeployManager with a private build root and state."""
+    return FCDeployManager(
+        oss_config=mock_oss_config,
+        fc_config=mock_fc_config,
+        build_root=tmp_path / "b",
+        state_manager=in_memory_state,
+    )
+
+
+_FC_MODULE = "agentscope_runtime.engine.deployers.fc_deployer"
+
 
+def _async_stub(return_value=None):
+    """Build a bare coroutine stub that records its calls.
+
+    Cheaper than ``AsyncMock`` for tests that only need a return value
+    and a call count.
+    """
+
+    async def _stub(*args, **kwargs):
+        _stub.calls.append((args, kwargs))
+        return return_value
+
+    _stub.calls = []
+    return _stub
+
+
+@pytest.fixture
+def fc_patches(mocker):
+    """Patch the build and cloud steps of ``FCDeployManager.deploy``.
+
+    Tests configure return values on the returned namespace instead of
+    stacking their own ``patch(...)`` context managers.
+    """
+    return SimpleNamespace(
+        gen=mocker.patch(f"{_FC_MODULE}.generate_wrapper_project"),
+        build=mocker.patch(f"{_FC_MODULE}.build_wheel"),
+        docker=mocker.patch.object(
+            FCDeployManager,
+            "_build_and_zip_in_docker",
+            new_callable=AsyncMock,
+        ),
+        prepare=mocker.patch.object(
+            FCDeployManager,
+            "_prepare_oss_bucket",
+            new_callable=AsyncMock,
+        ),
+        upload=mocker.patch.object(
+            FCDeployManager,
+            "_upload_to_fixed_oss_bucket",
+            new_callable=AsyncMock,
+        ),
+        deploy_fc=mocker.patch.object(
+            FCDeployManager,
+            "deploy_to_fc",
+            new_callable=AsyncMock,
+        ),
+    )
+
+
+async def test_deploy_build_only_generates_wheel_without_upload(
+    project_dir: Path,
+    tmp_path: Path,
+    fc_patches: SimpleNamespace,
+    deployer: FCDeployManager,
+):
+    """Test deploy with skip_upload=True generates wheel without uploading."""
     # Stub wrapper generation and wheel build
     wrapper_dir = tmp_path / "wrapper"
     wrapper_dir.mkdir()
@@ -88,45 +236,30 @@ async def test_deploy_build_only_generates_wheel_without_upload(
     fake_zip = wrapper_dir / "dist" / "my-deploy.zip"
     fake_zip.write_bytes(b"zip-bytes")
 
-    with patch(
-        "agentscope_runtime.engine.deployers.fc_deployer"
-        ".generate_wrapper_project",
-        return_value=(wrapper_dir, wrapper_dir / "dist"),
-    ) as gen_mock, patch(
-        "agentscope_runtime.engine.deployers.fc_deployer.build_wheel",
-        return_value=fake_wheel,
-    ) as build_mock, patch.object(
-        FCDeployManager,
-        "_build_and_zip_in_docker",
-        new_callable=AsyncMock,
-        return_value=fake_zip,
-    ) as docker_mock, patch.object(
-        FCDeployManager,
-        "_upload_to_fixed_oss_bucket",
-        new_callable=AsyncMock,
-        return_value={"bucket_name": "test-bucket", "object_key": "test.zip"},
-    ) as upload_mock:
-        deployer = FCDeployManager(
-            oss_config=mock_oss_config,
-            fc_config=mock_fc_config,
-            build_root=tmp_path / ".b",
-        )
-        result = await deployer.deploy(
-            project_dir=str(project_dir),
-            cmd="python app.py",
-            deploy_name="my-deploy",
-            skip_upload=True,
-        )
+    fc_patches.gen.return_value = (wrapper_dir, wrapper_dir / "dist")
+    fc_patches.build.return_value = fake_wheel
+    fc_patches.docker.return_value = fake_zip
+
+    result = await deployer.deploy(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="my-deploy",
+        skip_upload=True,
+    )
 
     # Assertions
-    gen_mock.assert_called_once()
-    args, kwargs = gen_mock.call_args
+    fc_patches.gen.assert_called_once()
+    args, kwargs = fc_patches.gen.call_args
     assert kwargs["deploy_name"] == "my-deploy"
     assert kwargs["start_cmd"] == "python app.py"
-    build_mock.assert_called_once_with(wrapper_dir)
-    docker_mock.assert_called_once()
+    fc_patches.build.assert_called_once_with(
+        wrapper_dir,
+        isolated=False,
+    )
+    fc_patches.docker.assert_called_once()
     # When skip_upload=True, should NOT upload to OSS
-    upload_mock.assert_not_called()
+    fc_patches.prepare.assert_not_called()
+    fc_patches.upload.assert_not_called()
 
     assert (
         result["message"]
@@ -135,15 +268,45 @@ async def test_deploy_build_only_generates_wheel_without_upload(
     assert result["deploy_name"] == "my-deploy"
 
 
-@pytest.mark.asyncio
+async def test_client_not_built_when_skip_upload(
+    project_dir: Path,
+    tmp_path: Path,
+    fc_patches: SimpleNamespace,
+    deployer: FCDeployManager,
+):
+    """Test the FC client is only created on first use."""
+    wrapper_dir = tmp_path / "wrapper"
+    (wrapper_dir / "dist").mkdir(parents=True)
+    fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
+    fake_wheel.write_bytes(b"wheel-bytes")
+    fake_zip = wrapper_dir / "dist" / "my-deploy.zip"
+    fake_zip.write_bytes(b"zip-bytes")
+
+    fc_patches.gen.return_value = (wrapper_dir, wrapper_dir / "dist")
+    fc_patches.build.return_value = fake_wheel
+    fc_patches.docker.return_value = fake_zip
+
+    await deployer.deploy(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="my-deploy",
+        skip_upload=True,
+    )
+
+    assert "client" not in deployer.__dict__
+    client = deployer.client
+    assert "client" in deployer.__dict__
+    assert deployer.client is client
+
+
 async def test_deploy_with_upload_calls_cloud_methods(
+    project_dir: Path,
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    fc_patches: SimpleNamespace,
+    in_memory_state: InMemoryStateManager,
+    deployer: FCDeployManager,
 ):
     """Test deploy without skip_upload calls cloud deployment methods."""
-    project_dir = _make_temp_project(tmp_path)
-
     wrapper_dir = tmp_path / "wrapper2"
     wrapper_dir.mkdir()
     fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
@@ -157,118 +320,227 @@ async def test_deploy_with_upload_calls_cloud_methods(
     mock_function_name = "test-function"
     mock_endpoint_url = "http://test-endpoint.example.com"
 
-    with patch(
-        "agentscope_runtime.engine.deployers.fc_deployer"
-        ".generate_wrapper_project",
-        return_value=(wrapper_dir, wrapper_dir / "dist"),
-    ) as gen_mock, patch(
-        "agentscope_runtime.engine.deployers.fc_deployer.build_wheel",
-        return_value=fake_wheel,
-    ) as build_mock, patch.object(
-        FCDeployManager,
-        "_build_and_zip_in_docker",
-        new_callable=AsyncMock,
-        return_value=fake_zip,
-    ) as docker_mock, patch.object(
-        FCDeployManager,
-        "_upload_to_fixed_oss_bucket",
-        new_callable=AsyncMock,
-        return_value={
-            "bucket_name": "test-bucket",
-            "object_key": "test-path.zip",
-            "presigned_url": "http://presigned.url",
-        },
-    ) as upload_mock, patch.object(
-        FCDeployManager,
-        "deploy_to_fc",
-        new_callable=AsyncMock,
-        return_value={
-            "success": True,
-            "function_name": mock_function_name,
-            "endpoint_internet_url": mock_endpoint_url,
-            "endpoint_intranet_url": "http://intranet.example.com",
-        },
-    ) as deploy_mock:
-        deployer = FCDeployManager(
-            oss_config=mock_oss_config,
-            fc_config=mock_fc_config,
-            build_root=tmp_path / ".b2",
-        )
-        # Mock state_manager to avoid file system operations
-        deployer.state_manager.save = MagicMock()
+    fc_patches.gen.return_value = (wrapper_dir, wrapper_dir / "dist")
+    fc_patches.build.return_value = fake_wheel
+    fc_patches.docker.return_value = fake_zip
+    fc_patches.upload.return_value = {
+        "bucket_name": "test-bucket",
+        "object_key": "test-path.zip",
+        "presigned_url": "http://presigned.url",
+    }
+    fc_patches.deploy_fc.return_value = {
+        "success": True,
+        "function_name": mock_function_name,
+        "endpoint_internet_url": mock_endpoint_url,
+        "endpoint_intranet_url": "http://intranet.example.com",
+    }
 
-        result = await deployer.deploy(
-            project_dir=str(project_dir),
-            cmd="python app.py",
-            deploy_name="upload-deploy",
-            skip_upload=False,
-        )
+    result = await deployer.deploy(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="upload-deploy",
+        skip_upload=False,
+    )
 
     # Build path asserted
-    gen_mock.assert_called_once()
-    build_mock.assert_called_once_with(wrapper_dir)
-    docker_mock.assert_called_once()
+    fc_patches.gen.assert_called_once()
+    fc_patches.build.assert_called_once_with(
+        wrapper_dir,
+        isolated=False,
+    )
+    fc_patches.docker.assert_called_once()
 
     # Cloud interactions asserted
-    upload_mock.assert_called_once()
-    deploy_mock.assert_called_once()
+    fc_patches.prepare.assert_called_once_with("test-bucket")
+    fc_patches.upload.assert_called_once()
+    assert (
+        fc_patches.upload.call_args.kwargs["oss_client"]
+        is fc_patches.prepare.return_value
+    )
+    fc_patches.deploy_fc.assert_called_once()
 
     # Result fields
     assert result["message"] == "Agent deployed successfully to FC"
     assert result["function_name"] == mock_function_name
     assert result["endpoint_url"] == mock_endpoint_url
+    assert in_memory_state.get(result["deploy_id"]).status == "running"
 
 
-@pytest.mark.asyncio
-async def test_deploy_with_external_wheel(
+async def test_deploy_overlaps_build_and_bucket_prep(
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    mocker,
+    deployer: FCDeployManager,
 ):
-    """Test deploy with external_whl_path skips building wheel."""
-    project_dir = _make_temp_project(tmp_path)
-    external_wheel = tmp_path / "external.whl"
-    external_wheel.write_bytes(b"external-wheel")
-
-    fake_zip = tmp_path / "external-deploy.zip"
+    """Test the docker build and OSS bucket preparation run concurrently."""
+    external_wheel = tmp_path / "overlap.whl"
+    external_wheel.write_bytes(b"overlap-wheel")
+    fake_zip = tmp_path / "overlap.zip"
     fake_zip.write_bytes(b"zip-bytes")
 
-    with patch(
-        "agentscope_runtime.engine.deployers.fc_deployer"
-        ".generate_wrapper_project",
-    ) as gen_mock, patch(
-        "agentscope_runtime.engine.deployers.fc_deployer.build_wheel",
-    ) as build_mock, patch.object(
-        FCDeployManager,
-        "_build_and_zip_in_docker",
-        new_callable=AsyncMock,
-        return_value=fake_zip,
-    ) as docker_mock, patch.object(
+    build_started = asyncio.Event()
+    prepare_started = asyncio.Event()
+
+    async def _build(*_args, **_kwargs):
+        build_started.set()
+        # Only completes if bucket preparation starts before build ends
+        await asyncio.wait_for(prepare_started.wait(), timeout=5)
+        return fake_zip
+
+    async def _prepare(*_args, **_kwargs):
+        prepare_started.set()
+        await asyncio.wait_for(build_started.wait(), timeout=5)
+        return MagicMock()
+
+    upload = _async_stub(
+        {"bucket_name": "test-bucket", "object_key": "overlap.zip"},
+    )
+    mocker.patch.object(FCDeployManager, "_build_and_zip_in_docker", _build)
+    mocker.patch.object(FCDeployManager, "_prepare_oss_bucket", _prepare)
+    mocker.patch.object(FCDeployManager, "_upload_to_fixed_oss_bucket", upload)
+    mocker.patch.object(
         FCDeployManager,
-        "_upload_to_fixed_oss_bucket",
-        new_callable=AsyncMock,
-        return_value={"bucket_name": "test-bucket", "object_key": "test.zip"},
-    ) as upload_mock:
-        deployer = FCDeployManager(
-            oss_config=mock_oss_config,
-            fc_config=mock_fc_config,
-            build_root=tmp_path / ".b3",
+        "deploy_to_fc",
+        _async_stub({"success": True, "function_name": "overlap-function"}),
+    )
+
+    result = await deployer.deploy(
+        external_whl_path=str(external_wheel),
+        deploy_name="overlap",
+    )
+
+    assert result["function_name"] == "overlap-function"
+    assert len(upload.calls) == 1
+
+
+async def test_deploy_cancels_build_when_bucket_prep_fails(
+    tmp_path: Path,
+    mocker,
+    deployer: FCDeployManager,
+):
+    """Test a failed bucket preparation cancels the concurrent build."""
+    external_wheel = tmp_path / "failing.whl"
+    external_wheel.write_bytes(b"failing-wheel")
+    build_cancelled = asyncio.Event()
+
+    async def _build(*_args, **_kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            build_cancelled.set()
+            raise
+
+    async def _prepare(*_args, **_kwargs):
+        raise RuntimeError("bucket unavailable")
+
+    mocker.patch.object(FCDeployManager, "_build_and_zip_in_docker", _build)
+    mocker.patch.object(FCDeployManager, "_prepare_oss_bucket", _prepare)
+
+    with pytest.raises(RuntimeError, match="bucket unavailable"):
+        await deployer.deploy(
+            external_whl_path=str(external_wheel),
+            deploy_name="failing",
         )
+
+    assert build_cancelled.is_set()
+
+
+async def test_deploy_reuses_cached_artifacts(
+    project_dir: Path,
+    tmp_path: Path,
+    fc_patches: SimpleNamespace,
+    mocker,
+    deployer: FCDeployManager,
+):
+    """Test redeploying an unchanged project skips wheel and docker build."""
+    wrapper_dir = tmp_path / "wrapper"
+    fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
+    fake_wheel.parent.mkdir(parents=True)
+    fake_wheel.write_bytes(b"wheel-bytes")
+    fake_zip = wrapper_dir / "dist" / "cached-deploy.zip"
+    fake_zip.write_bytes(b"zip-bytes")
+
+    fc_patches.gen.return_value = (wrapper_dir, wrapper_dir / "dist")
+    fc_patches.build.return_value = fake_wheel
+    docker = _async_stub(fake_zip)
+    mocker.patch.object(FCDeployManager, "_build_and_zip_in_docker", docker)
+
+    for _ in range(2):
         result = await deployer.deploy(
             project_dir=str(project_dir),
             cmd="python app.py",
-            deploy_name="external-deploy",
+            deploy_name="cached-deploy",
             skip_upload=True,
-            external_whl_path=str(external_wheel),
         )
+        assert result["deploy_name"] == "cached-deploy"
+
+    assert fc_patches.build.call_count == 1
+    assert len(docker.calls) == 1
+
+    # Changing the project invalidates the cache
+    (project_dir / "app.py").write_text("print('changed')\n")
+    await deployer.deploy(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="cached-deploy",
+        skip_upload=True,
+    )
+    assert len(docker.calls) == 2
+
+
+def test_artifact_cache_evicts_least_recently_used(
+    tmp_path: Path,
+    monkeypatch,
+    deployer: FCDeployManager,
+):
+    """Test the artifact cache keeps only the most recently used digests."""
+    monkeypatch.setattr(fc_deployer, "_ARTIFACT_CACHE_MAX_ENTRIES", 2)
+    wheel = tmp_path / "pkg-0.0.1-py3-none-any.whl"
+    wheel.write_bytes(b"wheel-bytes")
+    zip_file = tmp_path / "pkg.zip"
+    zip_file.write_bytes(b"zip-bytes")
+    cache_dir = deployer.build_root / ".artifact_cache"
+
+    for mtime, digest in enumerate(("a", "b")):
+        deployer._store_cached_artifacts(digest, wheel, zip_file)
+        os.utime(cache_dir / digest, (mtime, mtime))
+
+    # A hit refreshes "a", so storing "c" evicts "b"
+    assert deployer._lookup_cached_artifacts("a") is not None
+    deployer._store_cached_artifacts("c", wheel, zip_file)
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["a", "c"]
+
+
+async def test_deploy_with_external_wheel(
+    project_dir: Path,
+    tmp_path: Path,
+    fc_patches: SimpleNamespace,
+    deployer: FCDeployManager,
+):
+    """Test deploy with external_whl_path skips building wheel."""
+    external_wheel = tmp_path / "external.whl"
+    external_wheel.write_bytes(b"external-wheel")
+
+    fake_zip = tmp_path / "external-deploy.zip"
+    fake_zip.write_bytes(b"zip-bytes")
+
+    fc_patches.docker.return_value = fake_zip
+
+    result = await deployer.deploy(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="external-deploy",
+        skip_upload=True,
+        external_whl_path=str(external_wheel),
+    )
 
     # Should not generate wrapper or build when external wheel is provided
-    gen_mock.assert_not_called()
-    build_mock.assert_not_called()
+    fc_patches.gen.assert_not_called()
+    fc_patches.build.assert_not_called()
     # But should still create zip in docker
-    docker_mock.assert_called_once()
+    fc_patches.docker.assert_called_once()
     # When skip_upload=True, should NOT upload to OSS
-    upload_mock.assert_not_called()
+    fc_patches.upload.assert_not_called()
 
     assert (
         result["message"]
@@ -277,19 +549,11 @@ async def test_deploy_with_external_wheel(
     assert result["deploy_name"] == "external-deploy"
 
 
-@pytest.mark.asyncio
 async def test_deploy_invalid_inputs_raise(
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    deployer: FCDeployManager,
 ):
     """Test that invalid inputs raise appropriate errors."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b4",
-    )
-
     # Missing runner, project_dir, and external_whl_path
     with pytest.raises(
         ValueError,
@@ -309,11 +573,10 @@ async def test_deploy_invalid_inputs_raise(
         )
 
 
-@pytest.mark.asyncio
 async def test_deploy_with_function_name_updates_existing(
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    fc_patches: SimpleNamespace,
+    deployer: FCDeployManager,
 ):
     """Test deploy with function_name and external
     wheel updates existing function."""
@@ -325,96 +588,53 @@ async def test_deploy_with_function_name_updates_existing(
 
     mock_function_name = "existing-function"
 
-    with patch.object(
-        FCDeployManager,
-        "_build_and_zip_in_docker",
-        new_callable=AsyncMock,
-        return_value=fake_zip,
-    ) as docker_mock, patch.object(
-        FCDeployManager,
-        "_upload_to_fixed_oss_bucket",
-        new_callable=AsyncMock,
-        return_value={
-            "bucket_name": "test-bucket",
-            "object_key": "test-path.zip",
-            "presigned_url": "http://presigned.url",
-        },
-    ) as upload_mock, patch.object(
-        FCDeployManager,
-        "deploy_to_fc",
-        new_callable=AsyncMock,
-        return_value={
-            "success": True,
-            "function_name": mock_function_name,
-            "endpoint_internet_url": "http://test.example.com",
-            "endpoint_intranet_url": "http://intranet.example.com",
-        },
-    ) as deploy_mock:
-        deployer = FCDeployManager(
-            oss_config=mock_oss_config,
-            fc_config=mock_fc_config,
-            build_root=tmp_path / ".b5",
-        )
-        # Mock state_manager to avoid file system operations
-        deployer.state_manager.save = MagicMock()
+    fc_patches.docker.return_value = fake_zip
+    fc_patches.upload.return_value = {
+        "bucket_name": "test-bucket",
+        "object_key": "test-path.zip",
+        "presigned_url": "http://presigned.url",
+    }
+    fc_patches.deploy_fc.return_value = {
+        "success": True,
+        "function_name": mock_function_name,
+        "endpoint_internet_url": "http://test.example.com",
+        "endpoint_intranet_url": "http://intranet.example.com",
+    }
 
-        result = await deployer.deploy(
-            function_name=mock_function_name,
-            external_whl_path=str(external_wheel),
-            skip_upload=False,
-        )
+    result = await deployer.deploy(
+        function_name=mock_function_name,
+        external_whl_path=str(external_wheel),
+        skip_upload=False,
+    )
 
     # Should create zip, upload and deploy
-    docker_mock.assert_called_once()
-    upload_mock.assert_called_once()
-    deploy_mock.assert_called_once()
+    fc_patches.docker.assert_called_once()
+    fc_patches.upload.assert_called_once()
+    fc_patches.deploy_fc.assert_called_once()
 
     # Check that function_name was passed
-    call_kwargs = deploy_mock.call_args[1]
+    call_kwargs = fc_patches.deploy_fc.call_args[1]
     assert call_kwargs.get("function_name") == mock_function_name
 
     assert result["message"] == "Agent deployed successfully to FC"
     assert result["function_name"] == mock_function_name
 
 
-@pytest.mark.asyncio
 async def test_deploy_to_fc_create_new_function(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test creating a new FC function."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b6",
-    )
-
-    # Mock the client methods
-    mock_response = MagicMock()
-    mock_response.body = MagicMock()
-    mock_response.body.function_name = "new-function"
-    mock_response.body.runtime = "custom.debian11"
-    mock_response.body.created_time = "2025-01-01T00:00:00Z"
-
     deployer.client.create_function_with_options = MagicMock(
-        return_value=mock_response,
+        return_value=_fc_response(
+            "create_function",
+            fc_models.CreateFunctionResponse,
+        ),
     )
-
-    # Mock trigger creation
-    mock_trigger_response = MagicMock()
-    mock_trigger_response.body = MagicMock()
-    mock_trigger_response.body.http_trigger = MagicMock()
-    mock_trigger_response.body.http_trigger.url_internet = (
-        "http://internet.example.com"
-    )
-    mock_trigger_response.body.http_trigger.url_intranet = (
-        "http://intranet.example.com"
-    )
-    mock_trigger_response.body.trigger_id = "trigger-123"
-
     deployer.client.create_trigger_with_options = MagicMock(
-        return_value=mock_trigger_response,
+        return_value=_fc_response(
+            "create_trigger",
+            fc_models.CreateTriggerResponse,
+        ),
     )
 
     result = await deployer.deploy_to_fc(
@@ -425,48 +645,26 @@ async def test_deploy_to_fc_create_new_function(
 
     assert result["success"] is True
     assert result["function_name"] == "new-function"
+    assert result["endpoint_internet_url"] == "http://internet.example.com"
     deployer.client.create_function_with_options.assert_called_once()
     deployer.client.create_trigger_with_options.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_deploy_to_fc_update_existing_function(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test updating an existing FC function."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b7",
-    )
-
-    # Mock the client methods
-    mock_response = MagicMock()
-    mock_response.body = MagicMock()
-    mock_response.body.function_name = "existing-function"
-    mock_response.body.runtime = "custom.debian11"
-    mock_response.body.created_time = "2025-01-01T00:00:00Z"
-
     deployer.client.update_function_with_options = MagicMock(
-        return_value=mock_response,
+        return_value=_fc_response(
+            "update_function",
+            fc_models.UpdateFunctionResponse,
+        ),
     )
-
-    # Mock trigger retrieval
-    mock_trigger_response = MagicMock()
-    mock_trigger_response.body = MagicMock()
-    mock_trigger_response.body.http_trigger = MagicMock()
-    mock_trigger_response.body.http_trigger.url_internet = (
-        "http://internet.example.com"
-    )
-    mock_trigger_response.body.http_trigger.url_intranet = (
-        "http://intranet.example.com"
-    )
-    mock_trigger_response.body.trigger_id = "trigger-123"
-
     deployer.client.get_trigger_with_options = MagicMock(
-        return_value=mock_trigger_response,
+        return_value=_fc_response(
+            "get_trigger",
+            fc_models.GetTriggerResponse,
+        ),
     )
 
     result = await deployer.deploy_to_fc(
@@ -481,19 +679,10 @@ async def test_deploy_to_fc_update_existing_function(
     deployer.client.update_function_with_options.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_delete_function(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test deleting an FC function."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b8",
-    )
-
     # Mock the client delete methods
     deployer.client.delete_trigger_with_options = MagicMock()
     deployer.client.delete_function_with_options = MagicMock()
@@ -506,19 +695,10 @@ async def test_delete_function(
     deployer.client.delete_function_with_options.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_delete_function_handles_error(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test delete handles errors gracefully."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b9",
-    )
-
     # Mock the client to raise an exception
     deployer.client.delete_trigger_with_options = MagicMock()
     deployer.client.delete_function_with_options = MagicMock(
@@ -531,6 +711,66 @@ async def test_delete_function_handles_error(
     assert "Function not found" in result["message"]
 
 
+async def test_upload_uses_parallel_multipart_uploader(
+    tmp_path: Path,
+    deployer: FCDeployManager,
+):
+    """Test the zip is streamed to OSS through the multipart uploader."""
+    zip_path = tmp_path / "big.zip"
+    zip_path.write_bytes(b"zip-bytes")
+
+    oss_client = MagicMock()
+    oss_client.presign.return_value.url = "http://presigned.url"
+
+    result = await deployer._upload_to_fixed_oss_bucket(
+        zip_file_path=zip_path,
+        bucket_name="test-bucket",
+        oss_client=oss_client,
+    )
+
+    oss_client.put_object.assert_not_called()
+    oss_client.uploader.assert_called_once_with(
+        part_size=fc_deployer.OSS_UPLOAD_PART_SIZE,
+        parallel_num=fc_deployer.OSS_UPLOAD_PARALLEL_NUM,
+    )
+    upload_file = oss_client.uploader.return_value.upload_file
+    upload_file.assert_called_once()
+    assert upload_file.call_args.kwargs["filepath"] == str(zip_path)
+    assert result == {
+        "bucket_name": "test-bucket",
+        "object_key": "big.zip",
+        "presigned_url": "http://presigned.url",
+    }
+
+
+async def test_zip_assembled_on_container_local_disk(
+    tmp_path: Path,
+    mocker,
+    deployer: FCDeployManager,
+):
+    """Test the zip is built under /tmp and moved to /output at the end."""
+    wheel_path = tmp_path / "pkg-0.1.0-py3-none-any.whl"
+    wheel_path.write_bytes(b"wheel")
+    output_dir = tmp_path / "out"
+
+    def fake_run(_cmd, **_kwargs):
+        (output_dir / "pkg.zip").write_bytes(b"zip")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    run = mocker.patch("subprocess.run", side_effect=fake_run)
+
+    zip_path = await deployer._build_and_zip_in_docker(
+        wheel_path=wheel_path,
+        output_dir=output_dir,
+        zip_filename="pkg.zip",
+    )
+
+    build_script = run.call_args.args[0][-1]
+    assert 'zip_path = Path("/tmp/pkg.zip")' in build_script
+    assert "mv /tmp/pkg.zip /output/pkg.zip" in build_script
+    assert zip_path == output_dir / "pkg.zip"
+
+
 def test_fc_config_from_env(monkeypatch: pytest.MonkeyPatch):
     """Test loading FCConfig from environment variables."""
     monkeypatch.setenv("ALIBABA_CLOUD_ACCESS_KEY_ID", "test_ak")
@@ -584,6 +824,39 @@ def test_fc_config_from_env_with_vpc_config(monkeypatch: pytest.MonkeyPatch):
     assert config.vpc_config.vswitch_ids == ["vsw-1", "vsw-2"]
 
 
+def test_fc_config_from_env_with_comma_separated_vswitches(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test FC_VSWITCH_IDS also accepts a comma-separated list."""
+    monkeypatch.setenv("FC_VPC_ID", "vpc-123")
+    monkeypatch.setenv("FC_SECURITY_GROUP_ID", "sg-456")
+    monkeypatch.setenv("FC_VSWITCH_IDS", "vsw-1, vsw-2,")
+
+    config = FCConfig.from_env()
+
+    assert config.vpc_config.vswitch_ids == ["vsw-1", "vsw-2"]
+
+
+def test_fc_config_from_env_is_memoized(monkeypatch: pytest.MonkeyPatch):
+    """Test FCConfig.from_env caches on env values and returns copies."""
+    monkeypatch.setenv("FC_ACCOUNT_ID", "test_account")
+    monkeypatch.setenv("FC_VPC_ID", "vpc-123")
+    monkeypatch.setenv("FC_SECURITY_GROUP_ID", "sg-456")
+    monkeypatch.setenv("FC_VSWITCH_IDS", '["vsw-1"]')
+
+    first = FCConfig.from_env()
+    first.vpc_config.vswitch_ids.append("vsw-mutated")
+    second = FCConfig.from_env()
+
+    # Mutating a returned config must not leak into the cache
+    assert first is not second
+    assert second.vpc_config.vswitch_ids == ["vsw-1"]
+
+    # Changing the environment yields a freshly parsed config
+    monkeypatch.setenv("FC_ACCOUNT_ID", "other_account")
+    assert FCConfig.from_env().account_id == "other_account"
+
+
 def test_fc_config_ensure_valid():
     """Test FCConfig validation."""
     # Valid config
@@ -693,15 +966,13 @@ def test_code_config():
     assert code_config.oss_object_name == "test-object"
 
 
-@pytest.mark.asyncio
 async def test_deploy_with_environment_variables(
+    project_dir: Path,
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    fc_patches: SimpleNamespace,
+    deployer: FCDeployManager,
 ):
     """Test deploy with custom environment variables."""
-    project_dir = _make_temp_project(tmp_path)
-
     wrapper_dir = tmp_path / "wrapper"
     wrapper_dir.mkdir()
     fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
@@ -716,36 +987,17 @@ async def test_deploy_with_environment_variables(
         "DEBUG": "true",
     }
 
-    with patch(
-        "agentscope_runtime.engine.deployers.fc_deployer"
-        ".generate_wrapper_project",
-        return_value=(wrapper_dir, wrapper_dir / "dist"),
-    ), patch(
-        "agentscope_runtime.engine.deployers.fc_deployer.build_wheel",
-        return_value=fake_wheel,
-    ), patch.object(
-        FCDeployManager,
-        "_build_and_zip_in_docker",
-        new_callable=AsyncMock,
-        return_value=fake_zip,
-    ), patch.object(
-        FCDeployManager,
-        "_upload_to_fixed_oss_bucket",
-        new_callable=AsyncMock,
-        return_value={"bucket_name": "test-bucket", "object_key": "test.zip"},
-    ):
-        deployer = FCDeployManager(
-            oss_config=mock_oss_config,
-            fc_config=mock_fc_config,
-            build_root=tmp_path / ".b10",
-        )
-        result = await deployer.deploy(
-            project_dir=str(project_dir),
-            cmd="python app.py",
-            deploy_name="env-deploy",
-            skip_upload=True,
-            environment=custom_env,
-        )
+    fc_patches.gen.return_value = (wrapper_dir, wrapper_dir / "dist")
+    fc_patches.build.return_value = fake_wheel
+    fc_patches.docker.return_value = fake_zip
+
+    result = await deployer.deploy(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="env-deploy",
+        skip_upload=True,
+        environment=custom_env,
+    )
 
     # Verify deployment was successful
     assert (
@@ -756,17 +1008,9 @@ async def test_deploy_with_environment_variables(
 
 
 def test_merge_environment_variables(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test _merge_environment_variables method."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b11",
-    )
-
     custom_env = {"MY_VAR": "my_value", "DEBUG": "true"}
     merged = deployer._merge_environment_variables(custom_env)
 
@@ -782,17 +1026,9 @@ def test_merge_environment_variables(
 
 
 def test_merge_environment_variables_empty(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test _merge_environment_variables with no custom variables."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b12",
-    )
-
     merged = deployer._merge_environment_variables(None)
 
     # Check that Python 3.12 paths are included
@@ -801,26 +1037,22 @@ def test_merge_environment_variables_empty(
     assert merged["PYTHON_VERSION"] == "3.12"
 
 
-@pytest.mark.asyncio
 async def test_stop_deployment(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    in_memory_state: InMemoryStateManager,
+    deployer: FCDeployManager,
 ):
     """Test stopping an FC deployment."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b13",
+    in_memory_state.save(
+        Deployment(
+            id="test-deploy-id",
+            platform="fc",
+            url="http://console.example.com",
+            agent_source="app.py",
+            created_at="2025-01-01T00:00:00Z",
+            config={"resource_name": "test-function"},
+        ),
     )
 
-    # Mock state manager
-    mock_deployment = MagicMock()
-    mock_deployment.url = "http://console.example.com"
-    mock_deployment.config = {"resource_name": "test-function"}
-    deployer.state_manager.get = MagicMock(return_value=mock_deployment)
-    deployer.state_manager.update_status = MagicMock()
-
     # Mock the delete method
     deployer.client.delete_trigger_with_options = MagicMock()
     deployer.client.delete_function_with_options = MagicMock()
@@ -828,66 +1060,41 @@ async def test_stop_deployment(
     result = await deployer.stop(deploy_id="test-deploy-id")
 
     assert result["success"] is True
-    deployer.state_manager.update_status.assert_called_once_with(
-        "test-deploy-id",
-        "stopped",
-    )
+    assert in_memory_state.get("test-deploy-id").status == "stopped"
 
 
-@pytest.mark.asyncio
 async def test_generate_wrapper_and_build_wheel(
+    project_dir: Path,
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    fc_patches: SimpleNamespace,
+    deployer: FCDeployManager,
 ):
     """Test _generate_wrapper_and_build_wheel method."""
-    project_dir = _make_temp_project(tmp_path)
-
     wrapper_dir = tmp_path / "wrapper"
     wrapper_dir.mkdir()
     fake_wheel = wrapper_dir / "dist" / "pkg-0.0.1-py3-none-any.whl"
     fake_wheel.parent.mkdir(parents=True, exist_ok=True)
     fake_wheel.write_bytes(b"wheel-bytes")
 
-    with patch(
-        "agentscope_runtime.engine.deployers.fc_deployer"
-        ".generate_wrapper_project",
-        return_value=(wrapper_dir, wrapper_dir / "dist"),
-    ) as gen_mock, patch(
-        "agentscope_runtime.engine.deployers.fc_deployer.build_wheel",
-        return_value=fake_wheel,
-    ) as build_mock:
-        deployer = FCDeployManager(
-            oss_config=mock_oss_config,
-            fc_config=mock_fc_config,
-            build_root=tmp_path / ".b14",
-        )
+    fc_patches.gen.return_value = (wrapper_dir, wrapper_dir / "dist")
+    fc_patches.build.return_value = fake_wheel
 
-        wheel_path, name = await deployer._generate_wrapper_and_build_wheel(
-            project_dir=str(project_dir),
-            cmd="python app.py",
-            deploy_name="test-deploy",
-        )
+    wheel_path, name = await deployer._generate_wrapper_and_build_wheel(
+        project_dir=str(project_dir),
+        cmd="python app.py",
+        deploy_name="test-deploy",
+    )
 
     assert wheel_path == fake_wheel
     assert name == "test-deploy"
-    gen_mock.assert_called_once()
-    build_mock.assert_called_once()
+    fc_patches.gen.assert_called_once()
+    fc_patches.build.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_generate_wrapper_missing_project_dir(
-    tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    deployer: FCDeployManager,
 ):
     """Test _generate_wrapper_and_build_wheel raises error for missing dir."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b15",
-    )
-
     with pytest.raises(ValueError, match="project_dir and cmd are required"):
         await deployer._generate_wrapper_and_build_wheel(
             project_dir=None,
@@ -895,20 +1102,12 @@ async def test_generate_wrapper_missing_project_dir(
         )
 
 
-@pytest.mark.asyncio
 async def test_generate_wrapper_nonexistent_project_dir(
     tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    deployer: FCDeployManager,
 ):
     """Test _generate_wrapper_and_build_wheel
     raises error for nonexistent dir."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b16",
-    )
-
     with pytest.raises(FileNotFoundError, match="Project directory not found"):
         await deployer._generate_wrapper_and_build_wheel(
             project_dir=str(tmp_path / "nonexistent"),
@@ -916,111 +1115,65 @@ async def test_generate_wrapper_nonexistent_project_dir(
         )
 
 
+@pytest.mark.parametrize(
+    "environment,expected",
+    [
+        (
+            {"API_KEY": "secret", "DEBUG": "true"},
+            ["API_KEY=secret", "DEBUG=true"],
+        ),
+        (
+            {"MESSAGE": "hello world with spaces"},
+            ['MESSAGE="hello world with spaces"'],
+        ),
+        (None, None),
+        ({}, None),
+    ],
+    ids=["plain", "special_chars", "none", "empty"],
+)
 def test_generate_env_file(
-    tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
+    project_dir: Path,
+    deployer: FCDeployManager,
+    environment,
+    expected,
 ):
-    """Test _generate_env_file method."""
-    project_dir = _make_temp_project(tmp_path)
-
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b17",
-    )
-
-    environment = {"API_KEY": "secret", "DEBUG": "true"}
+    """Test _generate_env_file writes quoted values or returns None."""
     env_file_path = deployer._generate_env_file(project_dir, environment)
 
-    assert env_file_path is not None
-    assert env_file_path.exists()
-
-    content = env_file_path.read_text()
-    assert "API_KEY=secret" in content
-    assert "DEBUG=true" in content
-
-
-def test_generate_env_file_with_special_chars(
-    tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-):
-    """Test _generate_env_file handles special characters."""
-    project_dir = _make_temp_project(tmp_path)
-
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b18",
-    )
-
-    environment = {"MESSAGE": "hello world with spaces"}
-    env_file_path = deployer._generate_env_file(project_dir, environment)
+    if expected is None:
+        assert env_file_path is None
+        return
 
     assert env_file_path is not None
+    assert env_file_path.exists()
     content = env_file_path.read_text()
-    assert 'MESSAGE="hello world with spaces"' in content
-
-
-def test_generate_env_file_returns_none_for_empty(
-    tmp_path: Path,
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-):
-    """Test _generate_env_file returns None for empty environment."""
-    project_dir = _make_temp_project(tmp_path)
-
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b19",
-    )
-
-    result = deployer._generate_env_file(project_dir, None)
-    assert result is None
-
-    result = deployer._generate_env_file(project_dir, {})
-    assert result is None
-
+    for line in expected:
+        assert line in content
 
-def test_fc_config_default_values():
-    """Test FCConfig default values."""
-    config = FCConfig()
 
-    assert config.region_id == "cn-hangzhou"
-    assert config.cpu == 2.0
-    assert config.memory == 2048
-    assert config.disk == 512
-    assert config.session_concurrency_limit == 200
-    assert config.session_idle_timeout_seconds == 3600
+def test_default_constants():
+    """Test FCConfig/OSSConfig defaults and the HTTP trigger name."""
+    fc_config = FCConfig()
+    assert fc_config.region_id == "cn-hangzhou"
+    assert fc_config.cpu == 2.0
+    assert fc_config.memory == 2048
+    assert fc_config.disk == 512
+    assert fc_config.session_concurrency_limit == 200
+    assert fc_config.session_idle_timeout_seconds == 3600
 
+    oss_config = OSSConfig(bucket_name="test-bucket")
+    assert oss_config.region == "cn-hangzhou"
+    assert oss_config.bucket_name == "test-bucket"
 
-def test_oss_config_default_values():
-    """Test OSSConfig default values."""
-    config = OSSConfig(bucket_name="test-bucket")
-
-    assert config.region == "cn-hangzhou"
-    assert config.bucket_name == "test-bucket"
+    assert FCDeployManager.HTTP_TRIGGER_NAME == "agentscope-runtime-trigger"
 
 
-@pytest.mark.asyncio
 async def test_deploy_to_fc_handles_exception(
-    mock_fc_config: FCConfig,
-    mock_oss_config: OSSConfig,
-    tmp_path: Path,
+    deployer: FCDeployManager,
 ):
     """Test deploy_to_fc handles exceptions gracefully."""
-    deployer = FCDeployManager(
-        oss_config=mock_oss_config,
-        fc_config=mock_fc_config,
-        build_root=tmp_path / ".b20",
-    )
-
-    # Mock the client to raise an exception
-    deployer.client.create_function_with_options = MagicMock(
-        side_effect=Exception("API Error"),
-    )
+    # Make the client raise an exception
+    deployer.client.create_function_with_options = _raise_api_error
 
     result = await deployer.deploy_to_fc(
         agent_runtime_name="error-function",
@@ -1030,8 +1183,3 @@ async def test_deploy_to_fc_handles_exception(
 
     assert result["success"] is False
     assert "API Error" in result["error"]
-
-
-def test_http_trigger_name_constant():
-    """Test HTTP_TRIGGER_NAME constant."""
-    assert FCDeployManager.HTTP_TRIGGER_NAME == "agentscope-runtime-trigger"
@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
-# pylint:disable=protected-access, unused-argument
+# pylint:disable=protected-access, unused-argument, redefined-outer-name
 # pylint:disable=use-implicit-booleaness-not-comparison
 
 
-import os
-import shutil
-import tempfile
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import patch, sentinel
 
 import pytest
 
@@ -20,14 +18,25 @@ from agentscope_runtime.engine.deployers.utils.docker_image_utils import (
 )
 
 
+@pytest.fixture(scope="module")
+def default_k8s_config():
+    """Default K8sConfig shared by the module."""
+    return K8sConfig()
+
+
+@pytest.fixture(scope="module")
+def default_registry_config():
+    """Default RegistryConfig shared by the module."""
+    return RegistryConfig()
+
+
 class TestK8sConfig:
     """Test cases for K8sConfig model."""
 
-    def test_k8s_config_defaults(self):
+    def test_k8s_config_defaults(self, default_k8s_config):
         """Test K8sConfig default values."""
-        config = K8sConfig()
-        assert config.k8s_namespace == "agentscope-runtime"
-        assert config.kubeconfig_path is None
+        assert default_k8s_config.k8s_namespace == "agentscope-runtime"
+        assert default_k8s_config.kubeconfig_path is None
 
     def test_k8s_config_creation(self):
         """Test K8sConfig creation with custom values."""
@@ -52,24 +61,76 @@ class TestBuildConfigK8s:
         assert config.cleanup_after_build is True
 
 
-class TestKnativeDeployManager:
-    """Test cases for KnativeDeployManager class."""
+_KNATIVE_CLIENT = (
+    "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient"
+)
+
+
+@pytest.fixture(scope="module")
+def mock_k8s_client_cls():
+    """Patch ``KnativeClient`` once for the whole module."""
+    with patch(_KNATIVE_CLIENT) as client_cls:
+        yield client_cls
+
+
+@pytest.fixture
+def mock_k8s_client(mock_k8s_client_cls, mocker):
+    """Reset the patched client class and give it a fresh instance."""
+    mock_k8s_client_cls.reset_mock(return_value=True, side_effect=True)
+    mock_k8s_client_cls.return_value = mocker.Mock()
+    return mock_k8s_client_cls.return_value
+
 
-    @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        """Set up and tear down test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        yield
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+@pytest.fixture
+def deployer(mock_k8s_client):
+    """Provide a KnativeDeployManager wired to ``mock_k8s_client``."""
+    return KnativeDeployManager()
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
+
+_KSERVICE_URL = "http://agent-291cb894.agentscope-runtime.example.com"
+
+# Shared read-only resource record; copy it before mutating in a test
+_FAKE_RESOURCE = {"resource_name": "agent-test-depl"}
+
+
+class MockRunner(SimpleNamespace):
+    """Lightweight runner stand-in; the deployer only records its class."""
+
+
+def _fake_runner(**attrs) -> MockRunner:
+    return MockRunner(_agent=SimpleNamespace(), **attrs)
+
+
+@pytest.fixture
+def knative_success(deployer, mock_k8s_client, mocker):
+    """Make image build and kservice creation succeed.
+
+    Returns the patched ``build_image`` mock.
+    """
+    mock_k8s_client.create_kservice.return_value = (
+        "agent-test",
+        _KSERVICE_URL,
     )
-    def test_knative_deployer_creation(self, mock_k8s_client):
+    return mocker.patch.object(
+        deployer.image_factory,
+        "build_image",
+        return_value="test-image:latest",
+    )
+
+
+class TestKnativeDeployManager:
+    """Test cases for KnativeDeployManager class."""
+
+    def test_knative_deployer_creation(
+        self,
+        mock_k8s_client_cls,
+        mock_k8s_client,
+        default_k8s_config,
+        default_registry_config,
+    ):
         """Test KnativeDeployManager creation."""
-        k8s_config = K8sConfig()
-        registry_config = RegistryConfig()
+        k8s_config = default_k8s_config
+        registry_config = default_registry_config
 
         deployer = KnativeDeployManager(
             kube_config=k8s_config,
@@ -81,359 +142,209 @@ class TestKnativeDeployManager:
         assert deployer.build_context_dir == "/tmp/k8s_build"
 
         # Verify that KubernetesClient was instantiated with correct parameters
-        mock_k8s_client.assert_called_once_with(
+        mock_k8s_client_cls.assert_called_once_with(
             config=k8s_config,
             image_registry=registry_config.get_full_url(),
         )
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
     async def test_deploy_kservice_with_runner_success(
         self,
+        deployer,
         mock_k8s_client,
-        mocker,
+        knative_success,
     ):
         """Test successful kservice with runner."""
-        # Setup mocks
-        mock_runner = mocker.Mock()
-        mock_runner._agent = mocker.Mock()
-        mock_runner.__class__.__name__ = "MockRunner"
-
-        # Mock Kubernetes client
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_kservice.return_value = (
-            "agent-test",
-            "http://agent-291cb894.agentscope-runtime.example.com",
+        mock_runner = _fake_runner()
+
+        # Test kservice
+        result = await deployer.deploy(
+            runner=mock_runner,
+            requirements=["fastapi", "uvicorn"],
+            base_image="python:3.9-slim",
+            port=8080,
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        # Create deployer
-        deployer = KnativeDeployManager()
-
-        # Mock the image builder to avoid actual Docker operations
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
-        ) as mock_build:
-            # Test kservice
-            result = await deployer.deploy(
-                runner=mock_runner,
-                requirements=["fastapi", "uvicorn"],
-                base_image="python:3.9-slim",
-                port=8080,
-            )
-
-            # Assertions
-            assert isinstance(result, dict)
-            assert "deploy_id" in result
-            assert "url" in result
-            assert "resource_name" in result
-
-            assert (
-                result["url"]
-                == "http://agent-291cb894.agentscope-runtime.example.com"
-            )
-
-            # Verify image build was called
-            mock_build.assert_called_once()
-
-            # Verify Knative service was called
-            mock_client_instance.create_kservice.assert_called_once()
-
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
-    async def test_deploy_image_build_failure(self, mock_k8s_client, mocker):
-        """Test kservice when image build fails."""
-        mock_runner = mocker.Mock()
 
-        # Mock Kubernetes client
-        mock_client_instance = mocker.Mock()
-        mock_k8s_client.return_value = mock_client_instance
+        # Assertions
+        assert isinstance(result, dict)
+        assert "deploy_id" in result
+        assert "url" in result
+        assert "resource_name" in result
+
+        assert result["url"] == _KSERVICE_URL
 
-        # Create deployer
-        deployer = KnativeDeployManager()
+        # Verify image build was called
+        knative_success.assert_called_once()
 
-        # Mock the image builder to return None (build failure)
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value=None,
-        ):
-            # Test kservice failure
-            with pytest.raises(RuntimeError, match="Image build failed"):
-                await deployer.deploy(runner=mock_runner)
+        # Verify Knative service was called
+        mock_k8s_client.create_kservice.assert_called_once()
+
+    async def test_deploy_image_build_failure(self, deployer):
+        """Test kservice when image build fails."""
+        mock_runner = _fake_runner()
+
+        # Stub the image builder to return None (build failure)
+        deployer.image_factory.build_image = lambda *args, **kwargs: None
+
+        # Test kservice failure
+        with pytest.raises(RuntimeError, match="Image build failed"):
+            await deployer.deploy(runner=mock_runner)
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
     async def test_deploy_knative_service_failure(
         self,
+        deployer,
         mock_k8s_client,
-        mocker,
     ):
         """Test kservice when Knative service fails."""
-        mock_runner = mocker.Mock()
-
-        # Mock Kubernetes client failure
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_kservice.return_value = (
-            None,
-            None,
-        )  # Failure
-        mock_k8s_client.return_value = mock_client_instance
-
-        # Create deployer
-        deployer = KnativeDeployManager()
-
-        # Mock the image builder to return success, but knative service fails
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
+        mock_runner = _fake_runner()
+
+        # Image build succeeds, but the Knative service creation fails
+        deployer.image_factory.build_image = (
+            lambda *args, **kwargs: "test-image:latest"
+        )
+        mock_k8s_client.create_kservice = lambda *args, **kwargs: (None, None)
+
+        # Test kservice failure
+        with pytest.raises(
+            RuntimeError,
+            match="Failed to create resource",
         ):
-            # Test kservice failure
-            with pytest.raises(
-                RuntimeError,
-                match="Failed to create resource",
-            ):
-                await deployer.deploy(runner=mock_runner)
-
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
+            await deployer.deploy(runner=mock_runner)
+
     async def test_deploy_kservice_with_app_only(
         self,
-        mock_k8s_client,
-        mocker,
+        deployer,
+        knative_success,
     ):
         """Test kservice succeeds when only an app is provided."""
-        mock_app = mocker.Mock()
-        mock_app._runner = mocker.Mock()
-        mock_app.stream = False
-
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_kservice.return_value = (
-            "agent-test",
-            "http://agent-291cb894.agentscope-runtime.example.com",
-        )
-        mock_k8s_client.return_value = mock_client_instance
+        mock_app = SimpleNamespace(_runner=_fake_runner(), stream=False)
 
-        deployer = KnativeDeployManager()
-
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="app-image:latest",
-        ) as mock_build:
-            result = await deployer.deploy(app=mock_app, replicas=1)
+        result = await deployer.deploy(app=mock_app, replicas=1)
 
         assert "url" in result
-        mock_build.assert_called_once()
+        knative_success.assert_called_once()
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
     async def test_deploy_with_protocol_adapters(
         self,
-        mock_k8s_client,
-        mocker,
+        deployer,
+        knative_success,
     ):
         """Test kservice with protocol adapters."""
-        mock_runner = mocker.Mock()
-        mock_adapters = [mocker.Mock(), mocker.Mock()]
-
-        # Setup mocks
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_kservice.return_value = (
-            "agent-test",
-            "http://agent-291cb894.agentscope-runtime.example.com",
+        mock_runner = _fake_runner()
+        mock_adapters = [sentinel.adapter_a, sentinel.adapter_b]
+
+        result = await deployer.deploy(
+            runner=mock_runner,
+            protocol_adapters=mock_adapters,
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KnativeDeployManager()
-
-        # Mock the image builder
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
-        ) as mock_build:
-            result = await deployer.deploy(
-                runner=mock_runner,
-                protocol_adapters=mock_adapters,
-            )
-            assert "deploy_id" in result
-            # Verify protocol_adapters were passed to image builder
-            call_args = mock_build.call_args
-            assert call_args[1]["protocol_adapters"] == mock_adapters
-
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
+        assert "deploy_id" in result
+        # Verify protocol_adapters were passed to image builder
+        call_args = knative_success.call_args
+        assert call_args[1]["protocol_adapters"] == mock_adapters
+
     async def test_deploy_kservice_with_volume_mount(
         self,
+        deployer,
         mock_k8s_client,
-        mocker,
+        knative_success,
     ):
         """Test kservice with volume mounting."""
-        mock_runner = mocker.Mock()
+        mock_runner = _fake_runner()
 
-        # Setup mocks
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.create_kservice.return_value = (
-            "agent-test",
-            "http://agent-291cb894.agentscope-runtime.example.com",
+        result = await deployer.deploy(
+            runner=mock_runner,
+            mount_dir="/data",
         )
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KnativeDeployManager()
+        assert "deploy_id" in result
+        # Verify volume mounting configuration was passed
+        call_args = mock_k8s_client.create_kservice.call_args
+        volumes_arg = call_args[1]["volumes"]
+        expected_volumes = {
+            "/data": {
+                "bind": "/data",
+                "mode": "rw",
+            },
+        }
+        assert volumes_arg == expected_volumes
 
-        # Mock the image builder
-        with patch.object(
-            deployer.image_factory,
-            "build_image",
-            return_value="test-image:latest",
-        ):
-            result = await deployer.deploy(
-                runner=mock_runner,
-                mount_dir="/data",
-            )
-            assert "deploy_id" in result
-            # Verify volume mounting configuration was passed
-            call_args = mock_client_instance.create_kservice.call_args
-            volumes_arg = call_args[1]["volumes"]
-            expected_volumes = {
-                "/data": {
-                    "bind": "/data",
-                    "mode": "rw",
-                },
-            }
-            assert volumes_arg == expected_volumes
-
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
-    async def test_deploy_validation_error(self, mock_k8s_client):
+    async def test_deploy_validation_error(self, deployer):
         """Test kservice with invalid parameters."""
-        deployer = KnativeDeployManager()
-
         # Test with neither runner nor func
         with pytest.raises(RuntimeError, match="Knative Service failed"):
             await deployer.deploy(runner=None, func=None)
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
+    @pytest.mark.parametrize(
+        "deleted,expected_success",
+        [(True, True), (False, False)],
+        ids=["existing", "nonexistent"],
     )
-    @pytest.mark.asyncio
-    async def test_stop_kservice(self, mock_k8s_client, mocker):
-        """Test stopping a kservice."""
-        # Setup deployer with a mock kservice
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.delete_kservice.return_value = True
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KnativeDeployManager()
-        deployer.deploy_id = "test-deploy-123"
+    async def test_stop_kservice(
+        self,
+        deployer,
+        mock_k8s_client,
+        deleted,
+        expected_success,
+    ):
+        """Test stopping an existing and a nonexistent kservice."""
+        mock_k8s_client.delete_kservice.return_value = deleted
 
         result = await deployer.stop("test-deploy-123")
 
-        assert result["success"] is True
-        mock_client_instance.delete_kservice.assert_called_once_with(
+        assert result["success"] is expected_success
+        mock_k8s_client.delete_kservice.assert_called_once_with(
             "agent-test-dep",
         )
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    @pytest.mark.asyncio
-    async def test_stop_nonexistent_kservice(self, mock_k8s_client, mocker):
-        """Test stopping a nonexistent kservice."""
-        mock_client_instance = mocker.Mock()
-
-        mock_client_instance.delete_kservice.return_value = False
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KnativeDeployManager()
-        deploy_id = "nonexistent-deploy"
-
-        result = await deployer.stop(deploy_id)
-
-        assert result["success"] is False
-
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    def test_get_status(self, mock_k8s_client, mocker):
+    def test_get_status(self, deployer, mock_k8s_client):
         """Test getting kservice status."""
-        mock_client_instance = mocker.Mock()
-        mock_client_instance.get_kservice_status.return_value = "running"
-        mock_k8s_client.return_value = mock_client_instance
-
-        deployer = KnativeDeployManager()
+        mock_k8s_client.get_kservice_status.return_value = "running"
         deployer.deploy_id = "test-deploy-123"
-        deployer._deployed_resources["test-deploy-123"] = {
-            "resource_name": "agent-test-depl",
-        }
+        deployer._deployed_resources["test-deploy-123"] = _FAKE_RESOURCE
 
         status = deployer.get_status()
 
         assert status == "running"
-        mock_client_instance.get_kservice_status.assert_called_once_with(
+        mock_k8s_client.get_kservice_status.assert_called_once_with(
             "agent-test-depl",
         )
 
-    @patch(
-        "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-    )
-    def test_get_status_nonexistent(self, mock_k8s_client):
+    def test_get_status_nonexistent(self, deployer):
         """Test getting status of nonexistent kservice."""
-        deployer = KnativeDeployManager()
         deployer.deploy_id = "nonexistent-deploy"
 
         status = deployer.get_status()
 
         assert status == "not_found"
 
-    @pytest.mark.asyncio
-    async def test_minimal_functionality_without_heavy_mocking(self):
+    async def test_minimal_functionality_without_heavy_mocking(
+        self,
+        mock_k8s_client,
+        default_registry_config,
+    ):
         """Test basic functionality with minimal mocking."""
         k8s_config = K8sConfig(k8s_namespace="test-namespace")
-        registry_config = RegistryConfig()
+        registry_config = default_registry_config
 
-        # Mock just the KubernetesClient constructor
-        with patch(
-            "agentscope_runtime.engine.deployers.knative_deployer.KnativeClient",  # noqa E501
-        ):
-            deployer = KnativeDeployManager(
-                kube_config=k8s_config,
-                registry_config=registry_config,
-                build_context_dir="/tmp/test-build",
-            )
-
-            # Test basic properties
-            assert deployer.kubeconfig == k8s_config
-            assert deployer.registry_config == registry_config
-            assert deployer.build_context_dir == "/tmp/test-build"
-            assert deployer._deployed_resources == {}
-            assert deployer._built_images == {}
-
-            # Test deploy_id generation (inherited from DeployManager)
-            assert deployer.deploy_id is not None
-            assert isinstance(deployer.deploy_id, str)
-
-            # Test image builder initialization
-            assert deployer.image_factory is not None
-
-            # Test validation error handling
-            with pytest.raises(RuntimeError, match="Knative Service failed"):
-                await deployer.deploy(runner=None, func=None)
+        # Only the KnativeClient constructor is mocked, by the fixture
+        deployer = KnativeDeployManager(
+            kube_config=k8s_config,
+            registry_config=registry_config,
+            build_context_dir="/tmp/test-build",
+        )
+
+        # Test basic properties
+        assert deployer.kubeconfig == k8s_config
+        assert deployer.registry_config == registry_config
+        assert deployer.build_context_dir == "/tmp/test-build"
+        assert deployer._deployed_resources == {}
+        assert deployer._built_images == {}
+
+        # Test deploy_id generation (inherited from DeployManager)
+        assert deployer.deploy_id is not None
+        assert isinstance(deployer.deploy_id, str)
+
+        # Test image builder initialization
+        assert deployer.image_factory is not None
+
+        # Test validation error handling
+        with pytest.raises(RuntimeError, match="Knative Service failed"):
+            await deployer.deploy(runner=None, func=None)
@@ -6,7 +6,7 @@
 import os
 import shutil
 import tempfile
-from unittest.mock import patch
+from unittest.mock import patch, sentinel
 
 import pytest
 from kubernetes.client.exceptions import ApiException
@@ -246,7 +246,7 @@ class TestKubernetesDeployManager:
     ):
         """Test deployment with protocol adapters."""
         mock_runner = mocker.Mock()
-        mock_adapters = [mocker.Mock(), mocker.Mock()]
+        mock_adapters = [sentinel.adapter_a, sentinel.adapter_b]
 
         # Setup mocks
         mock_client_instance = mocker.Mock()
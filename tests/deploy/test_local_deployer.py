@@ -10,6 +10,9 @@ from agentscope_runtime.engine.deployers import LocalDeployManager
 from agentscope_runtime.engine import AgentApp
 from agentscope_runtime.engine.schemas.agent_schemas import AgentRequest
 
+# These tests bind fixed local ports, keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("local_deployer")
+
 PAYLOAD = {
     "input": [
         {
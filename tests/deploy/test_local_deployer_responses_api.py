@@ -20,6 +20,9 @@ from agentscope_runtime.engine.deployers.local_deployer import (
 )
 from agentscope_runtime.engine.schemas.agent_schemas import AgentRequest
 
+# These tests bind fixed local ports, keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("local_deployer")
+
 
 def local_deploy():
     asyncio.run(_local_deploy())
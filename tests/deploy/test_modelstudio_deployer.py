@@ -83,7 +83,10 @@ async def test_deploy_build_only_generates_wheel_without_upload(
     assert kwargs["deploy_name"] == "my-deploy"
     assert kwargs["start_cmd"] == "python app.py"
     assert kwargs["telemetry_enabled"] is False
-    build_mock.assert_called_once_with(wrapper_dir)
+    build_mock.assert_called_once_with(
+        wrapper_dir,
+        isolated=False,
+    )
 
     assert result["resource_name"] == "my-deploy"
     assert result["wheel_path"].endswith(".whl")
@@ -144,7 +147,10 @@ async def test_deploy_with_upload_calls_cloud_and_writes_output(
 
     # Build path asserted
     gen_mock.assert_called_once()
-    build_mock.assert_called_once_with(wrapper_dir)
+    build_mock.assert_called_once_with(
+        wrapper_dir,
+        isolated=False,
+    )
 
     # Cloud interactions asserted
     bailian_deploy_mock.assert_called_once()
@@ -4,9 +4,9 @@
 """
 E2E tests for PAIDeployManager.
 """
-from datetime import datetime
 import logging
 import os
+import uuid
 import zipfile
 from pathlib import Path
 from typing import AsyncIterator, Dict
@@ -14,12 +14,14 @@ from urllib.parse import urljoin
 
 import pytest
 
+from agentscope_runtime.engine.deployers import pai_deployer
 from agentscope_runtime.engine.deployers.pai_deployer import (
     PAIDeployManager,
     PAIDeployConfig,
     _should_ignore,
     _get_default_ignore_patterns,
 )
+from agentscope_runtime.engine.deployers.utils import package
 from agentscope_runtime.engine.helpers.agent_api_client import (
     HTTPAgentAPIClient,
     create_simple_text_request,
@@ -33,7 +35,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agentscope_proj_dir() -> Path:
     """
     AgentScope Project Directory for testing.
@@ -44,6 +46,15 @@ def agentscope_proj_dir() -> Path:
     return test_data_dir
 
 
+@pytest.fixture
+def isolated_archive_builds(tmp_path: Path, monkeypatch) -> Path:
+    """Build project archives under ``tmp_path`` with an empty reuse cache."""
+    workspace = tmp_path / "builds"
+    monkeypatch.setattr(package, "DEFAULT_BUILD_WORKSPACE", workspace)
+    monkeypatch.setattr(pai_deployer, "_PROJECT_ARCHIVE_CACHE", {})
+    return workspace
+
+
 @pytest.fixture
 def dashscope_api_key() -> str:
     """
@@ -71,7 +82,7 @@ def vpc_config() -> Dict[str, str]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def workspace_id() -> str:
     """Workspace ID for testing."""
     workspace_id = os.getenv("PAI_WORKSPACE_ID", "")
@@ -81,21 +92,14 @@ def workspace_id() -> str:
 
 
 @pytest.fixture
-async def service_name(deploy_manager: PAIDeployManager) -> AsyncIterator[str]:
+async def service_name(
+    deploy_manager: PAIDeployManager,
+    worker_id: str,
+) -> AsyncIterator[str]:
     """Generate unique service name and cleanup after test."""
-    svc_name = (
-        f"test_agentscope_deploy_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    )
-
-    # ensure the given service_name/project is not exists
-    try:
-        await deploy_manager.delete_service(svc_name)
-    except Exception as e:
-        logging.info("Error deleting service: %s", e)
-    try:
-        await deploy_manager.delete_project(svc_name)
-    except Exception as e:
-        logger.info("Error deleting project: %s", e)
+    # Unique per xdist worker and per test, so no stale service or
+    # project can exist under this name and no pre-test cleanup is needed
+    svc_name = f"test_agentscope_deploy_{worker_id}_{uuid.uuid4().hex[:8]}"
 
     yield svc_name
 
@@ -111,13 +115,16 @@ async def service_name(deploy_manager: PAIDeployManager) -> AsyncIterator[str]:
         logger.warning("Error deleting project: %s", e)
 
 
-@pytest.fixture
-def deploy_manager(workspace_id: str):
-    """Create a PAIDeployManager instance for testing."""
+@pytest.fixture(scope="session")
+def deploy_manager(workspace_id: str) -> PAIDeployManager:
+    """Create a PAIDeployManager instance shared by the session."""
     deployer_manager = PAIDeployManager(workspace_id=workspace_id)
 
     if not deployer_manager.workspace_id or not deployer_manager.region_id:
         pytest.skip("PAI_WORKSPACE_ID or REGION_ID is not set")
+
+    # Deploys go through the real archiver, which reuses the zip of an
+    # unchanged project directory across calls
     return deployer_manager
 
 
@@ -179,6 +186,42 @@ spec:
         # Original unchanged
         assert config.spec.name == "yaml-service"
 
+    def test_merge_cli_copies_only_overridden_sections(self):
+        """Test merge_cli leaves nested values intact and shares the rest."""
+        config = PAIDeployConfig.from_dict(
+            {
+                "spec": {
+                    "name": "yaml-service",
+                    "env": {"A": "yaml", "B": "yaml"},
+                    "vpc_config": {"vpc_id": "vpc-yaml"},
+                },
+            },
+        )
+
+        merged = config.merge_cli(environment={"A": "cli"}, cpu=4)
+
+        assert merged.spec.env == {"A": "cli", "B": "yaml"}
+        assert merged.spec.resources.cpu == 4
+        assert config.spec.env == {"A": "yaml", "B": "yaml"}
+        assert config.spec.resources.cpu is None
+        assert merged.spec.vpc_config is config.spec.vpc_config
+        assert merged.context is config.context
+
+    def test_merge_cli_chained_leaves_earlier_configs_intact(self):
+        """Test resolving code paths through merge_cli does not leak back."""
+        config = PAIDeployConfig.from_dict(
+            {"spec": {"code": {"source_dir": "proj"}}},
+        )
+
+        merged = config.merge_cli(name="cli-service")
+        resolved = merged.merge_cli(source="/abs/proj", entrypoint="app.py")
+
+        assert resolved.spec.code.source_dir == "/abs/proj"
+        assert resolved.spec.code.entrypoint == "app.py"
+        assert merged.spec.code.source_dir == "proj"
+        assert merged.spec.code.entrypoint is None
+        assert config.spec.code.source_dir == "proj"
+
     def test_resolve_resource_type_inference(self):
         """Test resource type auto-inference."""
         # Default to public
@@ -247,6 +290,22 @@ spec:
         with pytest.raises(ValueError, match="Source directory not found"):
             config.validate_for_deploy()
 
+    def test_validate_for_deploy_source_not_directory(self, tmp_path: Path):
+        """Test validation fails when source_dir is a regular file."""
+        source_file = tmp_path / "app.py"
+        source_file.write_text("print('hello')")
+        config = PAIDeployConfig.from_dict(
+            {
+                "spec": {
+                    "name": "test-service",
+                    "code": {"source_dir": str(source_file)},
+                },
+            },
+        )
+
+        with pytest.raises(ValueError, match="Source path is not a directory"):
+            config.validate_for_deploy()
+
     def test_validate_resource_mode_requirements(self, tmp_path: Path):
         """Test validation for resource/quota mode requirements."""
         # resource mode without resource_id
@@ -340,6 +399,7 @@ class TestProjectArchiveIgnorePatterns:
         assert _should_ignore("dist/bundle.js", patterns)
         assert not _should_ignore("src/build.py", patterns)
 
+    @pytest.mark.usefixtures("isolated_archive_builds")
     def test_create_project_archive_excludes_ignored(self, tmp_path: Path):
         """Test that archive correctly excludes ignored files."""
         # Create test project structure
@@ -395,6 +455,30 @@ class TestProjectArchiveIgnorePatterns:
         assert not any("secrets" in n for n in names)
         assert not any(".log" in n for n in names)
 
+    def test_create_project_archive_reuses_unchanged(
+        self,
+        tmp_path: Path,
+        isolated_archive_builds: Path,
+    ):
+        """Test that an unchanged project reuses its previous archive."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "main.py").write_text("print('hello')")
+
+        deployer = PAIDeployManager.__new__(PAIDeployManager)
+        deployer.build_root = None
+
+        first = deployer._create_project_archive("test-service", project_dir)
+        second = deployer._create_project_archive("test-service", project_dir)
+        assert second == first
+
+        (project_dir / "main.py").write_text("print('hello, world')")
+        third = deployer._create_project_archive("test-service", project_dir)
+        assert third != first
+        with zipfile.ZipFile(third, "r") as zf:
+            assert zf.read("main.py") == b"print('hello, world')"
+        assert first.is_relative_to(isolated_archive_builds)
+
 
 # =============================================================================
 # E2E Tests (Require cloud resources)
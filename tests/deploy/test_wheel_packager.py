@@ -3,7 +3,11 @@
 # pylint: disable=line-too-long, too-many-branches
 from pathlib import Path
 
+import pytest
+
+from agentscope_runtime.engine.deployers.utils import wheel_packager
 from agentscope_runtime.engine.deployers.utils.wheel_packager import (
+    build_wheel,
     generate_wrapper_project,
 )
 
@@ -65,3 +69,36 @@ def test_generate_wrapper_project_telemetry_true(tmp_path: Path):
     )
     cfg = wrapper_dir / "deploy_starter" / "config.yml"
     assert "TELEMETRY_ENABLE: true" in cfg.read_text(encoding="utf-8")
+
+
+def test_build_wheel_reuses_build_venv(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    project_dir = tmp_path / "wrapper"
+    project_dir.mkdir()
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        if cmd[1:4] == ["-m", "pip", "install"]:
+            # the venv python is what installs the build requirements
+            vpy = Path(cmd[0])
+            vpy.parent.mkdir(parents=True, exist_ok=True)
+            vpy.touch()
+        elif cmd[1:3] == ["-m", "build"]:
+            dist = project_dir / "dist"
+            dist.mkdir(exist_ok=True)
+            (dist / "pkg-0.0.1-py3-none-any.whl").write_bytes(b"whl")
+
+    monkeypatch.setattr(wheel_packager.subprocess, "run", fake_run)
+
+    assert build_wheel(project_dir).name == "pkg-0.0.1-py3-none-any.whl"
+    # Arbitrary projects keep an isolated build for their own backend
+    assert calls[-1][1:] == ["-m", "build", "--wheel"]
+    first_calls = len(calls)
+    build_wheel(project_dir, isolated=False)
+
+    # Second build only runs the build itself, no venv setup or pip install
+    assert len(calls) == first_calls + 1
+    assert calls[-1][1:] == ["-m", "build", "--wheel", "--no-isolation"]
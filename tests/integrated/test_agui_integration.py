@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=redefined-outer-name, protected-access, no-name-in-module
+import asyncio
+from collections import defaultdict
+import json
 import multiprocessing
 import os
-import socket
-import time
-from typing import List, cast
+from typing import Any, AsyncIterator, DefaultDict, Dict, List, Union, cast
 import uuid
 
 from ag_ui.core import Event, EventType, FunctionCall, RunAgentInput
@@ -18,6 +19,7 @@ from ag_ui.core.types import (
 import aiohttp
 from pydantic import TypeAdapter
 import pytest
+import pytest_asyncio
 
 from agentscope.agent import ReActAgent
 from agentscope.message import Msg, TextBlock
@@ -43,6 +45,16 @@ from agentscope_runtime.engine.schemas.agent_schemas import AgentRequest
 AGENTSCOPE_APP_PORT = 8091
 LANGGRAPH_APP_PORT = 8092
 
+_EVENT_ADAPTER: TypeAdapter[Event] = TypeAdapter(Event)
+_validate_event = _EVENT_ADAPTER.validate_json
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Forked servers inherit the already-imported agent stacks; pin the start
+# method so newer Pythons (forkserver by default) don't re-import them.
+_MP_CTX = multiprocessing.get_context(
+    "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn",
+)
+
 
 def launch_agentscope_app():
     """Start AgentApp with AG-UI endpoint and real LLM."""
@@ -81,6 +93,18 @@ def launch_agentscope_app():
             connection_pool=fake_redis.connection_pool,
         )
 
+        # Toolkit, model and formatter hold no per-session state, so build
+        # them once instead of on every query.
+        runner.shared_toolkit = Toolkit()
+        runner.shared_toolkit.register_tool_function(get_weather)
+        runner.shared_model = DashScopeChatModel(
+            "qwen-plus",
+            api_key=os.getenv("DASHSCOPE_API_KEY"),
+            enable_thinking=False,
+            stream=True,
+        )
+        runner.shared_formatter = DashScopeChatFormatter()
+
     @agent_app.query(framework="agentscope")
     async def query_func(
         runner: Runner,
@@ -91,21 +115,13 @@ def launch_agentscope_app():
         session_id = request.session_id
         user_id = request.user_id
 
-        toolkit = Toolkit()
-        toolkit.register_tool_function(get_weather)
-
         agent = ReActAgent(
             name="Friday",
-            model=DashScopeChatModel(
-                "qwen-plus",
-                api_key=os.getenv("DASHSCOPE_API_KEY"),
-                enable_thinking=False,
-                stream=True,
-            ),
+            model=runner.shared_model,
             sys_prompt="You're a helpful assistant.",
-            toolkit=toolkit,
+            toolkit=runner.shared_toolkit,
             memory=InMemoryMemory(),
-            formatter=DashScopeChatFormatter(),
+            formatter=runner.shared_formatter,
         )
         agent.set_console_output_enabled(enabled=False)
 
@@ -210,71 +226,223 @@ def launch_langgraph_app():
     agent_app.run(host="127.0.0.1", port=LANGGRAPH_APP_PORT)
 
 
-def _start_app_server(target_func, port):
-    """Helper to start an app server and wait for it to be ready."""
+_APP_SERVERS = {
+    "agentscope": (launch_agentscope_app, AGENTSCOPE_APP_PORT),
+    "langgraph": (launch_langgraph_app, LANGGRAPH_APP_PORT),
+}
+
+
+async def _wait_ready(
+    session: aiohttp.ClientSession,
+    port: int,
+    timeout: float = 5.0,
+) -> bool:
+    """Poll an app server's health route with exponential backoff."""
+    url = f"http://localhost:{port}/health"
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.005
+    while loop.time() < deadline:
+        try:
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=0.5),
+            ) as resp:
+                if resp.status == 200:
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return False
+
+
+async def _wait_all_ready(ports: List[int]) -> bool:
+    """Wait for several app servers concurrently."""
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *(_wait_ready(session, port) for port in ports),
+        )
+    return all(results)
+
+
+@pytest.fixture(scope="session")
+def app_servers():
+    """Launch every app server once, in parallel, for the whole session."""
     api_key = os.getenv("DASHSCOPE_API_KEY")
     if not api_key:
         pytest.skip("DASHSCOPE_API_KEY not set, skipping integration tests")
 
-    proc = multiprocessing.Process(target=target_func)
-    proc.start()
-
-    # Wait for server to start
-    for _ in range(50):
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            s.connect(("localhost", port))
-            s.close()
-            break
-        except OSError:
-            time.sleep(0.1)
-    else:
-        proc.terminate()
-        pytest.fail("Server did not start within timeout")
-
-    return proc
-
-
-@pytest.fixture(scope="module", params=["agentscope", "langgraph"])
-def app_endpoint(request):
-    """Parametrized fixture that launches the appropriate app server."""
-    if request.param == "agentscope":
-        proc = _start_app_server(launch_agentscope_app, AGENTSCOPE_APP_PORT)
-        yield "localhost", AGENTSCOPE_APP_PORT
-    elif request.param == "langgraph":
-        proc = _start_app_server(launch_langgraph_app, LANGGRAPH_APP_PORT)
-        yield "localhost", LANGGRAPH_APP_PORT
-    else:
-        raise ValueError(f"Unknown app_endpoint param: {request.param}")
-    proc.terminate()
-    proc.join()
+    procs = [
+        _MP_CTX.Process(target=target_func)
+        for target_func, _ in _APP_SERVERS.values()
+    ]
+    for proc in procs:
+        proc.start()
+
+    try:
+        ports = [port for _, port in _APP_SERVERS.values()]
+        if not asyncio.run(_wait_all_ready(ports)):
+            pytest.fail("Server did not start within timeout")
+        yield {
+            name: ("localhost", port)
+            for name, (_, port) in _APP_SERVERS.items()
+        }
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.join(timeout=0.5)
+            if proc.is_alive():
+                proc.kill()
+                proc.join(timeout=1.0)
+
+
+@pytest.fixture(scope="module", params=list(_APP_SERVERS))
+def app_endpoint(request, app_servers):
+    """Parametrized fixture returning the endpoint of one app server."""
+    return app_servers[request.param]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def http_session():
+    """Share one pooled aiohttp session across the module's requests."""
+    # Loopback only: no DNS cache, a small keep-alive pool and a short
+    # connect timeout so a dead server fails fast.
+    connector = aiohttp.TCPConnector(
+        limit=8,
+        limit_per_host=8,
+        use_dns_cache=False,
+        keepalive_timeout=30,
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=120, sock_connect=2),
+        skip_auto_headers={"User-Agent"},
+    ) as session:
+        yield session
+
+
+async def _iter_sse_events(
+    resp: aiohttp.ClientResponse,
+    validate: bool = True,
+) -> AsyncIterator[Union[Event, Dict[str, Any]]]:
+    """Yield AG-UI events from an SSE response until ``[DONE]``.
+
+    With ``validate=False`` the raw JSON dicts are yielded instead of
+    validated ``Event`` models, for tests that only read a few keys.
+    """
+    parse = _validate_event if validate else json.loads
+    async for raw in resp.content:
+        if raw.startswith(b"data: "):
+            payload = raw[6:].rstrip()
+            if payload == b"[DONE]":
+                return
+            yield parse(payload)
+
+
+def _bucket(events: List[Event]) -> DefaultDict[EventType, List[Event]]:
+    """Group events by type in a single pass."""
+    buckets: DefaultDict[EventType, List[Event]] = defaultdict(list)
+    for e in events:
+        buckets[e.type].append(e)
+    return buckets
 
 
 async def invoke_api(
+    session: aiohttp.ClientSession,
     url: str,
-    ag_ui_request: RunAgentInput,
-) -> List[Event]:
-    event_adapter = TypeAdapter(Event)
-    events = []
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            url,
-            json=ag_ui_request.model_dump(mode="json"),
-        ) as resp:
-            assert resp.status == 200
-            assert (
-                resp.headers["content-type"]
-                == "text/event-stream; charset=utf-8"
-            )
-            async for line in resp.content:
-                line_str = line.decode("utf-8").strip()
-                if line_str.startswith("data: "):
-                    data_str = line_str[6:]
-                    if data_str == "[DONE]":
-                        break
-
-                    events.append(event_adapter.validate_json(data_str))
-    return events
+    ag_ui_request: Union[RunAgentInput, bytes],
+    validate: bool = True,
+) -> List[Union[Event, Dict[str, Any]]]:
+    """POST an AG-UI run and collect its streamed events.
+
+    ``ag_ui_request`` may be a prebuilt JSON body; ``validate`` is passed
+    through to :func:`_iter_sse_events`.
+    """
+    if isinstance(ag_ui_request, RunAgentInput):
+        ag_ui_request = ag_ui_request.model_dump_json().encode()
+    async with session.post(
+        url,
+        data=ag_ui_request,
+        headers=_JSON_HEADERS,
+    ) as resp:
+        assert resp.status == 200
+        assert (
+            resp.headers["content-type"] == "text/event-stream; charset=utf-8"
+        )
+        return [e async for e in _iter_sse_events(resp, validate=validate)]
+
+
+# Request bodies that do not vary between backends are serialized once.
+_SIMPLE_THREAD_ID = "test_thread_1"
+_SIMPLE_RUN_ID = "test_run_1"
+_SIMPLE_REQ_BYTES = (
+    RunAgentInput(
+        threadId=_SIMPLE_THREAD_ID,
+        runId=_SIMPLE_RUN_ID,
+        messages=[
+            UserMessage(
+                id="msg_1",
+                content="What is 2+2? Answer in one sentence.",
+            ),
+        ],
+        state=None,
+        tools=[],
+        context=[],
+        forwarded_props=None,
+    )
+    .model_dump_json()
+    .encode()
+)
+
+_HISTORY_THREAD_ID = "test_thread_history"
+_HISTORY_TURN_1 = [
+    SystemMessage(
+        id="msg_1",
+        content="You are a helpful assistant.",
+    ),
+    UserMessage(
+        id="msg_2",
+        content="My name is Bob. Please remember it.",
+    ),
+]
+_HISTORY_REQ1_BYTES = (
+    RunAgentInput(
+        threadId=_HISTORY_THREAD_ID,
+        runId="test_run_h1",
+        messages=_HISTORY_TURN_1,
+        state=None,
+        tools=[],
+        context=[],
+        forwarded_props=None,
+    )
+    .model_dump_json()
+    .encode()
+)
+_HISTORY_REQ2_BYTES = (
+    RunAgentInput(
+        threadId=_HISTORY_THREAD_ID,
+        runId="test_run_h2",
+        state=None,
+        tools=[],
+        context=[],
+        forwarded_props=None,
+        messages=[
+            *_HISTORY_TURN_1,
+            AssistantMessage(
+                id="msg_3",
+                content="Nice to meet you, Bob! I'll remember your name.",
+            ),
+            UserMessage(
+                id="msg_4",
+                content="What is my name?",
+            ),
+        ],
+    )
+    .model_dump_json()
+    .encode()
+)
 
 
 class TestAGUIIntegration:
@@ -284,190 +452,85 @@ class TestAGUIIntegration:
     async def test_simple_text_exchange(
         self,
         app_endpoint: tuple[str, int],
+        http_session: aiohttp.ClientSession,
     ):
         """Test simple text exchange through AG-UI protocol with real LLM."""
         host, port = app_endpoint
         url = f"http://{host}:{port}/ag-ui"
-        custom_thread_id = "test_thread_1"
-        custom_run_id = "test_run_1"
-        ag_ui_request = RunAgentInput(
-            threadId=custom_thread_id,
-            runId=custom_run_id,
-            messages=[
-                UserMessage(
-                    id="msg_1",
-                    content="What is 2+2? Answer in one sentence.",
-                ),
-            ],
-            state=None,
-            tools=[],
-            context=[],
-            forwarded_props=None,
-        )
-        events: List[Event] = []
-        event_adapter = TypeAdapter(Event)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                json=ag_ui_request.model_dump(mode="json"),
-            ) as resp:
-                assert resp.status == 200
-                assert (
-                    resp.headers["content-type"]
-                    == "text/event-stream; charset=utf-8"
-                )
-
-                # Parse SSE events
-                async for line in resp.content:
-                    line_str = line.decode("utf-8").strip()
-                    if line_str.startswith("data: "):
-                        data_str = line_str[6:]
-                        if data_str == "[DONE]":
-                            break
-                        events.append(event_adapter.validate_json(data_str))
+        events = await invoke_api(http_session, url, _SIMPLE_REQ_BYTES)
 
         # Verify event sequence
         assert len(events) >= 3, "Should have at least 3 events"
+        b = _bucket(events)
 
         # Should have run.started
-        run_started = [e for e in events if e.type == EventType.RUN_STARTED]
+        run_started = b[EventType.RUN_STARTED]
         assert len(run_started) > 0, "Should have RUN_STARTED event"
-        assert run_started[0].thread_id == custom_thread_id
-        assert run_started[0].run_id == custom_run_id
+        assert run_started[0].thread_id == _SIMPLE_THREAD_ID
+        assert run_started[0].run_id == _SIMPLE_RUN_ID
 
         # Should have text message events
-        text_events = [
-            e
-            for e in events
-            if e.type
-            in {
-                EventType.TEXT_MESSAGE_START,
-                EventType.TEXT_MESSAGE_CONTENT,
-                EventType.TEXT_MESSAGE_END,
-            }
-        ]
-        assert len(text_events) > 0, "Should have text message events"
+        assert (
+            b[EventType.TEXT_MESSAGE_START]
+            or b[EventType.TEXT_MESSAGE_CONTENT]
+            or b[EventType.TEXT_MESSAGE_END]
+        ), "Should have text message events"
 
         # Should have run.finished
-        run_finished = [e for e in events if e.type == EventType.RUN_FINISHED]
-        assert len(run_finished) > 0, "Should have RUN_FINISHED event"
+        assert b[EventType.RUN_FINISHED], "Should have RUN_FINISHED event"
 
     @pytest.mark.asyncio
     async def test_conversation_with_history(
         self,
         app_endpoint: tuple[str, int],
+        http_session: aiohttp.ClientSession,
     ):
         """Test conversation with message history through AG-UI."""
         host, port = app_endpoint
         url = f"http://{host}:{port}/ag-ui"
 
         # First turn: tell agent the user's name
-        thread_id = "test_thread_history"
-        ag_ui_request_1 = RunAgentInput(
-            threadId=thread_id,
-            runId="test_run_h1",
-            messages=[
-                SystemMessage(
-                    id="msg_1",
-                    content="You are a helpful assistant.",
-                ),
-                UserMessage(
-                    id="msg_2",
-                    content="My name is Bob. Please remember it.",
-                ),
-            ],
-            state=None,
-            tools=[],
-            context=[],
-            forwarded_props=None,
+        events_1 = await invoke_api(
+            http_session,
+            url,
+            _HISTORY_REQ1_BYTES,
+            validate=False,
         )
-        event_adapter = TypeAdapter(Event)
-        events_1: List[Event] = []
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                json=ag_ui_request_1.model_dump(mode="json"),
-            ) as resp:
-                assert resp.status == 200
-                async for line in resp.content:
-                    line_str = line.decode("utf-8").strip()
-                    if line_str.startswith("data: "):
-                        data_str = line_str[6:]
-                        if data_str == "[DONE]":
-                            break
-                        events_1.append(event_adapter.validate_json(data_str))
         assert any(
-            e.type == EventType.RUN_FINISHED for e in events_1
+            d["type"] == EventType.RUN_FINISHED for d in events_1
         ), "First turn should finish"
 
         # Second turn: ask agent to recall the name
-        ag_ui_request_2 = RunAgentInput(
-            threadId=thread_id,
-            runId="test_run_h2",
-            state=None,
-            tools=[],
-            context=[],
-            forwarded_props=None,
-            messages=[
-                SystemMessage(
-                    id="msg_1",
-                    content="You are a helpful assistant.",
-                ),
-                UserMessage(
-                    id="msg_2",
-                    content="My name is Bob. Please remember it.",
-                ),
-                AssistantMessage(
-                    id="msg_3",
-                    content="Nice to meet you, Bob! I'll remember your name.",
-                ),
-                UserMessage(
-                    id="msg_4",
-                    content="What is my name?",
-                ),
-            ],
+        events = await invoke_api(
+            http_session,
+            url,
+            _HISTORY_REQ2_BYTES,
+            validate=False,
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                json=ag_ui_request_2.model_dump(mode="json"),
-            ) as resp:
-                assert resp.status == 200
-
-                events: List[Event] = []
-                async for line in resp.content:
-                    line_str = line.decode("utf-8").strip()
-                    if line_str.startswith("data: "):
-                        data_str = line_str[6:]
-                        if data_str == "[DONE]":
-                            break
-                        events.append(event_adapter.validate_json(data_str))
-
-                # Verify response mentions Bob
-                content_events = [
-                    e
-                    for e in events
-                    if e.type == EventType.TEXT_MESSAGE_CONTENT
-                ]
-                response_text = "".join(e.delta for e in content_events)
-
-                assert (
-                    "Bob" in response_text or "bob" in response_text.lower()
-                ), "Agent should remember and mention Bob"
+        # Verify response mentions Bob
+        response_text = "".join(
+            d["delta"]
+            for d in events
+            if d["type"] == EventType.TEXT_MESSAGE_CONTENT
+        )
+
+        assert (
+            "Bob" in response_text or "bob" in response_text.lower()
+        ), "Agent should remember and mention Bob"
 
     @pytest.mark.asyncio
     async def test_tool_call(
         self,
         app_endpoint: tuple[str, int],
+        http_session: aiohttp.ClientSession,
     ):
         """Test tool call through AG-UI."""
         host, port = app_endpoint
         url = f"http://{host}:{port}/ag-ui"
         thread_id = str(uuid.uuid4())
         run_id = str(uuid.uuid4())
+        tool_call_id = str(uuid.uuid4())
 
         ag_ui_request = RunAgentInput(
             threadId=thread_id,
@@ -483,55 +546,9 @@ class TestAGUIIntegration:
             context=[],
             forwarded_props=None,
         )
-        events = await invoke_api(url, ag_ui_request)
-
-        run_started_event = [
-            e for e in events if e.type == EventType.RUN_STARTED
-        ]
-        assert (
-            len(run_started_event) == 1
-        ), "Should have exactly one RUN_STARTED event"
-        assert run_started_event[0].thread_id == thread_id
-        assert run_started_event[0].run_id == run_id
-
-        run_finished_event = [
-            e for e in events if e.type == EventType.RUN_FINISHED
-        ]
-        assert (
-            len(run_finished_event) == 1
-        ), "Should have exactly one RUN_FINISHED event"
-        assert run_finished_event[0].thread_id == thread_id
-        assert run_finished_event[0].run_id == run_id
-
-        tool_call_start_events = [
-            e for e in events if e.type == EventType.TOOL_CALL_START
-        ]
-        assert (
-            len(tool_call_start_events) > 0
-        ), "Should have TOOL_CALL_START event"
-
-        tool_call_args_events = [
-            e for e in events if e.type == EventType.TOOL_CALL_ARGS
-        ]
-        assert (
-            len(tool_call_args_events) > 0
-        ), "Should have TOOL_CALL_ARGS event"
-
-        tool_call_end_events = [
-            e for e in events if e.type == EventType.TOOL_CALL_END
-        ]
-        assert len(tool_call_end_events) > 0, "Should have TOOL_CALL_END event"
-
-        tool_call_result_events = [
-            e for e in events if e.type == EventType.TOOL_CALL_RESULT
-        ]
-        assert (
-            len(tool_call_result_events) >= 1
-        ), "Should have exactly one TOOL_CALL_RESULT event"
-        tool_call_id = str(uuid.uuid4())
-
+        multi_turn_thread_id = str(uuid.uuid4())
         multi_turn_request = RunAgentInput(
-            thread_id=thread_id,
+            thread_id=multi_turn_thread_id,
             run_id=str(uuid.uuid4()),
             messages=[
                 UserMessage(
@@ -572,31 +589,57 @@ class TestAGUIIntegration:
             context=[],
             forwarded_props=None,
         )
-        multi_turn_events = await invoke_api(url, multi_turn_request)
+        # The multi-turn request carries its own history, so both runs are
+        # independent and can be streamed concurrently.
+        events, multi_turn_events = await asyncio.gather(
+            invoke_api(http_session, url, ag_ui_request),
+            invoke_api(http_session, url, multi_turn_request),
+        )
+        b = _bucket(events)
 
-        run_started_event = [
-            e for e in multi_turn_events if e.type == EventType.RUN_STARTED
-        ]
+        run_started_event = b[EventType.RUN_STARTED]
         assert (
             len(run_started_event) == 1
         ), "Should have exactly one RUN_STARTED event"
         assert run_started_event[0].thread_id == thread_id
-        assert run_started_event[0].run_id == multi_turn_request.run_id
+        assert run_started_event[0].run_id == run_id
 
-        run_finished_event = [
-            e for e in multi_turn_events if e.type == EventType.RUN_FINISHED
-        ]
+        run_finished_event = b[EventType.RUN_FINISHED]
         assert (
             len(run_finished_event) == 1
         ), "Should have exactly one RUN_FINISHED event"
         assert run_finished_event[0].thread_id == thread_id
+        assert run_finished_event[0].run_id == run_id
+
+        assert (
+            len(b[EventType.TOOL_CALL_START]) > 0
+        ), "Should have TOOL_CALL_START event"
+        assert (
+            len(b[EventType.TOOL_CALL_ARGS]) > 0
+        ), "Should have TOOL_CALL_ARGS event"
+        assert (
+            len(b[EventType.TOOL_CALL_END]) > 0
+        ), "Should have TOOL_CALL_END event"
+        assert (
+            len(b[EventType.TOOL_CALL_RESULT]) >= 1
+        ), "Should have exactly one TOOL_CALL_RESULT event"
+
+        b = _bucket(multi_turn_events)
+
+        run_started_event = b[EventType.RUN_STARTED]
+        assert (
+            len(run_started_event) == 1
+        ), "Should have exactly one RUN_STARTED event"
+        assert run_started_event[0].thread_id == multi_turn_thread_id
+        assert run_started_event[0].run_id == multi_turn_request.run_id
+
+        run_finished_event = b[EventType.RUN_FINISHED]
+        assert (
+            len(run_finished_event) == 1
+        ), "Should have exactly one RUN_FINISHED event"
+        assert run_finished_event[0].thread_id == multi_turn_thread_id
         assert run_finished_event[0].run_id == multi_turn_request.run_id
 
-        tool_call_result_events = [
-            e
-            for e in multi_turn_events
-            if e.type == EventType.TOOL_CALL_RESULT
-        ]
         assert (
-            len(tool_call_result_events) >= 1
+            len(b[EventType.TOOL_CALL_RESULT]) >= 1
         ), "Should have exactly one TOOL_CALL_RESULT event"
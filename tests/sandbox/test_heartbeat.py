@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=unused-argument,protected-access,redefined-outer-name
+import threading
 import time
 import pytest
 
@@ -81,8 +82,7 @@ class StubRuntimeClient:
         return {"ok": True, "count": len(server_configs)}
 
 
-@pytest.fixture()
-def mgr(monkeypatch):
+def _stub_manager_deps(monkeypatch) -> StubContainerClient:
     # 1) stub ContainerClientFactory.create_client
     stub_cc = StubContainerClient()
     from agentscope_runtime.common.container_clients import (
@@ -119,6 +119,12 @@ def mgr(monkeypatch):
         lambda self, identity: StubRuntimeClient(),
         raising=True,
     )
+    return stub_cc
+
+
+@pytest.fixture()
+def mgr(monkeypatch):
+    stub_cc = _stub_manager_deps(monkeypatch)
 
     cfg = SandboxManagerEnvConfig(
         redis_enabled=False,
@@ -141,6 +147,34 @@ def mgr(monkeypatch):
         m.cleanup()
 
 
+@pytest.fixture()
+def redis_mgr(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis
+
+    stub_cc = _stub_manager_deps(monkeypatch)
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis, "Redis", lambda *a, **k: fake)
+
+    cfg = SandboxManagerEnvConfig(
+        redis_enabled=True,
+        file_system="local",
+        container_deployment="docker",
+        pool_size=0,
+        default_mount_dir="sessions_mount_dir",
+        heartbeat_timeout=60,
+        watcher_scan_interval=0,
+        heartbeat_lock_ttl=2,
+    )
+
+    m = SandboxManager(config=cfg, default_type=SandboxType.BASE)
+    m._stub_cc = stub_cc
+    try:
+        yield m
+    finally:
+        m.cleanup()
+
+
 def _force_expire_session(
     mgr: SandboxManager,
     session_ctx_id: str,
@@ -153,6 +187,7 @@ def _force_expire_session(
         cm.last_active_at = time.time() - seconds_ago
         cm.updated_at = time.time()
         mgr.container_mapping.set(cm.container_name, cm.model_dump())
+    mgr._drop_live_heartbeat(session_ctx_id)
 
 
 def test_heartbeat_reap_then_touch_auto_restore_flow(mgr: SandboxManager):
@@ -256,3 +291,263 @@ def test_scan_branches_no_running_and_no_heartbeat(mgr: SandboxManager):
     metrics = mgr.scan_heartbeat_once()
     assert metrics["skipped_no_running_containers"] >= 1
     assert metrics["skipped_no_heartbeat"] >= 1
+
+
+def test_touch_and_clear_revives_recycled_container(mgr: SandboxManager):
+    session = "sess-touch-clear"
+    cname = mgr.create(
+        sandbox_type=SandboxType.BASE,
+        meta={"session_ctx_id": session},
+    )
+    mgr.mark_session_recycled(session)
+    assert mgr.needs_restore(session) is True
+
+    ts = mgr.touch_and_clear(session, cname, ts=123.0)
+    cm = ContainerModel(**mgr.get_info(cname))
+    assert ts == 123.0
+    assert cm.state == ContainerState.RUNNING
+    assert cm.recycled_at is None
+    assert cm.recycle_reason is None
+    assert cm.last_active_at == 123.0
+    assert mgr.needs_restore(session) is False
+
+
+def test_touch_and_clear_refreshes_redis_heartbeat(
+    redis_mgr: SandboxManager,
+):
+    session = "sess-touch-clear-redis"
+    cname = redis_mgr.create(
+        sandbox_type=SandboxType.BASE,
+        meta={"session_ctx_id": session},
+    )
+    redis_mgr.mark_session_recycled(session)
+
+    ts = redis_mgr.touch_and_clear(session, cname)
+    cm = ContainerModel(**redis_mgr.get_info(cname))
+    assert cm.state == ContainerState.RUNNING
+    assert cm.last_active_at == ts
+    assert redis_mgr.needs_restore(session) is False
+    assert redis_mgr.get_live_heartbeats([session]) == {session: ts}
+    assert redis_mgr.get_heartbeat_index_scores([session]) == {session: ts}
+
+
+def test_scan_batches_sessions_and_reaps_only_expired(
+    mgr: SandboxManager,
+    monkeypatch,
+):
+    from agentscope_runtime.sandbox.manager import sandbox_manager
+
+    # Force several batches so sessions straddle batch boundaries
+    monkeypatch.setattr(sandbox_manager, "HEARTBEAT_SCAN_BATCH_SIZE", 2)
+
+    sessions = [f"sess-batch-{i}" for i in range(5)]
+    for session in sessions:
+        mgr.create(
+            sandbox_type=SandboxType.BASE,
+            meta={"session_ctx_id": session},
+        )
+    _force_expire_session(mgr, sessions[3], seconds_ago=100)
+
+    metrics = mgr.scan_heartbeat_once()
+    assert metrics["scanned_sessions"] == len(sessions)
+    assert metrics["reaped_sessions"] == 1
+    assert mgr.needs_restore(sessions[3]) is True
+    for session in sessions[:3] + sessions[4:]:
+        assert mgr.needs_restore(session) is False
+
+
+def test_scan_reaps_expired_sessions_concurrently(mgr: SandboxManager):
+    sessions = [f"sess-par-{i}" for i in range(4)]
+    for session in sessions:
+        mgr.create(
+            sandbox_type=SandboxType.BASE,
+            meta={"session_ctx_id": session},
+        )
+        _force_expire_session(mgr, session, seconds_ago=100)
+
+    metrics = mgr.scan_heartbeat_once()
+    assert metrics["reaped_sessions"] == len(sessions)
+    assert metrics["errors"] == 0
+    for session in sessions:
+        assert mgr.needs_restore(session) is True
+
+
+def test_scan_uses_live_heartbeat_marker_in_redis_mode(
+    redis_mgr: SandboxManager,
+    monkeypatch,
+):
+    live, idle = "sess-live", "sess-idle"
+    for session in (live, idle):
+        redis_mgr.create(
+            sandbox_type=SandboxType.BASE,
+            meta={"session_ctx_id": session},
+        )
+    assert set(redis_mgr.get_live_heartbeats([live, idle])) == {live, idle}
+
+    # A missing marker is what makes a session a reap candidate
+    _force_expire_session(redis_mgr, idle, seconds_ago=100)
+
+    loaded = []
+    original = redis_mgr._load_session_activity
+
+    def _spy(session_ctx_ids):
+        loaded.extend(session_ctx_ids)
+        return original(session_ctx_ids)
+
+    monkeypatch.setattr(redis_mgr, "_load_session_activity", _spy)
+
+    metrics = redis_mgr.scan_heartbeat_once()
+    assert metrics["scanned_sessions"] == 2
+    assert metrics["reaped_sessions"] == 1
+    assert loaded == [idle], "live sessions should skip container lookups"
+    assert redis_mgr.needs_restore(idle) is True
+    assert redis_mgr.needs_restore(live) is False
+
+
+def test_live_heartbeat_marker_respects_lowered_timeout(
+    redis_mgr: SandboxManager,
+    monkeypatch,
+):
+    session = "sess-lowered"
+    redis_mgr.create(
+        sandbox_type=SandboxType.BASE,
+        meta={"session_ctx_id": session},
+    )
+    redis_mgr.update_heartbeat(session, ts=time.time() - 30)
+    assert session in redis_mgr.get_live_heartbeats([session])
+
+    # The marker's TTL still has 30s left, but the new timeout has passed
+    monkeypatch.setattr(redis_mgr.config, "heartbeat_timeout", 10)
+    assert redis_mgr.get_live_heartbeats([session]) == {}
+
+    metrics = redis_mgr.scan_heartbeat_once()
+    assert metrics["reaped_sessions"] == 1
+    assert redis_mgr.needs_restore(session) is True
+
+
+def test_reap_and_release_drop_live_heartbeat_marker(
+    redis_mgr: SandboxManager,
+):
+    reaped, released = "sess-marker-reaped", "sess-marker-released"
+    names = {
+        session: redis_mgr.create(
+            sandbox_type=SandboxType.BASE,
+            meta={"session_ctx_id": session},
+        )
+        for session in (reaped, released)
+    }
+    assert set(redis_mgr.get_live_heartbeats([reaped, released])) == {
+        reaped,
+        released,
+    }
+
+    assert redis_mgr.reap_session(reaped) is True
+    assert redis_mgr.release(names[released]) is True
+
+    assert redis_mgr.get_live_heartbeats([reaped, released]) == {}
+
+
+def test_scan_between_full_passes_uses_heartbeat_index(
+    redis_mgr: SandboxManager,
+):
+    live, idle = "sess-idx-live", "sess-idx-idle"
+    for session in (live, idle):
+        redis_mgr.create(
+            sandbox_type=SandboxType.BASE,
+            meta={"session_ctx_id": session},
+        )
+
+    # First call is a full pass; nothing is idle yet
+    assert redis_mgr.scan_heartbeat_once()["reaped_sessions"] == 0
+
+    # A back-dated heartbeat moves the session to the front of the index
+    redis_mgr.update_heartbeat(idle, ts=time.time() - 100)
+
+    metrics = redis_mgr.scan_heartbeat_once()
+    assert metrics["scanned_sessions"] == 1
+    assert metrics["reaped_sessions"] == 1
+    assert redis_mgr.needs_restore(idle) is True
+    assert redis_mgr.needs_restore(live) is False
+    assert redis_mgr.get_idle_heartbeat_candidates(time.time()) == [live]
+
+
+def test_drop_heartbeat_index_keeps_concurrent_heartbeats(
+    redis_mgr: SandboxManager,
+):
+    stale, fresh = "sess-drop-stale", "sess-drop-fresh"
+    for session in (stale, fresh):
+        redis_mgr.create(
+            sandbox_type=SandboxType.BASE,
+            meta={"session_ctx_id": session},
+        )
+    scores = redis_mgr.get_heartbeat_index_scores([stale, fresh])
+    assert set(scores) == {stale, fresh}
+
+    # A heartbeat lands between the scanner's read and its drop
+    redis_mgr.update_heartbeat(fresh, ts=scores[fresh] + 1)
+    redis_mgr.drop_heartbeat_index(scores)
+
+    assert redis_mgr.get_idle_heartbeat_candidates(time.time() + 10) == [
+        fresh,
+    ]
+
+
+def test_scan_keeps_index_for_sessions_it_failed_to_load(
+    redis_mgr: SandboxManager,
+    monkeypatch,
+):
+    session = "sess-unreadable"
+    redis_mgr.create(
+        sandbox_type=SandboxType.BASE,
+        meta={"session_ctx_id": session},
+    )
+    _force_expire_session(redis_mgr, session, seconds_ago=100)
+
+    def _fail(keys):
+        raise ConnectionError("storage unavailable")
+
+    monkeypatch.setattr(redis_mgr.session_mapping, "mget", _fail)
+
+    metrics = redis_mgr.scan_heartbeat_once()
+    assert metrics["errors"] == 1
+    assert metrics["skipped_no_running_containers"] == 0
+    assert redis_mgr.get_idle_heartbeat_candidates(time.time()) == [session]
+
+
+def test_multi_instance_scan_race_only_one_reaps(redis_mgr: SandboxManager):
+    session = "sess-race"
+    redis_mgr.create(
+        sandbox_type=SandboxType.BASE,
+        meta={"session_ctx_id": session},
+    )
+    _force_expire_session(redis_mgr, session, seconds_ago=100)
+
+    # A second instance sharing the same (fake) Redis
+    peer = SandboxManager(
+        config=redis_mgr.config,
+        default_type=SandboxType.BASE,
+    )
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def _scan(name, m):
+        # Release both scanners at once so the lock is actually contended
+        barrier.wait(timeout=5)
+        results[name] = m.scan_heartbeat_once()
+
+    threads = [
+        threading.Thread(target=_scan, args=(name, m))
+        for name, m in (("a", redis_mgr), ("b", peer))
+    ]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+    finally:
+        peer.cleanup()
+
+    assert set(results) == {"a", "b"}
+    assert sum(r["reaped_sessions"] for r in results.values()) == 1
+    assert sum(r["errors"] for r in results.values()) == 0
+    assert redis_mgr.needs_restore(session) is True
@@ -7,6 +7,7 @@ import uuid
 from datetime import datetime
 
 import pytest
+import pytest_asyncio
 
 from agentscope_runtime.tools.modelstudio_memory import (
     AddMemory,
@@ -34,6 +35,15 @@ from agentscope_runtime.tools.modelstudio_memory import (
 
 NO_DASHSCOPE_KEY = os.getenv("DASHSCOPE_API_KEY", "") == ""
 
+pytestmark = [
+    pytest.mark.skipif(
+        NO_DASHSCOPE_KEY,
+        reason="DASHSCOPE_API_KEY not set",
+    ),
+    # All tests read one shared fixture, keep them on one xdist worker
+    pytest.mark.xdist_group("dashscope_memory"),
+]
+
 
 def generate_test_user_id() -> str:
     """Generate a unique test user ID for each test run."""
@@ -42,73 +52,130 @@ def generate_test_user_id() -> str:
     return f"test_memory_user_{mmdd}_{user_uuid}"
 
 
-@pytest.fixture
-def add_memory_component():
-    """Fixture for AddMemory component."""
-    component = AddMemory()
-    yield component
-
-
-@pytest.fixture
-def search_memory_component():
-    """Fixture for SearchMemory component."""
-    component = SearchMemory()
-    yield component
-
-
-@pytest.fixture
-def list_memory_component():
-    """Fixture for ListMemory component."""
-    component = ListMemory()
-    yield component
-
+async def _wait_for_node(
+    list_component: ListMemory,
+    user_id: str,
+    memory_node_id: str,
+    timeout: float = 5.0,
+) -> bool:
+    """Poll ListMemory with backoff until the node shows up or time runs out.
+
+    Returns whether the node became visible; callers proceed either way.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while True:
+        result = await list_component.arun(
+            ListMemoryInput(user_id=user_id, page_size=10, page_num=1),
+        )
+        if memory_node_id in {n.memory_node_id for n in result.memory_nodes}:
+            return True
+        if loop.time() + delay > deadline:
+            return False
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def dashscope_results():
+    """Run every memory API call once, overlapping independent requests.
+
+    The calls only depend on each other through the added memory node and
+    the created schema, so they are issued as two concurrent batches and
+    the tests below just assert on their slice of the results.
+    """
+    test_user_id = generate_test_user_id()
+    mmdd = datetime.now().strftime("%m%d%H%M%S")
 
-@pytest.fixture
-def delete_memory_component():
-    """Fixture for DeleteMemory component."""
-    component = DeleteMemory()
-    yield component
+    add_input = AddMemoryInput(
+        user_id=test_user_id,
+        messages=[
+            Message(
+                role="user",
+                content="I love playing basketball on weekends",
+            ),
+            Message(
+                role="assistant",
+                content="That's great! Basketball is a fun and healthy "
+                "activity.",
+            ),
+        ],
+        meta_data={"source": "pytest", "test": "add_memory"},
+    )
+    # SearchMemoryInput requires messages for context
+    search_input = SearchMemoryInput(
+        user_id=test_user_id,
+        messages=[Message(role="user", content="basketball")],
+        top_k=5,
+    )
+    list_input = ListMemoryInput(
+        user_id=test_user_id,
+        page_size=10,
+        page_num=1,
+    )
+    schema_input = CreateProfileSchemaInput(
+        name=f"test_schema_{mmdd}",
+        description="Test profile schema for pytest",
+        attributes=[
+            ProfileAttribute(
+                name="age",
+                description="User's age",
+            ),
+            ProfileAttribute(
+                name="occupation",
+                description="User's occupation or job title",
+            ),
+            ProfileAttribute(
+                name="hobbies",
+                description="User's hobbies and interests",
+            ),
+        ],
+    )
 
+    add, search, list_, schema = await asyncio.gather(
+        AddMemory().arun(add_input),
+        SearchMemory().arun(search_input),
+        ListMemory().arun(list_input),
+        CreateProfileSchema().arun(schema_input),
+    )
 
-@pytest.fixture
-def create_profile_schema_component():
-    """Fixture for CreateProfileSchema component."""
-    component = CreateProfileSchema()
-    yield component
+    async def _delete():
+        if not add.memory_nodes:
+            return None
+        memory_node_id = add.memory_nodes[0].memory_node_id
+        # Wait for the memory to be processed before deleting it
+        await _wait_for_node(ListMemory(), test_user_id, memory_node_id)
+        return await DeleteMemory().arun(
+            DeleteMemoryInput(
+                user_id=test_user_id,
+                memory_node_id=memory_node_id,
+            ),
+        )
 
+    delete, profile = await asyncio.gather(
+        _delete(),
+        GetUserProfile().arun(
+            GetUserProfileInput(
+                schema_id=schema.profile_schema_id,
+                user_id=test_user_id,
+            ),
+        ),
+    )
 
-@pytest.fixture
-def get_user_profile_component():
-    """Fixture for GetUserProfile component."""
-    component = GetUserProfile()
-    yield component
+    return {
+        "add": add,
+        "search": search,
+        "list": list_,
+        "delete": delete,
+        "schema": schema,
+        "profile": profile,
+    }
 
 
-@pytest.mark.asyncio
-@pytest.mark.skipif(
-    NO_DASHSCOPE_KEY,
-    reason="DASHSCOPE_API_KEY not set",
-)
-async def test_add_memory_success(add_memory_component):
+async def test_add_memory_success(dashscope_results):
     """Test adding a memory node."""
-    test_user_id = generate_test_user_id()
-
-    # Prepare test data
-    messages = [
-        Message(role="user", content="I love playing basketball on weekends"),
-        Message(
-            role="assistant",
-            content="That's great! Basketball is a fun and healthy activity.",
-        ),
-    ]
-
-    input_data = AddMemoryInput(
-        user_id=test_user_id,
-        messages=messages,
-        meta_data={"source": "pytest", "test": "add_memory"},
-    )
-
-    result = await add_memory_component.arun(input_data)
+    result = dashscope_results["add"]
 
     # Assertions
     assert isinstance(result, AddMemoryOutput)
@@ -118,27 +185,9 @@ async def test_add_memory_success(add_memory_component):
             assert isinstance(node, MemoryNode)
 
 
-@pytest.mark.asyncio
-@pytest.mark.skipif(
-    NO_DASHSCOPE_KEY,
-    reason="DASHSCOPE_API_KEY not set",
-)
-async def test_search_memory_success(search_memory_component):
+async def test_search_memory_success(dashscope_results):
     """Test searching memory nodes."""
-    test_user_id = generate_test_user_id()
-
-    # SearchMemoryInput requires messages for context
-    messages = [
-        Message(role="user", content="basketball"),
-    ]
-
-    input_data = SearchMemoryInput(
-        user_id=test_user_id,
-        messages=messages,
-        top_k=5,
-    )
-
-    result = await search_memory_component.arun(input_data)
+    result = dashscope_results["search"]
 
     # Assertions
     assert isinstance(result, SearchMemoryOutput)
@@ -148,22 +197,9 @@ async def test_search_memory_success(search_memory_component):
             assert isinstance(node, MemoryNode)
 
 
-@pytest.mark.asyncio
-@pytest.mark.skipif(
-    NO_DASHSCOPE_KEY,
-    reason="DASHSCOPE_API_KEY not set",
-)
-async def test_list_memory_success(list_memory_component):
+async def test_list_memory_success(dashscope_results):
     """Test listing memory nodes with pagination."""
-    test_user_id = generate_test_user_id()
-
-    input_data = ListMemoryInput(
-        user_id=test_user_id,
-        page_size=10,
-        page_num=1,
-    )
-
-    result = await list_memory_component.arun(input_data)
+    result = dashscope_results["list"]
 
     # Assertions
     assert isinstance(result, ListMemoryOutput)
@@ -174,129 +210,29 @@ async def test_list_memory_success(list_memory_component):
             assert isinstance(node, MemoryNode)
 
 
-@pytest.mark.asyncio
-@pytest.mark.skipif(
-    NO_DASHSCOPE_KEY,
-    reason="DASHSCOPE_API_KEY not set",
-)
-async def test_delete_memory_success(
-    add_memory_component,
-    delete_memory_component,
-):
+async def test_delete_memory_success(dashscope_results):
     """Test deleting a memory node."""
-    test_user_id = generate_test_user_id()
-
-    # First, add a memory node
-    messages = [
-        Message(role="user", content="Remember that I like playing football"),
-        Message(role="assistant", content="Understood, test message received"),
-    ]
-
-    add_input = AddMemoryInput(
-        user_id=test_user_id,
-        messages=messages,
-        meta_data={"test": "delete_memory"},
-    )
-
-    add_result = await add_memory_component.arun(add_input)
-
-    # Wait for several seconds for the memory to be processed
-    await asyncio.sleep(3)
-    if add_result.memory_nodes:
-        memory_node_id = add_result.memory_nodes[0].memory_node_id
-
-        # Now delete it
-        delete_input = DeleteMemoryInput(
-            user_id=test_user_id,
-            memory_node_id=memory_node_id,
-        )
-
-        result = await delete_memory_component.arun(delete_input)
+    result = dashscope_results["delete"]
 
+    # Nothing to delete when the add call returned no memory node
+    if result is not None:
         # Assertions
         assert isinstance(result, DeleteMemoryOutput)
         assert result.request_id is not None
 
 
-@pytest.mark.asyncio
-@pytest.mark.skipif(
-    NO_DASHSCOPE_KEY,
-    reason="DASHSCOPE_API_KEY not set",
-)
-async def test_create_profile_schema_success(create_profile_schema_component):
+async def test_create_profile_schema_success(dashscope_results):
     """Test creating a user profile schema."""
-    # Generate unique schema name
-    mmdd = datetime.now().strftime("%m%d%H%M%S")
-    schema_name = f"test_schema_{mmdd}"
-
-    # Define profile attributes
-    attributes = [
-        ProfileAttribute(
-            name="age",
-            description="User's age",
-        ),
-        ProfileAttribute(
-            name="occupation",
-            description="User's occupation or job title",
-        ),
-        ProfileAttribute(
-            name="hobbies",
-            description="User's hobbies and interests",
-        ),
-    ]
-
-    input_data = CreateProfileSchemaInput(
-        name=schema_name,
-        description="Test profile schema for pytest",
-        attributes=attributes,
-    )
-
-    # Call the async run method
-    result = await create_profile_schema_component.arun(input_data)
+    result = dashscope_results["schema"]
 
     # Assertions
     assert isinstance(result, CreateProfileSchemaOutput)
     assert result.profile_schema_id is not None
 
 
-@pytest.mark.asyncio
-@pytest.mark.skipif(
-    NO_DASHSCOPE_KEY,
-    reason="DASHSCOPE_API_KEY not set",
-)
-async def test_get_user_profile_success(
-    create_profile_schema_component,
-    get_user_profile_component,
-):
+async def test_get_user_profile_success(dashscope_results):
     """Test retrieving a user profile."""
-    test_user_id = generate_test_user_id()
-
-    # First, create a profile schema
-    mmdd = datetime.now().strftime("%m%d%H%M%S")
-    schema_name = f"test_profile_schema_{mmdd}"
-
-    attributes = [
-        ProfileAttribute(
-            name="test_field",
-            description="Test field",
-        ),
-    ]
-
-    schema_input = CreateProfileSchemaInput(
-        name=schema_name,
-        attributes=attributes,
-    )
-
-    schema_result = await create_profile_schema_component.arun(schema_input)
-    schema_id = schema_result.profile_schema_id
-
-    # Now get the user profile
-    input_data = GetUserProfileInput(
-        schema_id=schema_id,
-        user_id=test_user_id,
-    )
-
-    result = await get_user_profile_component.arun(input_data)
+    result = dashscope_results["profile"]
 
     # Assertions
     assert isinstance(result, GetUserProfileOutput)
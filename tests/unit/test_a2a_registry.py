@@ -10,15 +10,15 @@ Tests cover:
 - _build_nacos_client_config() helper function
 - Environment variable loading and parsing
 """
-import os
-import tempfile
+import sys
 from unittest.mock import patch, MagicMock
 
 import pytest
-from a2a.types import AgentCard
+from a2a.types import AgentCapabilities, AgentCard
 
 from agentscope_runtime.engine.deployers.adapter.a2a import (
     A2ARegistry,
+    nacos_a2a_registry,
 )
 from agentscope_runtime.engine.deployers.adapter.a2a.nacos_a2a_registry import (  # noqa: E501
     NacosSettings,
@@ -30,10 +30,6 @@ from agentscope_runtime.engine.deployers.adapter.a2a.nacos_a2a_registry import (
 @pytest.fixture
 def reset_registry_settings():
     """Fixture to reset and restore nacos settings for testing."""
-    from agentscope_runtime.engine.deployers.adapter.a2a import (
-        nacos_a2a_registry,
-    )
-
     original_settings = nacos_a2a_registry._nacos_settings
     nacos_a2a_registry._nacos_settings = None
 
@@ -43,6 +39,57 @@ def reset_registry_settings():
     nacos_a2a_registry._nacos_settings = original_settings
 
 
+@pytest.fixture(scope="session")
+def mock_v2_nacos():
+    """Build the mocked ``v2.nacos`` module once for the whole session.
+
+    ``ClientConfigBuilder()`` returns a builder whose setters chain back to
+    itself and whose ``build()`` returns ``ClientConfig``.
+    """
+    client_config = MagicMock()
+    builder = MagicMock()
+    for attr in (
+        "server_address",
+        "username",
+        "password",
+        "namespace_id",
+        "access_key",
+        "secret_key",
+    ):
+        getattr(builder, attr).return_value = builder
+    builder.build.return_value = client_config
+
+    module = MagicMock()
+    module.ClientConfig = client_config
+    module.ClientConfigBuilder = MagicMock(return_value=builder)
+    return module
+
+
+@pytest.fixture
+def patched_v2_nacos(mock_v2_nacos, monkeypatch):
+    """Install the mocked ``v2.nacos`` module into ``sys.modules``."""
+    v2 = MagicMock()
+    v2.nacos = mock_v2_nacos
+    monkeypatch.setitem(sys.modules, "v2", v2)
+    monkeypatch.setitem(sys.modules, "v2.nacos", mock_v2_nacos)
+    yield mock_v2_nacos
+
+
+@pytest.fixture(scope="session")
+def base_agent_card():
+    """A minimal valid AgentCard shared by the registration tests."""
+    return AgentCard(
+        name="test_agent",
+        version="1.0.0",
+        description="Test",
+        url="http://localhost:8080",
+        capabilities=AgentCapabilities(),
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        skills=[],
+    )
+
+
 class MockRegistry(A2ARegistry):
     """Mock registry implementation for testing."""
 
@@ -70,26 +117,12 @@ class TestA2ARegistry:
         assert hasattr(A2ARegistry, "registry_name")
         assert hasattr(A2ARegistry, "register")
 
-    def test_concrete_implementation(self):
+    def test_concrete_implementation(self, base_agent_card):
         """Test that a concrete implementation works correctly."""
         registry = MockRegistry("test")
         assert registry.registry_name() == "test"
 
-        # Create a minimal AgentCard for testing
-        from a2a.types import AgentCapabilities
-
-        agent_card = AgentCard(
-            name="test_agent",
-            version="1.0.0",
-            description="Test agent description",
-            url="http://localhost:8080",
-            capabilities=AgentCapabilities(),
-            defaultInputModes=["text"],
-            defaultOutputModes=["text"],
-            skills=[],
-        )
-
-        registry.register(agent_card)
+        registry.register(base_agent_card)
         assert len(registry.registered_cards) == 1
         assert registry.registered_cards[0].name == "test_agent"
 
@@ -97,38 +130,70 @@ class TestA2ARegistry:
 class TestNacosSettings:
     """Test NacosSettings configuration class."""
 
-    def test_default_values(self):
+    def test_default_values(self, monkeypatch):
         """Test NacosSettings with default values."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = NacosSettings()
-            assert settings.NACOS_SERVER_ADDR == "localhost:8848"
-            assert settings.NACOS_USERNAME is None
-            assert settings.NACOS_PASSWORD is None
-            assert settings.NACOS_NAMESPACE_ID is None
-            assert settings.NACOS_ACCESS_KEY is None
-            assert settings.NACOS_SECRET_KEY is None
-
-    def test_from_environment_variables(self):
-        """Test loading settings from environment variables."""
-        with patch.dict(
-            os.environ,
-            {
-                "NACOS_SERVER_ADDR": "nacos.example.com:8848",
-                "NACOS_USERNAME": "testuser",
-                "NACOS_PASSWORD": "testpass",
-                "NACOS_NAMESPACE_ID": "test-namespace",
-                "NACOS_ACCESS_KEY": "test-access-key",
-                "NACOS_SECRET_KEY": "test-secret-key",
-            },
-            clear=False,
-        ):
-            settings = NacosSettings()
-            assert settings.NACOS_SERVER_ADDR == "nacos.example.com:8848"
-            assert settings.NACOS_USERNAME == "testuser"
-            assert settings.NACOS_PASSWORD == "testpass"
-            assert settings.NACOS_NAMESPACE_ID == "test-namespace"
-            assert settings.NACOS_ACCESS_KEY == "test-access-key"
-            assert settings.NACOS_SECRET_KEY == "test-secret-key"
+        # Only the NACOS_* fields are read from the environment
+        for name in NacosSettings.model_fields:
+            monkeypatch.delenv(name, raising=False)
+
+        settings = NacosSettings()
+        assert settings.NACOS_SERVER_ADDR == "localhost:8848"
+        assert settings.NACOS_USERNAME is None
+        assert settings.NACOS_PASSWORD is None
+        assert settings.NACOS_NAMESPACE_ID is None
+        assert settings.NACOS_ACCESS_KEY is None
+        assert settings.NACOS_SECRET_KEY is None
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            pytest.param(
+                {
+                    "NACOS_SERVER_ADDR": "nacos.example.com:8848",
+                    "NACOS_USERNAME": "testuser",
+                    "NACOS_PASSWORD": "testpass",
+                    "NACOS_NAMESPACE_ID": "test-namespace",
+                    "NACOS_ACCESS_KEY": "test-access-key",
+                    "NACOS_SECRET_KEY": "test-secret-key",
+                },
+                {},
+                id="all_fields",
+            ),
+            pytest.param(
+                {
+                    "NACOS_SERVER_ADDR": "nacos.example.com:8848",
+                    "NACOS_USERNAME": "user",
+                },
+                # Missing NACOS_PASSWORD
+                {"NACOS_PASSWORD": None},
+                id="partial_auth",
+            ),
+            pytest.param(
+                {
+                    "NACOS_SERVER_ADDR": "nacos.example.com:8848",
+                    "NACOS_NAMESPACE_ID": "my-namespace",
+                    "NACOS_ACCESS_KEY": "my-access-key",
+                    "NACOS_SECRET_KEY": "my-secret-key",
+                },
+                {"NACOS_USERNAME": None, "NACOS_PASSWORD": None},
+                id="namespace_and_access_key",
+            ),
+        ],
+    )
+    def test_from_environment_variables(self, env, expected, monkeypatch):
+        """Test loading settings from environment variables.
+
+        Every variable in ``env`` must be read back as-is, and every field
+        in ``expected`` must hold the given value.
+        """
+        for name in NacosSettings.model_fields:
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        settings = NacosSettings()
+        for name, value in {**env, **expected}.items():
+            assert getattr(settings, name) == value
 
     def test_extra_fields_allowed(self):
         """Test that extra fields are allowed when passed directly."""
@@ -143,199 +208,94 @@ class TestNacosSettings:
         assert settings.NACOS_CUSTOM_FIELD == "custom_value"
 
 
+@pytest.mark.usefixtures("reset_registry_settings")
 class TestGetNacosSettings:
     """Test get_nacos_settings() function."""
 
-    def test_singleton_behavior(self, reset_registry_settings):
+    def test_singleton_behavior(self):
         """Test that get_nacos_settings returns a singleton."""
-        from agentscope_runtime.engine.deployers.adapter.a2a import (
-            nacos_a2a_registry,
-        )
-
-        # Reset singleton
-        nacos_a2a_registry._nacos_settings = None
-
         settings1 = get_nacos_settings()
         settings2 = get_nacos_settings()
         assert settings1 is settings2
 
-    def test_loads_env_files(self, reset_registry_settings):
+    def test_loads_env_files(self):
         """Test that get_nacos_settings loads .env files."""
-        from agentscope_runtime.engine.deployers.adapter.a2a import (
+        # Mock find_dotenv and load_dotenv so no .env file touches disk
+        with patch.object(
             nacos_a2a_registry,
-        )
-
-        # Create a temporary .env file
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".env",
-            delete=False,
-        ) as f:
-            f.write("NACOS_SERVER_ADDR=test.nacos.com:8848\n")
-            env_file = f.name
-
-        try:
-            # Mock find_dotenv to return our test file
-            with patch(
-                "agentscope_runtime.engine.deployers.adapter.a2a"
-                ".nacos_a2a_registry.find_dotenv",
-                return_value=env_file,
-            ):
-                # Note: load_dotenv with override=False won't
-                # override existing env vars. So we need to clear
-                # them first
-                with patch.dict(os.environ, {}, clear=True):
-                    nacos_a2a_registry._nacos_settings = None
-                    settings = get_nacos_settings()
-                    # Just verify it doesn't crash
-                    assert settings is not None
-        finally:
-            os.unlink(env_file)
+            "find_dotenv",
+            return_value="fake.env",
+        ), patch.object(
+            nacos_a2a_registry,
+            "load_dotenv",
+            return_value=True,
+        ) as m_load:
+            settings = get_nacos_settings()
+            assert settings is not None
+            m_load.assert_called_once_with("fake.env", override=False)
 
 
+@pytest.mark.usefixtures("reset_registry_settings")
 class TestCreateNacosRegistryFromEnv:
     """Test create_nacos_registry_from_env() factory function."""
 
     def test_sdk_not_available(self):
         """Test when Nacos SDK is not available."""
-        from agentscope_runtime.engine.deployers.adapter.a2a import (
-            nacos_a2a_registry,
-        )
-
-        original_settings = nacos_a2a_registry._nacos_settings
-        nacos_a2a_registry._nacos_settings = None
-
-        try:
-            # Mock _NACOS_SDK_AVAILABLE to False
-            with patch(
-                "agentscope_runtime.engine.deployers.adapter.a2a"
-                ".nacos_a2a_registry._NACOS_SDK_AVAILABLE",
-                False,
-            ):
-                result = create_nacos_registry_from_env()
-                # Should return None when SDK is not available
-                assert result is None
-        finally:
-            nacos_a2a_registry._nacos_settings = original_settings
+        # Mock _NACOS_SDK_AVAILABLE to False
+        with patch(
+            "agentscope_runtime.engine.deployers.adapter.a2a"
+            ".nacos_a2a_registry._NACOS_SDK_AVAILABLE",
+            False,
+        ):
+            result = create_nacos_registry_from_env()
+            # Should return None when SDK is not available
+            assert result is None
 
-    def test_nacos_registry_with_sdk_mock(self):
+    def test_nacos_registry_with_sdk_mock(self, patched_v2_nacos, monkeypatch):
         """Test Nacos registry creation with mocked SDK."""
-        import sys
-        from agentscope_runtime.engine.deployers.adapter.a2a import (
-            nacos_a2a_registry,
+        # Mock NacosRegistry class
+        mock_nacos_registry_instance = MagicMock()
+        mock_nacos_registry_instance.registry_name.return_value = "nacos"
+        mock_nacos_registry_class = MagicMock(
+            return_value=mock_nacos_registry_instance,
         )
 
-        original_settings = nacos_a2a_registry._nacos_settings
-        nacos_a2a_registry._nacos_settings = None
-
-        try:
-            # Mock the nacos SDK imports and classes
-            mock_client_config = MagicMock()
-            mock_builder = MagicMock()
-            mock_builder.server_address.return_value = mock_builder
-            mock_builder.username.return_value = mock_builder
-            mock_builder.password.return_value = mock_builder
-            mock_builder.namespace_id.return_value = mock_builder
-            mock_builder.access_key.return_value = mock_builder
-            mock_builder.secret_key.return_value = mock_builder
-            mock_builder.build.return_value = mock_client_config
-
-            # Mock NacosRegistry class
-            mock_nacos_registry_instance = MagicMock()
-            mock_nacos_registry_instance.registry_name.return_value = "nacos"
-            mock_nacos_registry_class = MagicMock(
-                return_value=mock_nacos_registry_instance,
-            )
-
-            # Create a mock v2.nacos module
-            mock_v2_nacos = MagicMock()
-            mock_v2_nacos.ClientConfig = mock_client_config
-            mock_v2_nacos.ClientConfigBuilder = MagicMock(
-                return_value=mock_builder,
-            )
-
-            # Mock v2.nacos module in sys.modules
-            original_v2_nacos = sys.modules.get("v2.nacos")
-            sys.modules["v2.nacos"] = mock_v2_nacos
-            sys.modules["v2"] = MagicMock()
-            sys.modules["v2"].nacos = mock_v2_nacos
-
-            try:
-                # Ensure at least one NACOS_* env var is explicitly set so that
-                # create_nacos_registry_from_env() treats registry as enabled.
-                with patch.dict(
-                    os.environ,
-                    {"NACOS_SERVER_ADDR": "nacos.example.com:8848"},
-                    clear=False,
-                ):
-                    with patch(
-                        "agentscope_runtime.engine.deployers.adapter"
-                        ".a2a.nacos_a2a_registry.NacosRegistry",
-                        mock_nacos_registry_class,
-                    ):
-                        result = create_nacos_registry_from_env()
-                        # Should return a registry instance when
-                        # SDK is available and NACOS_* is configured
-                        assert result is not None
-                        assert result.registry_name() == "nacos"
-            finally:
-                # Restore original module
-                if original_v2_nacos is not None:
-                    sys.modules["v2.nacos"] = original_v2_nacos
-                elif "v2.nacos" in sys.modules:
-                    del sys.modules["v2.nacos"]
-                if "v2" in sys.modules and not hasattr(
-                    sys.modules["v2"],
-                    "nacos",
-                ):
-                    # Only delete if we created it
-                    pass
-        finally:
-            nacos_a2a_registry._nacos_settings = original_settings
+        # Ensure at least one NACOS_* env var is explicitly set so that
+        # create_nacos_registry_from_env() treats registry as enabled.
+        monkeypatch.setenv("NACOS_SERVER_ADDR", "nacos.example.com:8848")
+        with patch(
+            "agentscope_runtime.engine.deployers.adapter"
+            ".a2a.nacos_a2a_registry.NacosRegistry",
+            mock_nacos_registry_class,
+        ):
+            result = create_nacos_registry_from_env()
+            # Should return a registry instance when
+            # SDK is available and NACOS_* is configured
+            assert result is not None
+            assert result.registry_name() == "nacos"
 
 
 class TestCreateNacosRegistryFromSettings:
     """Test _build_nacos_client_config() helper function."""
 
-    def test_nacos_config_build_error(self):
+    def test_nacos_config_build_error(self, patched_v2_nacos, monkeypatch):
         """Test when Nacos client config build fails."""
-        import sys
-
         settings = NacosSettings(
             NACOS_SERVER_ADDR="test.nacos.com:8848",
         )
 
-        # Mock successful import but failed build
-        mock_builder = MagicMock()
-        mock_builder.server_address.return_value = mock_builder
-        mock_builder.build.side_effect = Exception("Build failed")
-
-        mock_v2_nacos = MagicMock()
-        mock_v2_nacos.ClientConfigBuilder = MagicMock(
-            return_value=mock_builder,
+        # Mock successful import but failed build; the builder is shared
+        # across the session, so the failure is undone on teardown.
+        builder = patched_v2_nacos.ClientConfigBuilder.return_value
+        monkeypatch.setattr(
+            builder.build,
+            "side_effect",
+            Exception("Build failed"),
         )
 
-        original_v2_nacos = sys.modules.get("v2.nacos")
-        sys.modules["v2.nacos"] = mock_v2_nacos
-
-        try:
-            # pylint: disable=import-outside-toplevel
-            from agentscope_runtime.engine.deployers.adapter.a2a import (
-                nacos_a2a_registry,
-            )
-
-            _build_nacos_client_config = (
-                nacos_a2a_registry._build_nacos_client_config
-            )
-
-            # Should raise exception when build fails
-            with pytest.raises(Exception, match="Build failed"):
-                _build_nacos_client_config(settings)
-        finally:
-            if original_v2_nacos is not None:
-                sys.modules["v2.nacos"] = original_v2_nacos
-            elif "v2.nacos" in sys.modules:
-                del sys.modules["v2.nacos"]
+        # Should raise exception when build fails
+        with pytest.raises(Exception, match="Build failed"):
+            nacos_a2a_registry._build_nacos_client_config(settings)
 
 
 class TestOptionalDependencyHandling:
@@ -349,11 +309,6 @@ class TestOptionalDependencyHandling:
         )
 
         # Mock ImportError when trying to build client config
-        # pylint: disable=import-outside-toplevel
-        from agentscope_runtime.engine.deployers.adapter.a2a import (
-            nacos_a2a_registry,
-        )
-
         _build_nacos_client_config = (
             nacos_a2a_registry._build_nacos_client_config
         )
@@ -386,84 +341,47 @@ class TestOptionalDependencyHandling:
             assert result is None
 
 
-class TestNacosSettingsValidation:
-    """Test NacosSettings validation and edge cases."""
-
-    def test_nacos_config_with_partial_auth(self):
-        """Test Nacos config with only username (missing password)."""
-        with patch.dict(
-            os.environ,
-            {
-                "NACOS_SERVER_ADDR": "nacos.example.com:8848",
-                "NACOS_USERNAME": "user",
-                # Missing NACOS_PASSWORD
-            },
-            clear=False,
-        ):
-            settings = NacosSettings()
-            assert settings.NACOS_USERNAME == "user"
-            assert settings.NACOS_PASSWORD is None
-
-    def test_nacos_config_with_namespace_and_access_key(self):
-        """Test Nacos config with namespace ID and access key/secret key."""
-        with patch.dict(
-            os.environ,
-            {
-                "NACOS_SERVER_ADDR": "nacos.example.com:8848",
-                "NACOS_NAMESPACE_ID": "my-namespace",
-                "NACOS_ACCESS_KEY": "my-access-key",
-                "NACOS_SECRET_KEY": "my-secret-key",
-            },
-            clear=False,
-        ):
-            settings = NacosSettings()
-            assert settings.NACOS_NAMESPACE_ID == "my-namespace"
-            assert settings.NACOS_ACCESS_KEY == "my-access-key"
-            assert settings.NACOS_SECRET_KEY == "my-secret-key"
-
-
 class TestErrorHandlingInRegistration:
     """Test error handling scenarios during registration."""
 
-    def test_registry_with_invalid_agent_card(self):
-        """Test registration with minimal/invalid agent card."""
-        registry = MockRegistry()
-
-        # Create agent card with missing optional fields
-        from a2a.types import AgentCapabilities
-
-        minimal_card = AgentCard(
-            name="minimal_agent",
-            version="0.0.1",
-            description="",
-            url="",
-            capabilities=AgentCapabilities(),
-            defaultInputModes=[],
-            defaultOutputModes=[],
-            skills=[],
-        )
-
-        # Should not raise even with minimal card
-        registry.register(minimal_card)
-        assert len(registry.registered_cards) == 1
-
-    def test_registry_with_empty_transports(self):
-        """Test registration with empty configuration."""
+    @pytest.mark.parametrize(
+        "card_kwargs",
+        [
+            # Agent card with missing optional fields
+            pytest.param(
+                {
+                    "name": "minimal_agent",
+                    "version": "0.0.1",
+                    "description": "",
+                    "url": "",
+                    "defaultInputModes": [],
+                    "defaultOutputModes": [],
+                },
+                id="minimal_card",
+            ),
+            pytest.param(
+                {
+                    "name": "test_agent",
+                    "version": "1.0.0",
+                    "description": "Test",
+                    "url": "http://localhost:8080",
+                    "defaultInputModes": ["text"],
+                    "defaultOutputModes": ["text"],
+                },
+                id="empty_transports",
+            ),
+        ],
+    )
+    def test_register_variants(self, card_kwargs):
+        """Test registration with minimal and default agent cards."""
         registry = MockRegistry()
 
-        from a2a.types import AgentCapabilities
-
         agent_card = AgentCard(
-            name="test_agent",
-            version="1.0.0",
-            description="Test",
-            url="http://localhost:8080",
             capabilities=AgentCapabilities(),
-            defaultInputModes=["text"],
-            defaultOutputModes=["text"],
             skills=[],
+            **card_kwargs,
         )
 
-        # Register
+        # Should not raise even with minimal card
         registry.register(agent_card)
         assert len(registry.registered_cards) == 1
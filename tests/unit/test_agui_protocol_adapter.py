@@ -1,15 +1,18 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=redefined-outer-name, protected-access
 import json
+from collections import Counter
 
+import httpx
 import pytest
+import pytest_asyncio
 from ag_ui.core import RunAgentInput
 from ag_ui.core.types import (
     Context,
     UserMessage,
 )
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 from agentscope_runtime.engine.deployers.adapter.agui import (
     AGUIDefaultAdapter,
@@ -23,14 +26,54 @@ from agentscope_runtime.engine.schemas.agent_schemas import (
     RunStatus,
 )
 
+# SSE framing of each AG-UI event: "data: <json>\n\n"
+_SSE_PREFIX = "data: "
+_SSE_SUFFIX = "\n\n"
+
+TOKENS = ["Hello", " there", "!", " How", " are", " you", "?"]
+EXPECTED_TEXT = "".join(TOKENS)
+
+
+async def mock_agent_execution(
+    request: AgentRequest,
+):
+    """Stream ``TOKENS`` back as one assistant text message."""
+    response_builder = ResponseBuilder(
+        session_id=request.session_id,
+    )
+
+    for event in response_builder.generate_streaming_response(
+        text_tokens=TOKENS,
+        role="assistant",
+    ):
+        yield event
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def agui_client():
+    """Share one AG-UI app and in-process async client across the module."""
+    adapter = AGUIDefaultAdapter()
+    app = FastAPI()
+    adapter.add_endpoint(app, mock_agent_execution)
+    # ASGITransport drives the app on the test's own loop, without the
+    # thread portal TestClient runs every request through.
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver",
+    ) as client:
+        yield adapter, client
+
 
 class TestAGUIEventStreaming:
     """Test end-to-end AG-UI request and response flow."""
 
-    @pytest.mark.asyncio
-    async def test_generate_stream_response_error_handling(self):
+    async def test_generate_stream_response_error_handling(
+        self,
+        agui_client,
+        monkeypatch,
+    ):
         """Test stream response error handling."""
-        adapter = AGUIDefaultAdapter()
+        adapter, _ = agui_client
 
         # Mock execution function that raises error
         async def mock_execution(
@@ -39,7 +82,8 @@ class TestAGUIEventStreaming:
             yield AgentResponse(status=RunStatus.Created)
             raise ValueError("Test error")
 
-        adapter._execution_func = mock_execution
+        # Swap the shared adapter's execution function for this test only
+        monkeypatch.setattr(adapter, "_execution_func", mock_execution)
 
         agui_request = RunAgentInput(
             threadId="thread_123",
@@ -51,70 +95,44 @@ class TestAGUIEventStreaming:
             messages=[UserMessage(id="msg_user", role="user", content="Test")],
         )
 
-        events = []
+        # Only the last event is checked, so keep just that one
+        last_event_str = None
+        event_count = 0
         async for event_data in adapter._generate_stream_response(
             agui_request,
         ):
-            events.append(event_data)
+            last_event_str = event_data
+            event_count += 1
 
         # Should have error event
-        assert len(events) > 0
+        assert event_count > 0
         # Last event should be error
-        last_event_str = events[-1]
-        json_str = last_event_str[6:-2]
+        assert last_event_str.startswith(_SSE_PREFIX)
+        json_str = last_event_str.removeprefix(_SSE_PREFIX).removesuffix(
+            _SSE_SUFFIX,
+        )
         last_event = json.loads(json_str)
         assert last_event["type"] == "RUN_ERROR"
         assert "Test error" in last_event["message"]
 
-    @pytest.mark.asyncio
-    async def test_handle_requests_with_invalid_request(self):
-        """Test handling of invalid AG-UI requests."""
-        adapter = AGUIDefaultAdapter()
-        app = FastAPI()
+    def test_invalid_request_fails_validation(self):
+        """Test that an invalid AG-UI payload is rejected by the schema."""
+        with pytest.raises(ValidationError):
+            FlexibleRunAgentInput.model_validate({"invalid": "data"})
 
-        async def mock_func(
-            request: AgentRequest,
-        ):  # pylint: disable=unused-argument
-            yield AgentResponse(status=RunStatus.Completed)
-
-        adapter.add_endpoint(app, mock_func)
-        client = TestClient(app)
+    async def test_handle_requests_with_invalid_request(self, agui_client):
+        """Test handling of invalid AG-UI requests."""
+        _, client = agui_client
 
         # Send invalid request data
-        response = client.post("/agui", json={"invalid": "data"})
+        response = await client.post("/ag-ui", json={"invalid": "data"})
 
         # Should return error status
         assert response.status_code >= 400
 
-    @pytest.mark.asyncio
-    async def test_agui_events(self):
+    async def test_agui_events(self, agui_client):
         """Test streaming text with multiple deltas."""
-        adapter = AGUIDefaultAdapter()
-        app = FastAPI()
-
-        async def mock_agent_execution(
-            request: AgentRequest,
-        ):  # pylint: disable=unused-argument
-            response_builder = ResponseBuilder(
-                session_id=request.session_id,
-            )
-
-            for event in response_builder.generate_streaming_response(
-                text_tokens=[
-                    "Hello",
-                    " there",
-                    "!",
-                    " How",
-                    " are",
-                    " you",
-                    "?",
-                ],
-                role="assistant",
-            ):
-                yield event
-
-        adapter.add_endpoint(app, mock_agent_execution)
-        client = TestClient(app)
+        _, client = agui_client
 
         request_data = {
             "threadId": "test_thread",
@@ -122,51 +140,61 @@ class TestAGUIEventStreaming:
             "messages": [{"id": "msg_1", "role": "user", "content": "Hi"}],
         }
 
-        response = client.post("/ag-ui", json=request_data)
-        assert response.status_code == 200
-
-        # Parse events
-        events = []
-        for line in response.text.strip().split("\n\n"):
-            if line.startswith("data: "):
-                event_data = json.loads(line[6:])
-                events.append(event_data)
+        # Check events in one pass as the response streams in
+        counts = Counter()
+        # event type -> (position, event) of its first occurrence
+        first_seen = {}
+        position = 0
+        text_deltas = []
+        message_ids = set()
+        async with client.stream(
+            "POST",
+            "/ag-ui",
+            json=request_data,
+        ) as response:
+            assert response.status_code == 200
+            async for line in response.aiter_lines():
+                if not line.startswith(_SSE_PREFIX):
+                    continue
+                event = json.loads(line.removeprefix(_SSE_PREFIX))
+                event_type = event["type"]
+                first_seen.setdefault(event_type, (position, event))
+                counts[event_type] += 1
+                position += 1
+                if event_type in (
+                    "TEXT_MESSAGE_START",
+                    "TEXT_MESSAGE_CONTENT",
+                ):
+                    if "messageId" in event:
+                        message_ids.add(event["messageId"])
+                    if event_type == "TEXT_MESSAGE_CONTENT" and (
+                        "delta" in event
+                    ):
+                        text_deltas.append(event["delta"])
 
         # Verify we received events
-        assert len(events) > 0, "Should receive at least one event"
-
-        # Extract event types
-        event_types = [event["type"] for event in events]
+        assert counts, "Should receive at least one event"
 
         # Verify expected event types in sequence
         assert (
-            "TEXT_MESSAGE_START" in event_types
-            or "TEXT_MESSAGE_CONTENT" in event_types
+            counts["TEXT_MESSAGE_START"] or counts["TEXT_MESSAGE_CONTENT"]
         ), "Should have text message events"
 
-        run_started_count = sum(
-            1 for e in events if e["type"] == "RUN_STARTED"
-        )
         assert (
-            run_started_count == 1
+            counts["RUN_STARTED"] == 1
         ), "Should have exactly one RUN_STARTED event"
-
-        run_finished_count = sum(
-            1 for e in events if e["type"] == "RUN_FINISHED"
-        )
         assert (
-            run_finished_count == 1
+            counts["RUN_FINISHED"] == 1
         ), "Should have exactly one RUN_FINISHED event"
 
         # Verify event sequence order
-        run_started_idx = event_types.index("RUN_STARTED")
-        run_finished_idx = event_types.index("RUN_FINISHED")
+        run_started_idx, run_started_event = first_seen["RUN_STARTED"]
+        run_finished_idx, run_finished_event = first_seen["RUN_FINISHED"]
         assert (
             run_started_idx < run_finished_idx
         ), "RUN_STARTED should come before RUN_FINISHED"
 
         # Verify thread_id and run_id are present in RUN_STARTED event
-        run_started_event = events[run_started_idx]
         assert (
             run_started_event["threadId"] == "test_thread"
         ), "RUN_STARTED should have correct threadId"
@@ -175,7 +203,6 @@ class TestAGUIEventStreaming:
         ), "RUN_STARTED should have correct runId"
 
         # Verify RUN_FINISHED event
-        run_finished_event = events[run_finished_idx]
         assert (
             run_finished_event["threadId"] == "test_thread"
         ), "RUN_FINISHED should have correct threadId"
@@ -183,34 +210,37 @@ class TestAGUIEventStreaming:
             run_finished_event["runId"] == "test_run"
         ), "RUN_FINISHED should have correct runId"
 
-        # Collect text deltas from TEXT_MESSAGE_CONTENT events
-        text_deltas = []
-        for event in events:
-            if event["type"] == "TEXT_MESSAGE_CONTENT" and "delta" in event:
-                text_deltas.append(event["delta"])
-
         # Verify we got text deltas
         assert len(text_deltas) > 0, "Should receive text content deltas"
 
         # Verify the complete text matches our input tokens
         complete_text = "".join(text_deltas)
-        expected_text = "Hello there! How are you?"
         assert (
-            complete_text == expected_text
-        ), f"Complete text should be '{expected_text}', got '{complete_text}'"
+            complete_text == EXPECTED_TEXT
+        ), f"Complete text should be '{EXPECTED_TEXT}', got '{complete_text}'"
 
         # Verify message_id consistency in text events
-        message_ids = set()
-        for event in events:
-            if event["type"] in ["TEXT_MESSAGE_START", "TEXT_MESSAGE_CONTENT"]:
-                if "messageId" in event:
-                    message_ids.add(event["messageId"])
-
         assert (
             len(message_ids) == 1
         ), "All text message events should have the same messageId"
 
 
+# Baseline request for the conversion tests; each test overrides only the
+# fields it checks via model_copy instead of re-validating a new model.
+_BASE_REQ = FlexibleRunAgentInput(
+    thread_id="test_thread",
+    run_id="test_run",
+    messages=[
+        UserMessage(id="msg_1", content="Hi"),
+    ],
+    state=None,
+    forwarded_props=None,
+    parent_run_id=None,
+    context=[],
+    tools=[],
+)
+
+
 class TestAGUIAdapterConversion:
     """Test AGUIAdapter conversion methods."""
 
@@ -231,17 +261,15 @@ class TestAGUIAdapterConversion:
             Context(description="Test context", value="Some context value"),
         ]
 
-        agui_request = FlexibleRunAgentInput(
-            thread_id="test_thread_123",
-            run_id="test_run_456",
-            messages=[
-                UserMessage(id="msg_1", content="Hello"),
-            ],
-            state=test_state,
-            forwarded_props=test_forwarded_props,
-            parent_run_id=test_parent_run_id,
-            context=test_context,
-            tools=[],
+        agui_request = _BASE_REQ.model_copy(
+            update={
+                "thread_id": "test_thread_123",
+                "run_id": "test_run_456",
+                "state": test_state,
+                "forwarded_props": test_forwarded_props,
+                "parent_run_id": test_parent_run_id,
+                "context": test_context,
+            },
         )
 
         agent_request = adapter.convert_agui_request_to_agent_request(
@@ -272,17 +300,8 @@ class TestAGUIAdapterConversion:
         )
 
         # Test with user_id in forwarded_props
-        agui_request = FlexibleRunAgentInput(
-            thread_id="test_thread",
-            run_id="test_run",
-            messages=[
-                UserMessage(id="msg_1", content="Test"),
-            ],
-            state=None,
-            forwarded_props={"user_id": "custom_user_123"},
-            parent_run_id=None,
-            context=[],
-            tools=[],
+        agui_request = _BASE_REQ.model_copy(
+            update={"forwarded_props": {"user_id": "custom_user_123"}},
         )
 
         agent_request = adapter.convert_agui_request_to_agent_request(